@@ -0,0 +1,206 @@
+"""Offline flight log analytics
+
+Computes per-flight metrics from logs written by FlightRecorder, in
+parallel over a process pool, and prints a summary table or CSV:
+
+    python analyze_logs.py logs/ --csv season.csv
+    python analyze_logs.py flight1.ddlog flight2.ddlog --jobs 8
+"""
+import argparse
+import csv
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from flight_log import FlightLog
+
+LOG_PATTERN = "*.ddlog"
+
+# Control inputs at or beyond this magnitude count as saturated
+SATURATION = 0.99
+
+# GPS fix types below this are a dropout (3 = 3D fix)
+GOOD_FIX = 3
+
+# (column, format) in output order
+COLUMNS = (
+    ("log", "{}"),
+    ("duration_s", "{:.1f}"),
+    ("time_in_air_s", "{:.1f}"),
+    ("max_altitude_m", "{:.1f}"),
+    ("max_speed_m_s", "{:.1f}"),
+    ("battery_used_pct", "{:.1f}"),
+    ("battery_drain_pct_per_min", "{:.2f}"),
+    ("roll_rms_deg", "{:.2f}"),
+    ("pitch_rms_deg", "{:.2f}"),
+    ("control_saturation_pct", "{:.1f}"),
+    ("gps_dropouts", "{}"),
+    ("gps_dropout_s", "{:.1f}"),
+    ("error", "{}"),
+)
+
+
+def _rows(log, name):
+    if name not in log.channels:
+        return None
+    rows = log.window(name)
+    return rows if len(rows) else None
+
+
+def _state_durations(t, active, t_end):
+    """Total time a sampled on/off state was on (each sample holds until the next one)"""
+    held = np.diff(np.append(t, t_end))
+    return float(held[active].sum())
+
+
+def time_in_air(log, t_end):
+    rows = _rows(log, "in_air")
+    if rows is None:
+        return 0.0
+    return _state_durations(rows[:, 0], rows[:, 1] > 0.5, t_end)
+
+
+def altitude_and_speed(log):
+    position = _rows(log, "position")
+    velocity = _rows(log, "velocity")
+    max_altitude = float(position[:, 3].max()) if position is not None else float("nan")
+    max_speed = float(np.hypot(velocity[:, 1], velocity[:, 2]).max()) if velocity is not None else float("nan")
+    return max_altitude, max_speed
+
+
+def battery_drain(log):
+    """(percent used, drain rate in %/min from a least-squares fit)"""
+    rows = _rows(log, "battery")
+    if rows is None or len(rows) < 2:
+        return float("nan"), float("nan")
+    t, remaining = rows[:, 0], rows[:, 1]
+    used = float(remaining[0] - remaining[-1])
+    if t[-1] - t[0] <= 0:
+        return used, float("nan")
+    slope = np.polyfit(t - t[0], remaining, 1)[0]
+    return used, float(-slope * 60.0)
+
+
+def attitude_rms(log):
+    rows = _rows(log, "attitude")
+    if rows is None:
+        return float("nan"), float("nan")
+    roll_rms, pitch_rms = np.sqrt(np.mean(np.square(rows[:, 1:3]), axis=0))
+    return float(roll_rms), float(pitch_rms)
+
+
+def control_saturation(log):
+    """Percent of streamed setpoints with any stick axis at full deflection"""
+    rows = _rows(log, "setpoint")
+    if rows is None:
+        return float("nan")
+    sticks = np.abs(rows[:, 1:5])
+    return float(100.0 * np.mean((sticks >= SATURATION).any(axis=1)))
+
+
+def gps_dropouts(log, t_end):
+    """(number of losses of a good fix, total seconds without one after the first good fix)"""
+    rows = _rows(log, "gps")
+    if rows is None:
+        return 0, 0.0
+    t, good = rows[:, 0], rows[:, 1] >= GOOD_FIX
+    first_good = np.argmax(good)
+    if not good[first_good]:
+        return 0, 0.0
+    t, good = t[first_good:], good[first_good:]
+    drops = int(np.count_nonzero(good[:-1] & ~good[1:]))
+    return drops, _state_durations(t, ~good, t_end)
+
+
+def analyze_log(path):
+    """All metrics of one flight log as a dict (an `error` entry instead if it cannot be read)"""
+    row = {"log": path, "error": ""}
+    try:
+        with FlightLog(path) as log:
+            t_start, t_end = log.time_range
+            row["duration_s"] = t_end - t_start
+            row["time_in_air_s"] = time_in_air(log, t_end)
+            row["max_altitude_m"], row["max_speed_m_s"] = altitude_and_speed(log)
+            row["battery_used_pct"], row["battery_drain_pct_per_min"] = battery_drain(log)
+            row["roll_rms_deg"], row["pitch_rms_deg"] = attitude_rms(log)
+            row["control_saturation_pct"] = control_saturation(log)
+            row["gps_dropouts"], row["gps_dropout_s"] = gps_dropouts(log, t_end)
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+    return row
+
+
+def find_logs(paths):
+    """Expand directories (recursively) into their flight logs"""
+    logs = []
+    for path in paths:
+        if os.path.isdir(path):
+            logs.extend(sorted(glob.glob(os.path.join(path, "**", LOG_PATTERN), recursive=True)))
+        else:
+            logs.append(path)
+    return logs
+
+
+def analyze_logs(paths, jobs=None):
+    """Analyze many logs on a process pool; rows come back in input order"""
+    if len(paths) <= 1 or jobs == 1:
+        return [analyze_log(path) for path in paths]
+    jobs = jobs or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(analyze_log, paths, chunksize=max(1, len(paths) // (4 * jobs))))
+
+
+def format_value(fmt, value):
+    if isinstance(value, float) and np.isnan(value):
+        return ""
+    return fmt.format(value)
+
+
+def write_csv(rows, f):
+    writer = csv.writer(f)
+    writer.writerow([name for name, _ in COLUMNS])
+    for row in rows:
+        writer.writerow([format_value(fmt, row.get(name, float("nan"))) for name, fmt in COLUMNS])
+
+
+def print_table(rows, f):
+    cells = [[name for name, _ in COLUMNS]]
+    cells += [[format_value(fmt, row.get(name, float("nan"))) for name, fmt in COLUMNS] for row in rows]
+    widths = [max(len(line[i]) for line in cells) for i in range(len(COLUMNS))]
+    for line in cells:
+        f.write("  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip() + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-flight metrics from recorded flight logs")
+    parser.add_argument("paths", nargs="+", help=f"flight logs, or directories searched for {LOG_PATTERN}")
+    parser.add_argument("--jobs", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--csv", metavar="PATH", help="write CSV here ('-' for stdout) instead of a table")
+    args = parser.parse_args()
+
+    logs = find_logs(args.paths)
+    if not logs:
+        raise SystemExit("no flight logs found")
+
+    start = time.perf_counter()
+    rows = analyze_logs(logs, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    if args.csv == "-":
+        write_csv(rows, sys.stdout)
+    elif args.csv:
+        with open(args.csv, "w", newline="") as f:
+            write_csv(rows, f)
+    else:
+        print_table(rows, sys.stdout)
+
+    failed = sum(1 for row in rows if row["error"])
+    print(f"Analyzed {len(rows)} logs in {elapsed:.2f}s ({failed} failed)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import math
+
+
+class AttitudeIndicator:
+    """Retained-mode attitude indicator
+
+    Every canvas item is created once and afterwards only moved with
+    `canvas.coords` / `canvas.itemconfig`. Calling `update()` with the same
+    roll and pitch (and an unchanged canvas size) does no canvas work at all.
+    """
+
+    # Pitch values to display (in degrees)
+    PITCH_ANGLES = (-30, -20, -10, 0, 10, 20, 30)
+
+    # Pitch scaling - pixels per degree of pitch
+    PITCH_SCALE = 2.5
+
+    def __init__(self, canvas, default_size=(400, 300)):
+        self.canvas = canvas
+        self.default_size = default_size
+        self.redraws = 0
+        self.skipped = 0
+
+        self._size = None
+        self._attitude = None
+        self._ladder = []
+
+        self._create_items()
+
+    def _create_items(self):
+        """Create every canvas item once, in z-order"""
+        canvas = self.canvas
+
+        # Background
+        self._background = canvas.create_rectangle(0, 0, 0, 0, fill="#0A0A0A", outline="")
+
+        # Sky and ground
+        self._sky = canvas.create_polygon(0, 0, 0, 0, 0, 0, fill="#1E3A8A", outline="")  # Dark blue sky
+        self._ground = canvas.create_polygon(0, 0, 0, 0, 0, 0, fill="#78350F", outline="")  # Brown ground
+        self._horizon = canvas.create_line(0, 0, 0, 0, fill="#FFFFFF", width=3)
+
+        # Pitch ladder lines and labels
+        for angle in self.PITCH_ANGLES:
+            if angle == 0:
+                line = canvas.create_line(0, 0, 0, 0, fill="#FFFFFF", width=3)  # White horizon
+                label = None
+            else:
+                line = canvas.create_line(0, 0, 0, 0, fill="#CCCCCC", width=1)  # Gray pitch lines
+                label = canvas.create_text(0, 0, text=str(abs(angle)) + "°",
+                                           fill="#CCCCCC", font=("Arial", 10))
+            self._ladder.append((angle, line, label))
+
+        # Fixed aircraft reference (always centered and level)
+        self._wings = canvas.create_rectangle(0, 0, 0, 0, fill="#EF4444", outline="#FFFFFF", width=2)  # Red wings
+        self._body = canvas.create_rectangle(0, 0, 0, 0, fill="#3B82F6", outline="#FFFFFF", width=1)  # Blue body
+        self._center_dot = canvas.create_oval(0, 0, 0, 0, fill="#F59E0B", outline="#FFFFFF", width=1)  # Amber center
+        self._cross_h = canvas.create_line(0, 0, 0, 0, fill="#10B981", width=2, dash=(4, 2))  # Green dashed
+        self._cross_v = canvas.create_line(0, 0, 0, 0, fill="#10B981", width=2, dash=(4, 2))
+
+    def _canvas_size(self):
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return self.default_size
+        return width, height
+
+    def update(self, roll, pitch):
+        """Move the horizon to the given roll/pitch (degrees); return True if anything was redrawn"""
+        size = self._canvas_size()
+        resized = size != self._size
+        if not resized and (roll, pitch) == self._attitude:
+            self.skipped += 1
+            return False
+
+        width, height = size
+        center_x = width // 2
+        center_y = height // 2
+
+        if resized:
+            self._size = size
+            self._layout_static(width, height, center_x, center_y)
+
+        # Convert roll to radians - IMPORTANT: Negative for correct visual rotation
+        roll_rad = -math.radians(roll)
+
+        # Positive pitch (nose up) moves horizon DOWN, negative pitch (nose down) moves horizon UP
+        horizon_offset = pitch * self.PITCH_SCALE
+
+        self._move_horizon(width, height, center_x, center_y, horizon_offset, roll_rad)
+        self._move_pitch_ladder(height, center_x, center_y, horizon_offset, roll_rad)
+
+        self._attitude = (roll, pitch)
+        self.redraws += 1
+        return True
+
+    def invalidate(self):
+        """Force the next `update` to redraw"""
+        self._size = None
+        self._attitude = None
+
+    def _layout_static(self, width, height, center_x, center_y):
+        """Position the background and the fixed aircraft (only on resize)"""
+        coords = self.canvas.coords
+        coords(self._background, 0, 0, width, height)
+
+        # Aircraft wings (horizontal)
+        wing_length = 60
+        wing_width = 6
+        coords(self._wings,
+               center_x - wing_length // 2, center_y - wing_width // 2,
+               center_x + wing_length // 2, center_y + wing_width // 2)
+
+        # Aircraft body (vertical)
+        body_length = 40
+        body_width = 8
+        coords(self._body,
+               center_x - body_width // 2, center_y - body_length // 2,
+               center_x + body_width // 2, center_y + body_length // 2)
+
+        # Center reference dot
+        coords(self._center_dot, center_x - 6, center_y - 6, center_x + 6, center_y + 6)
+
+        # Fixed reference cross (always straight)
+        cross_size = 25
+        coords(self._cross_h, center_x - cross_size, center_y, center_x + cross_size, center_y)
+        coords(self._cross_v, center_x, center_y - cross_size, center_x, center_y + cross_size)
+
+    def _move_horizon(self, width, height, center_x, center_y, horizon_offset, roll_rad):
+        """Move the rotated horizon line separating sky and ground"""
+        # Horizon line endpoints (very long line)
+        line_length = max(width, height) * 2
+        cos_r = math.cos(roll_rad)
+        sin_r = math.sin(roll_rad)
+
+        x1 = center_x - line_length * cos_r
+        y1 = center_y + horizon_offset - line_length * sin_r
+        x2 = center_x + line_length * cos_r
+        y2 = center_y + horizon_offset + line_length * sin_r
+
+        coords = self.canvas.coords
+        coords(self._sky, 0, 0, width, 0, x2, y2, x1, y1)
+        coords(self._ground, x1, y1, x2, y2, width, height, 0, height)
+        coords(self._horizon, x1, y1, x2, y2)
+
+    def _move_pitch_ladder(self, height, center_x, center_y, horizon_offset, roll_rad):
+        """Move pitch reference lines and their labels"""
+        canvas = self.canvas
+        cos_r = math.cos(roll_rad)
+        sin_r = math.sin(roll_rad)
+        label_angle = math.degrees(roll_rad)  # Rotate text with horizon
+
+        for angle, line, label in self._ladder:
+            line_center_y = center_y + horizon_offset + angle * self.PITCH_SCALE
+            line_length = 120 if angle == 0 else 80
+
+            canvas.coords(line,
+                          center_x - line_length * cos_r, line_center_y - line_length * sin_r,
+                          center_x + line_length * cos_r, line_center_y + line_length * sin_r)
+
+            if label is None:
+                continue
+
+            label_offset = 20
+            label_x = center_x + (line_length + label_offset) * cos_r
+            label_y = line_center_y + (line_length + label_offset) * sin_r
+
+            # Only show label if it's visible
+            if 0 <= label_y <= height:
+                canvas.coords(label, label_x, label_y)
+                canvas.itemconfigure(label, angle=label_angle, state="normal")
+            else:
+                canvas.itemconfigure(label, state="hidden")
@@ -0,0 +1,204 @@
+import math
+from collections import OrderedDict
+
+from PIL import Image, ImageDraw, ImageFont
+
+from attitude_indicator import AttitudeIndicator
+
+SKY = (30, 58, 138)
+GROUND = (120, 53, 15)
+LADDER = (204, 204, 204)
+WHITE = (255, 255, 255)
+
+
+def _load_font(size):
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+class FrameCache:
+    """LRU cache of rendered frames with a byte budget and hit/miss counters"""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._frames = OrderedDict()
+
+    def __len__(self):
+        return len(self._frames)
+
+    def get(self, key):
+        frame = self._frames.get(key)
+        if frame is None:
+            self.misses += 1
+            return None
+        self._frames.move_to_end(key)
+        self.hits += 1
+        return frame[0]
+
+    def put(self, key, value, nbytes):
+        if key in self._frames:
+            self.bytes -= self._frames.pop(key)[1]
+        self._frames[key] = (value, nbytes)
+        self.bytes += nbytes
+        while self.bytes > self.max_bytes and len(self._frames) > 1:
+            _, (_, evicted) = self._frames.popitem(last=False)
+            self.bytes -= evicted
+            self.evictions += 1
+
+    def clear(self):
+        self._frames.clear()
+        self.bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._frames),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class RasterAttitudeIndicator:
+    """Attitude indicator composited into one PIL image per (quantized) attitude
+
+    Sky, ground, pitch ladder and labels are drawn unrotated on an oversized
+    layer, then rotated by roll and cropped in one affine resample; the fixed
+    aircraft symbol is pasted on top. Frames are cached on
+    `(size, roll, pitch)` quantized to `step` degrees, so a cache hit costs a
+    single `itemconfigure(image=...)` on the canvas. Same interface as
+    AttitudeIndicator.
+
+    `photo_factory` turns a PIL image into something the canvas accepts
+    (`ImageTk.PhotoImage` by default; the benchmark passes the image through).
+    """
+
+    PITCH_ANGLES = AttitudeIndicator.PITCH_ANGLES
+    PITCH_SCALE = AttitudeIndicator.PITCH_SCALE
+
+    def __init__(self, canvas, default_size=(400, 300), step=0.5, max_cache_bytes=64 * 1024 * 1024,
+                 photo_factory=None):
+        if photo_factory is None:
+            from PIL import ImageTk
+            photo_factory = ImageTk.PhotoImage
+        self.canvas = canvas
+        self.default_size = default_size
+        self.step = step
+        self.photo_factory = photo_factory
+        self.cache = FrameCache(max_cache_bytes)
+        self.redraws = 0
+        self.skipped = 0
+        self.renders = 0
+
+        self._key = None
+        self._overlay = None
+        self._font = _load_font(10)
+        self._image = canvas.create_image(0, 0, anchor="nw")
+
+    def _canvas_size(self):
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return self.default_size
+        return width, height
+
+    def update(self, roll, pitch):
+        """Show the frame for roll/pitch (degrees); return True if the displayed image changed"""
+        size = self._canvas_size()
+        key = (size, round(roll / self.step), round(pitch / self.step))
+        if key == self._key:
+            self.skipped += 1
+            return False
+
+        photo = self.cache.get(key)
+        if photo is None:
+            image = self.render_frame(size, key[1] * self.step, key[2] * self.step)
+            photo = self.photo_factory(image)
+            self.cache.put(key, photo, size[0] * size[1] * 4)
+            self.renders += 1
+
+        self.canvas.itemconfigure(self._image, image=photo)
+        self._key = key
+        self.redraws += 1
+        return True
+
+    def invalidate(self):
+        """Force the next `update` to redraw"""
+        self._key = None
+
+    def stats(self):
+        stats = self.cache.stats()
+        stats.update(redraws=self.redraws, skipped=self.skipped, renders=self.renders)
+        return stats
+
+    def render_frame(self, size, roll, pitch):
+        """Render one complete indicator frame as an RGB image"""
+        width, height = size
+        center_x = width // 2
+        center_y = height // 2
+        horizon_offset = pitch * self.PITCH_SCALE
+
+        # Unrotated world layer, large enough to cover the canvas at any roll
+        side = int(math.ceil(math.hypot(width, height))) + 2 * int(abs(horizon_offset)) + 2
+        world = Image.new("RGB", (side, side), SKY)
+        draw = ImageDraw.Draw(world)
+        mid = side // 2
+        horizon_y = mid + horizon_offset
+        draw.rectangle((0, horizon_y, side, side), fill=GROUND)
+        draw.line((0, horizon_y, side, horizon_y), fill=WHITE, width=3)
+
+        for angle in self.PITCH_ANGLES:
+            line_y = horizon_y + angle * self.PITCH_SCALE
+            if angle == 0:
+                draw.line((mid - 120, line_y, mid + 120, line_y), fill=WHITE, width=3)
+                continue
+            draw.line((mid - 80, line_y, mid + 80, line_y), fill=LADDER, width=1)
+            draw.text((mid + 100, line_y), f"{abs(angle)}°", fill=LADDER, font=self._font, anchor="mm")
+
+        # Rotate about the horizon centre (positive roll tilts the horizon counter-clockwise)
+        # and crop in one affine resample that only computes the visible pixels
+        angle = math.radians(roll)
+        cos_r = math.cos(angle)
+        sin_r = math.sin(angle)
+        pivot_x = center_x
+        pivot_y = center_y + horizon_offset
+        frame = world.transform(size, Image.AFFINE, (
+            cos_r, -sin_r, mid - cos_r * pivot_x + sin_r * pivot_y,
+            sin_r, cos_r, horizon_y - sin_r * pivot_x - cos_r * pivot_y,
+        ), resample=Image.BILINEAR)
+
+        if self._overlay is None or self._overlay.size != size:
+            self._overlay = self._render_overlay(width, height)
+        frame.paste(self._overlay, (0, 0), self._overlay)
+        return frame
+
+    def _render_overlay(self, width, height):
+        """Fixed aircraft reference, drawn once per canvas size"""
+        overlay = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+        center_x = width // 2
+        center_y = height // 2
+
+        draw.rectangle((center_x - 30, center_y - 3, center_x + 30, center_y + 3),
+                       fill="#EF4444", outline="#FFFFFF", width=2)  # Red wings
+        draw.rectangle((center_x - 4, center_y - 20, center_x + 4, center_y + 20),
+                       fill="#3B82F6", outline="#FFFFFF", width=1)  # Blue body
+        draw.ellipse((center_x - 6, center_y - 6, center_x + 6, center_y + 6),
+                     fill="#F59E0B", outline="#FFFFFF", width=1)  # Amber center
+
+        # Green dashed reference cross
+        for offset in range(-25, 25, 6):
+            draw.line((center_x + offset, center_y, center_x + min(offset + 4, 25), center_y),
+                      fill="#10B981", width=2)
+            draw.line((center_x, center_y + offset, center_x, center_y + min(offset + 4, 25)),
+                      fill="#10B981", width=2)
+        return overlay
@@ -0,0 +1,119 @@
+"""Attitude indicator benchmark: canvas-vector vs cached PIL raster backend
+
+Feeds both backends the same synthetic roll/pitch trajectory and prints
+machine-readable JSON with per-update cost, canvas operations and cache
+behaviour:
+
+    python bench_attitude.py --frames 5000 --step 0.5 --output attitude.json
+
+Without `--tk` the backends draw into a null canvas, which measures their
+Python-side cost only; `--tk` uses a real Tk canvas (needs a display) so the
+Tk work (item moves vs. one image swap) is included.
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import time
+
+from attitude_indicator import AttitudeIndicator
+from attitude_raster import RasterAttitudeIndicator
+from bench_telemetry import NullCanvas, _percentiles
+
+
+def trajectory(frames, rate_hz=60.0, noise_deg=0.3, seed=1):
+    """Slow manoeuvres plus sensor noise, sampled at the UI frame rate"""
+    rng = random.Random(seed)
+    points = []
+    for i in range(frames):
+        t = i / rate_hz
+        roll = 25.0 * math.sin(0.4 * t) + rng.gauss(0.0, noise_deg)
+        pitch = 10.0 * math.sin(0.25 * t + 1.0) + rng.gauss(0.0, noise_deg)
+        points.append((roll, pitch))
+    return points
+
+
+def run_backend(name, make_indicator, canvas, points, root=None):
+    indicator = make_indicator(canvas)
+    ops_before = getattr(canvas, "ops", 0)
+    timings = []
+    start = time.perf_counter()
+    for roll, pitch in points:
+        t0 = time.perf_counter()
+        indicator.update(roll, pitch)
+        if root is not None:
+            root.update_idletasks()
+        timings.append(time.perf_counter() - t0)
+    wall = time.perf_counter() - start
+    result = {
+        "backend": name,
+        "frames": len(points),
+        "updates_per_s": len(points) / wall,
+        "update_ms": _percentiles(timings),
+        "redraws": indicator.redraws,
+        "skipped": indicator.skipped,
+    }
+    if hasattr(canvas, "ops"):
+        result["canvas_ops_per_update"] = (canvas.ops - ops_before) / len(points)
+    if hasattr(indicator, "stats"):
+        result["cache"] = indicator.stats()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Canvas vs raster attitude indicator benchmark")
+    parser.add_argument("--frames", type=int, default=3000, help="updates per backend (default: 3000)")
+    parser.add_argument("--step", type=float, default=0.5, help="raster quantization in degrees (default: 0.5)")
+    parser.add_argument("--cache-mb", type=float, default=64, help="raster cache budget (default: 64)")
+    parser.add_argument("--tk", action="store_true", help="draw into a real Tk canvas (needs a display)")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    points = trajectory(args.frames)
+    cache_bytes = int(args.cache_mb * 1024 * 1024)
+
+    root = None
+    if args.tk:
+        import tkinter as tk
+        root = tk.Tk()
+        make_canvas = lambda: tk.Canvas(root, width=400, height=300)
+        photo_factory = None
+    else:
+        make_canvas = NullCanvas
+        photo_factory = lambda image: image
+
+    backends = [
+        ("canvas", lambda canvas: AttitudeIndicator(canvas)),
+        ("raster", lambda canvas: RasterAttitudeIndicator(canvas, step=args.step, max_cache_bytes=cache_bytes,
+                                                          photo_factory=photo_factory)),
+    ]
+    results = []
+    for name, make_indicator in backends:
+        canvas = make_canvas()
+        if root is not None:
+            canvas.pack()
+        results.append(run_backend(name, make_indicator, canvas, points, root))
+        if root is not None:
+            canvas.destroy()
+    if root is not None:
+        root.destroy()
+
+    report = {
+        "benchmark": "attitude",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "tk": args.tk,
+        "step_deg": args.step,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Control shaping microbenchmark: cost of turning stick values into one setpoint
+
+Times the shaping pipeline against the old fixed-gain mapping on the same
+synthetic stick trajectory and prints machine-readable JSON with the
+per-setpoint cost in microseconds and the share of the setpoint period it
+uses:
+
+    python bench_controls.py --setpoints 100000 --output controls.json
+
+Variants:
+    fixed     - the old pitch*3 / roll*3 / -throttle*2 / yaw*60 mapping
+    shaper    - expo lookup, battery cap and slew limiting, no envelope
+    envelope  - the same plus altitude ceiling and geofence, with the vehicle
+                near both limits and on a low battery so every stage clamps
+    setpoint  - DroneController.build_setpoint end to end (shaper plus the
+                VelocityBodyYawspeed the streamer sends)
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import time
+
+from bench_telemetry import _percentiles
+from control_shaping import ControlShaper
+from telemetry_snapshot import TelemetrySnapshot
+
+HOME = (47.3977, 8.5456)
+
+
+def stick_trajectory(count, rate_hz=20.0, seed=1):
+    """Stick sweeps with small jitter and occasional full deflection steps, at the setpoint rate"""
+    rng = random.Random(seed)
+    values = []
+    for i in range(count):
+        t = i / rate_hz
+        axes = [0.6 * math.sin(0.3 * t), 0.4 * math.sin(0.5 * t + 1.0),
+                0.8 * math.sin(0.2 * t + 2.0), 0.8 * math.sin(0.35 * t + 3.0)]
+        if rng.random() < 0.02:
+            axes[rng.randrange(4)] = rng.choice((-1.0, 1.0))
+        values.append(tuple(max(-1.0, min(1.0, v + rng.gauss(0.0, 0.01))) for v in axes))
+    return values
+
+
+def fixed_mapping(values, snapshot):
+    throttle, yaw, pitch, roll = values
+    return (pitch * 3.0, roll * 3.0, -throttle * 2.0, yaw * 60.0)
+
+
+def run_variant(name, shape, points, snapshot, period):
+    # Warm up, then time every call and, separately, a tight loop (no timer overhead)
+    for values in points[:1000]:
+        shape(values, snapshot)
+    timings = []
+    for values in points:
+        t0 = time.perf_counter()
+        shape(values, snapshot)
+        timings.append(time.perf_counter() - t0)
+    start = time.perf_counter()
+    for values in points:
+        shape(values, snapshot)
+    mean = (time.perf_counter() - start) / len(points)
+    cost = {key: 1000.0 * value for key, value in _percentiles(timings).items()}
+    return {
+        "variant": name,
+        "setpoints": len(points),
+        "mean_us": 1e6 * mean,
+        "cost_us": cost,
+        "p99_share_of_period": cost["p99"] / (1e6 * period),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Control shaping per-setpoint cost benchmark")
+    parser.add_argument("--setpoints", type=int, default=50000, help="setpoints per variant (default: 50000)")
+    parser.add_argument("--rate", type=float, default=20.0, help="setpoint stream rate in Hz (default: 20)")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    points = stick_trajectory(args.setpoints, args.rate)
+    period = 1.0 / args.rate
+    cruising = TelemetrySnapshot(position=(HOME[0], HOME[1], 10.0), attitude=(0.0, 0.0, 30.0), battery=80.0)
+    # ~98 m north-east of home at 49.5 m: just inside a 100 m fence and under a 50 m ceiling
+    edge = TelemetrySnapshot(position=(HOME[0] + 0.00062, HOME[1] + 0.00093, 49.5), attitude=(0.0, 0.0, 45.0),
+                             battery=18.0)
+
+    def simulated_clock():
+        # Advance one setpoint period per call so slew limiting sees the real stream rate
+        ticks = iter(range(10 ** 12))
+        return lambda: next(ticks) * period
+
+    def shaper_variant(**options):
+        shaper = ControlShaper(**options)
+        shaper.set_home(*HOME)
+        clock = simulated_clock()
+        return shaper, lambda values, snapshot: shaper.shape(values, snapshot, clock())
+
+    results = [run_variant("fixed", fixed_mapping, points, cruising, period)]
+
+    shaper, shape = shaper_variant()
+    results.append(run_variant("shaper", shape, points, cruising, period))
+    results[-1]["stats"] = shaper.stats()
+
+    shaper, shape = shaper_variant(max_altitude_m=50.0, geofence_radius_m=100.0)
+    results.append(run_variant("envelope", shape, points, edge, period))
+    results[-1]["stats"] = shaper.stats()
+
+    try:
+        from drone_controller import DroneController
+        from fake_mavsdk import FakeSystem
+    except ImportError as e:
+        results.append({"variant": "setpoint", "skipped": str(e)})
+    else:
+        controller = DroneController(system=FakeSystem())
+        controller.snapshot = cruising
+
+        def build(values, snapshot):
+            controller.controls.set(*values)
+            return controller.build_setpoint()
+
+        results.append(run_variant("setpoint", build, points, cruising, period))
+
+    report = {
+        "benchmark": "controls",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "rate_hz": args.rate,
+        "period_us": 1e6 * period,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""Headless telemetry benchmark
+
+Runs DroneController against a synthetic MAVSDK stand-in (fake_mavsdk) and
+DroneDashboard's real render path against a no-Tk render target, and prints
+machine-readable JSON:
+
+    python bench_telemetry.py --hz 10 100 1000 5000 --duration 5 --output bench.json
+"""
+import argparse
+import asyncio
+import gc
+import heapq
+import itertools
+import json
+import platform
+import queue
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+
+from attitude_indicator import AttitudeIndicator
+from dashboard import DroneDashboard
+from drone_controller import DroneController
+from fake_mavsdk import DEFAULT_RATES, FakeSystem
+from latency_monitor import LatencyMonitor
+from log_config import setup_logging, shutdown_logging
+from map_view import MapView
+from telemetry_plot import TelemetryPlot
+from widget_binding import WidgetBinder
+
+# Streams whose rate follows --hz; the rest keep their DEFAULT_RATES
+FAST_STREAMS = ("attitude_euler", "position", "velocity_ned")
+
+
+class NullWidget:
+    """Render target standing in for a CTk label"""
+
+    def __init__(self):
+        self.configures = 0
+
+    def configure(self, **options):
+        self.configures += 1
+
+
+class NullCanvas:
+    """Render target standing in for a Tk canvas"""
+
+    def __init__(self, width=400, height=300):
+        self.width = width
+        self.height = height
+        self.items = 0
+        self.ops = 0
+
+    def _create(self, *args, **kwargs):
+        self.items += 1
+        self.ops += 1
+        return self.items
+
+    create_rectangle = create_polygon = create_line = create_text = create_oval = create_image = _create
+
+    def coords(self, item, *args):
+        self.ops += 1
+
+    def itemconfigure(self, item, **options):
+        self.ops += 1
+
+    def delete(self, *items):
+        self.ops += 1
+
+    def tag_raise(self, item):
+        self.ops += 1
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+
+class VirtualRoot:
+    """Minimal Tk root: `after` timers plus thread-safe `event_generate`, run by `run()`"""
+
+    def __init__(self):
+        self._timers = []
+        self._cancelled = set()
+        self._ids = itertools.count(1)
+        self._bindings = {}
+        self._events = queue.SimpleQueue()
+
+    def after(self, delay_ms, callback):
+        timer_id = next(self._ids)
+        heapq.heappush(self._timers, (time.monotonic() + delay_ms / 1000.0, timer_id, callback))
+        return timer_id
+
+    def after_idle(self, callback, *args):
+        return self.after(0, lambda: callback(*args))
+
+    def after_cancel(self, timer_id):
+        self._cancelled.add(timer_id)
+
+    def bind(self, sequence, handler):
+        self._bindings[sequence] = handler
+
+    def event_generate(self, sequence, when=None):
+        self._events.put(sequence)
+
+    def run(self, duration):
+        end = time.monotonic() + duration
+        while True:
+            now = time.monotonic()
+            if now >= end:
+                return
+            next_due = self._timers[0][0] if self._timers else end
+            try:
+                sequence = self._events.get(timeout=max(0.0, min(next_due, end) - now))
+                handler = self._bindings.get(sequence)
+                if handler is not None:
+                    handler(None)
+            except queue.Empty:
+                pass
+            while self._timers and self._timers[0][0] <= time.monotonic():
+                _, timer_id, callback = heapq.heappop(self._timers)
+                if timer_id in self._cancelled:
+                    self._cancelled.discard(timer_id)
+                    continue
+                callback()
+
+
+class HeadlessDashboard(DroneDashboard):
+    """DroneDashboard with its render path bound to null widgets instead of CTk"""
+
+    def __init__(self, root, drone_controller, max_fps=60, idle_fps=2):
+        self.root = root
+        self.drone = drone_controller
+        self.colors = dict(self.COLORS)
+        self.bindings = WidgetBinder()
+        self.card_values = {name: NullWidget() for name in ("connection", "armed", "flight", "gps", "link")}
+        for name in ("status_label", "lat_label", "lon_label", "alt_label",
+                     "roll_label", "pitch_label", "yaw_label", "battery_label", "link_detail_label"):
+            setattr(self, name, NullWidget())
+        self.latency = LatencyMonitor()
+        self.show_latency = False
+        self.canvas = NullCanvas()
+        self.attitude_indicator = AttitudeIndicator(self.canvas)
+        self.plot_canvas = NullCanvas(600, 400)
+        self.telemetry_plot = TelemetryPlot(self.plot_canvas)
+        self.map_view = MapView(NullCanvas(300, 300))
+        self.attach_history_views()
+        self.latencies = []
+        self.create_scheduler(max_fps, idle_fps)
+        self.scheduler.start()
+
+    def render_attitude(self, snapshot):
+        super().render_attitude(snapshot)
+        self.latencies.append(time.monotonic() - snapshot.timestamp)
+
+
+def _percentiles(samples):
+    if len(samples) < 2:
+        value = 1000.0 * samples[0] if samples else 0.0
+        return {"p50": value, "p95": value, "p99": value, "max": value}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50": 1000.0 * cuts[49],
+        "p95": 1000.0 * cuts[94],
+        "p99": 1000.0 * cuts[98],
+        "max": 1000.0 * max(samples),
+    }
+
+
+def run_scenario(rates, duration, max_fps, trace_allocs=False):
+    """Run controller + headless dashboard for `duration` seconds and return the metrics"""
+    system = FakeSystem(rates)
+    controller = DroneController(system=system)
+    root = VirtualRoot()
+    dashboard = HeadlessDashboard(root, controller, max_fps=max_fps)
+
+    loop = asyncio.new_event_loop()
+    controller.loop = loop
+
+    def run_loop():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(controller.connect())
+        loop.run_forever()
+
+    thread = threading.Thread(target=run_loop, name="bench-asyncio", daemon=True)
+    thread.start()
+
+    # Let the connection and stream tasks come up before measuring
+    while not controller.connected:
+        time.sleep(0.01)
+    time.sleep(0.2)
+
+    if trace_allocs:
+        tracemalloc.start()
+    samples_before = sum(stats.samples for stats in controller.telemetry.stats.values())
+    snapshots_before = controller.snapshot.seq
+    setpoints_before = system.offboard.setpoints
+    gc_before = gc.get_stats()[0]["collections"]
+    blocks_before = sys.getallocatedblocks()
+    dashboard.latencies.clear()
+    dashboard.latency.reset()
+    dashboard.bindings.reset_stats()
+    frames_before = dashboard.scheduler.frames
+    canvas_ops_before = dashboard.canvas.ops
+    cpu_before = time.process_time()
+    wall_before = time.perf_counter()
+
+    root.run(duration)
+
+    wall = time.perf_counter() - wall_before
+    cpu = time.process_time() - cpu_before
+    samples = sum(stats.samples for stats in controller.telemetry.stats.values()) - samples_before
+    blocks_delta = sys.getallocatedblocks() - blocks_before
+    result = {
+        "rates_hz": dict(system.rates),
+        "duration_s": wall,
+        "samples_per_s": samples / wall,
+        "snapshots_per_s": (controller.snapshot.seq - snapshots_before) / wall,
+        "frames_per_s": (dashboard.scheduler.frames - frames_before) / wall,
+        "attitude_renders_per_s": len(dashboard.latencies) / wall,
+        "sample_to_pixel_ms": _percentiles(dashboard.latencies),
+        "latency": dashboard.latency.export(),
+        "cpu_percent": 100.0 * cpu / wall,
+        "gc_gen0_collections_per_s": (gc.get_stats()[0]["collections"] - gc_before) / wall,
+        "allocated_blocks_delta": blocks_delta,
+        # Allocation rate: net interpreter memory blocks allocated per second of the run
+        "allocated_blocks_per_s": blocks_delta / wall,
+        "widget_updates": dashboard.bindings.stats(),
+        "canvas_ops_per_s": (dashboard.canvas.ops - canvas_ops_before) / wall,
+        "setpoints_per_s": (system.offboard.setpoints - setpoints_before) / wall,
+    }
+    if trace_allocs:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["traced_memory_bytes"] = {"current": current, "peak": peak}
+
+    dashboard.scheduler.stop()
+    asyncio.run_coroutine_threadsafe(controller.link.stop(), loop).result(timeout=5)
+    asyncio.run_coroutine_threadsafe(controller.telemetry.stop(), loop).result(timeout=5)
+    asyncio.run_coroutine_threadsafe(controller.setpoint_streamer.stop(), loop).result(timeout=5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    return result
+
+
+def parse_rate_overrides(values):
+    rates = {}
+    for value in values or ():
+        name, _, hz = value.partition("=")
+        if name not in DEFAULT_RATES or not hz:
+            raise SystemExit(f"bad --rate {value!r}, expected one of {sorted(DEFAULT_RATES)}=HZ")
+        rates[name] = float(hz)
+    return rates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless DroneController/DroneDashboard benchmark")
+    parser.add_argument("--hz", type=float, nargs="+", default=[10, 100, 1000],
+                        help=f"rates to sweep for {', '.join(FAST_STREAMS)} (default: 10 100 1000)")
+    parser.add_argument("--rate", action="append", metavar="STREAM=HZ",
+                        help="override the rate of one stream in every scenario")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per scenario (default: 5)")
+    parser.add_argument("--max-fps", type=int, default=60, help="dashboard frame cap (default: 60)")
+    parser.add_argument("--trace-allocs", action="store_true", help="also report tracemalloc memory (slow)")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    overrides = parse_rate_overrides(args.rate)
+    scenarios = []
+    # Logging goes to stderr, so stdout stays machine-readable
+    setup_logging("WARNING")
+    for hz in args.hz:
+        rates = {name: hz for name in FAST_STREAMS}
+        rates.update(overrides)
+        scenarios.append(run_scenario(rates, args.duration, args.max_fps, args.trace_allocs))
+    shutdown_logging()
+
+    report = {
+        "benchmark": "telemetry",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "max_fps": args.max_fps,
+        "scenarios": scenarios,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+log = logging.getLogger(__name__)
+
+# Priority lanes (lower runs first)
+PRIORITY_SAFETY = 0
+PRIORITY_FLIGHT = 1
+PRIORITY_NORMAL = 2
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+TIMED_OUT = "timed out"
+
+
+class Command:
+    """One submitted action and its result future"""
+
+    __slots__ = ("name", "factory", "priority", "timeout", "supersedes", "future", "task", "state",
+                 "submitted", "started", "finished")
+
+    def __init__(self, name, factory, priority, timeout, supersedes, future):
+        self.name = name
+        self.factory = factory
+        self.priority = priority
+        self.timeout = timeout
+        self.supersedes = frozenset(supersedes)
+        self.future = future
+        self.task = None
+        self.state = QUEUED
+        self.submitted = time.monotonic()
+        self.started = None
+        self.finished = None
+
+
+class CommandScheduler:
+    """Runs vehicle actions one at a time in priority order (asyncio thread)
+
+    - Submitting an action that is already queued or running returns the
+      existing future instead of starting a second copy (double clicks).
+    - A new command cancels queued or running commands named in its
+      `supersedes` (LAND drops a pending TAKEOFF), and a safety-lane command
+      also preempts whatever lower-priority command is running.
+    - Every command runs under its own timeout; the future resolves with the
+      action's return value, asyncio.TimeoutError, the action's exception, or is
+      cancelled.
+    """
+
+    def __init__(self):
+        self.submitted = 0
+        self.deduplicated = 0
+        self.cancelled = 0
+        self.timed_out = 0
+        self.completed = 0
+        self.failed = 0
+        self.listeners = []
+        self._queue = []
+        self._order = itertools.count()
+        self._running = None
+        self._worker = None
+
+    def submit(self, name, factory, priority=PRIORITY_NORMAL, timeout=10.0, supersedes=()):
+        """Queue `factory()` (a coroutine function) and return its result future"""
+        existing = self.find(name)
+        if existing is not None:
+            self.deduplicated += 1
+            log.info("⏳ %s already %s, not queued again", name, existing.state)
+            return existing.future
+
+        loop = asyncio.get_running_loop()
+        command = Command(name, factory, priority, timeout, supersedes, loop.create_future())
+        command.future.add_done_callback(lambda future: self._on_future_done(command))
+        self.submitted += 1
+
+        for queued in [queued for _, _, queued in self._queue if queued.name in command.supersedes]:
+            self._cancel(queued, f"superseded by {name}")
+        running = self._running
+        if running is not None and (running.name in command.supersedes or
+                                    (priority == PRIORITY_SAFETY and running.priority > priority)):
+            self._cancel(running, f"preempted by {name}")
+
+        heapq.heappush(self._queue, (priority, next(self._order), command))
+        self._notify(command)
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._work(), name="commands")
+        return command.future
+
+    def find(self, name):
+        """The queued or running command called `name`, if any"""
+        if self._running is not None and self._running.name == name and not self._running.future.done():
+            return self._running
+        for _, _, command in self._queue:
+            if command.name == name and not command.future.done():
+                return command
+        return None
+
+    def cancel(self, name):
+        """Cancel a queued or running command; returns True if there was one"""
+        command = self.find(name)
+        if command is None:
+            return False
+        self._cancel(command, "cancelled")
+        return True
+
+    def pending(self):
+        """Names of the running command (first) and the queued ones, in run order"""
+        names = [self._running.name] if self._running is not None else []
+        names += [command.name for _, _, command in sorted(self._queue) if not command.future.done()]
+        return names
+
+    def stats(self):
+        return {
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "timed_out": self.timed_out,
+            "pending": self.pending(),
+        }
+
+    async def stop(self):
+        for _, _, command in self._queue:
+            command.future.cancel()
+        if self._running is not None:
+            self._cancel(self._running, "scheduler stopped")
+        if self._worker is not None:
+            await asyncio.gather(self._worker, return_exceptions=True)
+
+    def _cancel(self, command, reason):
+        if command.future.done():
+            return
+        log.warning("⛔ %s %s", command.name, reason)
+        command.future.cancel(reason)
+
+    def _on_future_done(self, command):
+        if not command.future.cancelled():
+            # Retrieved here so failures nobody awaited are not reported twice
+            command.future.exception()
+            return
+        # Cancelling the future (from here or by a caller) stops the running action
+        if command.task is not None:
+            command.task.cancel()
+        if command.state in (QUEUED, RUNNING):
+            command.state = CANCELLED
+            command.finished = time.monotonic()
+            self.cancelled += 1
+            self._notify(command)
+
+    def _notify(self, command):
+        for listener in tuple(self.listeners):
+            try:
+                listener(command)
+            except Exception as e:
+                log.error("Command listener failed: %s", e)
+
+    async def _work(self):
+        while self._queue:
+            _, _, command = heapq.heappop(self._queue)
+            if command.future.done():
+                continue
+            self._running = command
+            command.state = RUNNING
+            command.started = time.monotonic()
+            self._notify(command)
+            command.task = asyncio.create_task(asyncio.wait_for(command.factory(), command.timeout),
+                                               name=f"command:{command.name}")
+            await asyncio.wait([command.task])
+            self._running = None
+            self._finish(command)
+
+    def _finish(self, command):
+        task = command.task
+        if command.state == CANCELLED or task.cancelled():
+            if not command.future.done():
+                command.future.cancel()
+            return
+        command.finished = time.monotonic()
+        error = task.exception()
+        # asyncio.TimeoutError is the builtin TimeoutError only from Python 3.11
+        if isinstance(error, asyncio.TimeoutError):
+            command.state = TIMED_OUT
+            self.timed_out += 1
+            log.error("⏱️ %s timed out after %gs", command.name, command.timeout)
+            command.future.set_exception(
+                asyncio.TimeoutError(f"{command.name} timed out after {command.timeout:g}s"))
+        elif error is not None:
+            command.state = FAILED
+            self.failed += 1
+            log.error("❌ %s failed: %s", command.name, error)
+            command.future.set_exception(error)
+        else:
+            command.state = DONE
+            self.completed += 1
+            command.future.set_result(task.result())
+        self._notify(command)
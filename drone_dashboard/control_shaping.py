@@ -0,0 +1,171 @@
+import math
+import time
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371000.0
+
+# ControlState.values is (throttle, yaw, pitch, roll); the shaper works on
+# (pitch, roll, throttle, yaw) so the output is (forward, right, up, yaw rate)
+OUTPUT_AXES = ("forward_m_s", "right_m_s", "up_m_s", "yawspeed_deg_s")
+# Output magnitudes below these count as "no input"
+ACTIVE_THRESHOLD = np.array([0.1, 0.1, 0.1, 1.0])
+
+
+def expo_table(expo, size):
+    """Stick curve sampled at `size` points over -1..1: (1 - expo)·x + expo·x³"""
+    x = np.linspace(-1.0, 1.0, size)
+    return (1.0 - expo) * x + expo * x ** 3
+
+
+def active_axes(setpoint):
+    """True if any axis of a shaped setpoint is above ACTIVE_THRESHOLD"""
+    return bool((np.abs(setpoint) > ACTIVE_THRESHOLD).any())
+
+
+class ControlShaper:
+    """Turns stick values into a velocity setpoint within a safety envelope
+
+    Stages, per setpoint:
+    1. Expo and scaling: one lookup per axis into a table precomputed for
+       the configured curves and `max_speed` (forward, right, up m/s, yaw °/s).
+    2. Battery caps: translational speed is scaled down below each
+       `(percent, factor)` threshold (a battery of 0 is treated as unknown).
+    3. Slew limiting: each axis changes by at most `slew` per second.
+    4. Envelope: climb rate is limited to `envelope_gain` × the distance to
+       `max_altitude_m`, and velocity towards the edge of a
+       `geofence_radius_m` circle around `home` (`set_home`, else the first
+       position shaped) to `envelope_gain` × the distance left, so the
+       vehicle slows to a stop at the boundary and is pushed back (at most
+       at max speed) if it is outside. Runs last, so slew never delays it.
+    """
+
+    def __init__(self, max_speed=(3.0, 3.0, 2.0, 60.0), expo=(0.0, 0.0, 0.0, 0.0), slew=(6.0, 6.0, 4.0, 240.0),
+                 battery_caps=((15.0, 0.35), (25.0, 0.6)), max_altitude_m=None, geofence_radius_m=None,
+                 envelope_gain=0.5, lut_size=2049, max_dt=0.1):
+        self.max_speed = np.asarray(max_speed, dtype=float)
+        self.expo = tuple(expo)
+        self.slew = np.asarray(slew, dtype=float) if slew is not None else None
+        self.battery_caps = sorted(battery_caps)
+        self.max_altitude_m = max_altitude_m
+        self.geofence_radius_m = geofence_radius_m
+        self.envelope_gain = envelope_gain
+        self.max_dt = max_dt
+        self.home = None
+
+        # One flat table, a row per output axis; a stick value maps to its row's
+        # nearest sample with one multiply-add, and is clamped to the row's ends
+        self.lut = self.max_speed[:, None] * np.stack([expo_table(e, lut_size) for e in self.expo])
+        self._flat = self.lut.ravel()
+        first = np.arange(4) * lut_size
+        self._lut_scale = (lut_size - 1) / 2.0
+        self._lut_offset = first + self._lut_scale + 0.5
+        self._first = first
+        self._last_index = first + lut_size - 1
+        self._bounds = np.empty(4)
+        self._last = np.zeros(4)
+        self._last_time = None
+
+        self.shaped = 0
+        self.slew_limited = 0
+        self.battery_limited = 0
+        self.envelope_limited = 0
+
+    def set_home(self, lat, lon):
+        """Centre of the geofence"""
+        self.home = (lat, lon)
+
+    def reset(self):
+        """Forget the slew state (offboard restarted: start again from a standstill)"""
+        self._last = np.zeros(4)
+        self._last_time = None
+
+    def battery_factor(self, battery):
+        if battery > 0:
+            for threshold, factor in self.battery_caps:
+                if battery < threshold:
+                    return factor
+        return 1.0
+
+    def shape(self, values, snapshot, now=None):
+        """Velocity setpoint (forward, right, up m/s, yaw °/s) as an array, for ControlState values"""
+        throttle, yaw, pitch, roll = values
+        x = np.array((pitch, roll, throttle, yaw), dtype=float)
+        x *= self._lut_scale
+        x += self._lut_offset
+        index = x.astype(np.intp)
+        np.maximum(index, self._first, out=index)
+        np.minimum(index, self._last_index, out=index)
+        out = self._flat.take(index)
+
+        factor = self.battery_factor(snapshot.battery)
+        if factor != 1.0:
+            out[:3] *= factor
+            self.battery_limited += 1
+
+        if self.slew is not None:
+            now = time.monotonic() if now is None else now
+            # The first setpoint after a reset ramps up from a standstill over max_dt
+            dt = self.max_dt if self._last_time is None else min(now - self._last_time, self.max_dt)
+            step = self.slew * dt
+            bounds = self._bounds
+            np.subtract(self._last, step, out=bounds)
+            requested = out.tolist()
+            np.maximum(out, bounds, out=out)
+            np.add(self._last, step, out=bounds)
+            np.minimum(out, bounds, out=out)
+            if out.tolist() != requested:
+                self.slew_limited += 1
+            self._last_time = now
+
+        self.apply_envelope(out, snapshot)
+        self._last = out
+        self.shaped += 1
+        return out
+
+    def apply_envelope(self, out, snapshot):
+        """Clamp `out` in place to the altitude ceiling and geofence"""
+        lat, lon, altitude = snapshot.position
+        gain = self.envelope_gain
+        if self.max_altitude_m is not None:
+            limit = max(gain * (self.max_altitude_m - altitude), -self.max_speed[2])
+            if out[2] > limit:
+                out[2] = limit
+                self.envelope_limited += 1
+
+        if self.geofence_radius_m is None or not (lat or lon):
+            return
+        if self.home is None:
+            self.home = (lat, lon)
+        home_lat, home_lon = self.home
+        north = math.radians(lat - home_lat) * EARTH_RADIUS_M
+        east = math.radians(lon - home_lon) * EARTH_RADIUS_M * math.cos(math.radians(home_lat))
+        distance = math.hypot(north, east)
+        if distance == 0.0:
+            return
+        # Body (forward, right) -> NED (north, east) with the current heading
+        yaw = math.radians(snapshot.attitude[2])
+        cos_y = math.cos(yaw)
+        sin_y = math.sin(yaw)
+        forward = float(out[0])
+        right = float(out[1])
+        v_north = forward * cos_y - right * sin_y
+        v_east = forward * sin_y + right * cos_y
+        u_north = north / distance
+        u_east = east / distance
+        outward = v_north * u_north + v_east * u_east
+        limit = max(gain * (self.geofence_radius_m - distance), -self.max_speed[0])
+        if outward > limit:
+            v_north -= (outward - limit) * u_north
+            v_east -= (outward - limit) * u_east
+            out[0] = v_north * cos_y + v_east * sin_y
+            out[1] = -v_north * sin_y + v_east * cos_y
+            self.envelope_limited += 1
+
+    def stats(self):
+        return {
+            "shaped": self.shaped,
+            "slew_limited": self.slew_limited,
+            "battery_limited": self.battery_limited,
+            "envelope_limited": self.envelope_limited,
+        }
@@ -1,34 +1,88 @@
 import asyncio
+import logging
 import customtkinter as ctk
-import math
+import log_config
+import startup_timing
+from attitude_indicator import AttitudeIndicator
+from attitude_raster import RasterAttitudeIndicator
+from latency_monitor import LatencyMonitor
+from link_monitor import LINK_DEGRADED, LINK_LOST, LINK_OK
+from map_view import MapView, open_tile_source
+from telemetry_plot import TelemetryPlot
+from ui_scheduler import RenderScheduler
+from widget_binding import WidgetBinder
+
+log = logging.getLogger(__name__)
+attitude_log = log_config.channel("dashboard.attitude", max_per_s=10)
 
 class DroneDashboard:
-    def __init__(self, root, drone_controller):
+    # Maximum refresh rate per panel in Hz (None = every frame, up to max_fps)
+    PANEL_RATES = {
+        "status": 10,
+        "position": 10,
+        "attitude": None,
+        "battery": 1,
+        "link": 2,
+        "plots": 10,
+        "map": 5,
+        "latency": 2,
+    }
+    # Re-rendered on the idle heartbeat too, so the ages they show keep counting while telemetry is silent
+    ALWAYS_RENDERED = ("link",)
+    
+    # Apple-inspired dark color palette
+    COLORS = {
+        "primary": "#0A84FF",      # Apple Blue
+        "success": "#30D158",      # Apple Green  
+        "warning": "#FF9F0A",      # Apple Orange
+        "error": "#FF453A",        # Apple Red
+        "background": "#000000",   # Black
+        "surface": "#1C1C1E",      # Dark Gray - Apple's dark surface
+        "surface_light": "#2C2C2E", # Lighter dark for cards
+        "text_primary": "#FFFFFF", # White
+        "text_secondary": "#98989D", # Light Gray
+        "border": "#38383A",       # Dark border
+        "accent": "#BF5AF2"        # Apple Purple accent
+    }
+    
+    # Streams listed by rate on the link quality card
+    LINK_STREAM_LABELS = {"attitude_euler": "att", "position": "pos", "velocity_ned": "vel", "battery": "bat"}
+    
+    # Fleet table refresh interval (ms)
+    FLEET_REFRESH_MS = 500
+    
+    # Slider refresh interval while a joystick drives the controls (ms)
+    JOYSTICK_REFRESH_MS = 50
+    
+    # Flight action result polling interval (ms) and display names
+    ACTION_POLL_MS = 100
+    ACTION_NAMES = {"arm": "Arm", "disarm": "Disarm", "takeoff": "Takeoff", "land": "Land",
+                    "test_gyroscope": "Gyro test"}
+    
+    def __init__(self, root, drone_controller, max_fps=60, idle_fps=2, fleet=None, attitude_renderer="canvas",
+                 map_tiles=None, lazy=False):
         self.root = root
         self.drone = drone_controller
+        self.fleet = fleet
+        self.attitude_renderer = attitude_renderer
+        self.map_tiles = map_tiles
         
         # Use soft dark theme like Apple Dark Mode
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
         
-        # Apple-inspired dark color palette
-        self.colors = {
-            "primary": "#0A84FF",      # Apple Blue
-            "success": "#30D158",      # Apple Green  
-            "warning": "#FF9F0A",      # Apple Orange
-            "error": "#FF453A",        # Apple Red
-            "background": "#000000",   # Black
-            "surface": "#1C1C1E",      # Dark Gray - Apple's dark surface
-            "surface_light": "#2C2C2E", # Lighter dark for cards
-            "text_primary": "#FFFFFF", # White
-            "text_secondary": "#98989D", # Light Gray
-            "border": "#38383A",       # Dark border
-            "accent": "#BF5AF2"        # Apple Purple accent
-        }
+        self.colors = dict(self.COLORS)
         
         # Initialize card_values dictionary
         self.card_values = {}
         
+        # Widget updates are diffed against what is already displayed
+        self.bindings = WidgetBinder()
+        
+        # Telemetry-to-pixel latency, shown on the attitude canvas with F3
+        self.latency = LatencyMonitor()
+        self.show_latency = False
+        
         # Configure root window
         self.root.configure(fg_color=self.colors["background"])
         self.root.title("Drone Control Dashboard")
@@ -46,10 +100,84 @@ class DroneDashboard:
         # Create UI sections
         self.create_header()
         self.create_left_panel()
+        if lazy:
+            # Build the heavy visualization panel (canvases, plots, map) once the window is on screen
+            placeholder = ctk.CTkFrame(self.main_frame, fg_color=self.colors["surface_light"], corner_radius=12)
+            placeholder.grid(row=1, column=1, sticky="nsew", padx=(15, 0))
+            ctk.CTkLabel(placeholder, text="Loading visualization...",
+                       font=("Arial", 14),
+                       text_color=self.colors["text_secondary"]).pack(expand=True)
+            placeholder.bind("<Map>", lambda e: self.root.after_idle(self.finish_startup, placeholder, max_fps, idle_fps))
+        else:
+            self.create_visualization_panel()
+            self.start_rendering(max_fps, idle_fps)
+    
+    def finish_startup(self, placeholder, max_fps, idle_fps):
+        """Replace the lazy placeholder with the real visualization panel and start rendering"""
+        if placeholder.winfo_exists():
+            placeholder.destroy()
+        if hasattr(self, "scheduler"):
+            return
         self.create_visualization_panel()
-        
-        # Start UI updates
-        self.update_ui()
+        self.start_rendering(max_fps, idle_fps)
+        startup_timing.mark("panels_built")
+    
+    def start_rendering(self, max_fps, idle_fps):
+        """Start UI updates - rendered when the controller publishes new telemetry"""
+        self.create_scheduler(max_fps, idle_fps)
+        self.scheduler.start()
+        if self.fleet:
+            self.fleet.focus_listeners.append(lambda name, controller: self.set_drone(controller))
+            self.update_fleet_table()
+    
+    def create_scheduler(self, max_fps, idle_fps):
+        """Create the render scheduler and register every panel with it"""
+        self.scheduler = RenderScheduler(self.root, lambda: self.drone.snapshot,
+                                         max_fps=max_fps, idle_fps=idle_fps, latency=self.latency)
+        for name, callback in [("status", self.render_status),
+                               ("position", self.render_position),
+                               ("attitude", self.render_attitude),
+                               ("battery", self.render_battery),
+                               ("link", self.render_link),
+                               ("plots", self.render_plots),
+                               ("map", self.render_map),
+                               ("latency", self.render_latency)]:
+            self.scheduler.add_panel(name, callback, self.PANEL_RATES.get(name), always=name in self.ALWAYS_RENDERED)
+        self._snapshot_listener = lambda snapshot: self.scheduler.notify()
+        self.drone.add_snapshot_listener(self._snapshot_listener)
+    
+    def attach_history_views(self):
+        """Feed every snapshot (and streamed setpoint, if any) of the current drone into the plots and map"""
+        self.drone.add_snapshot_listener(self.telemetry_plot.record_snapshot)
+        self.drone.add_snapshot_listener(self.map_view.record)
+        streamer = getattr(self.drone, "setpoint_streamer", None)
+        if streamer is not None:
+            streamer.listeners.append(self.telemetry_plot.record_setpoint)
+    
+    def detach_history_views(self):
+        self.drone.remove_snapshot_listener(self.telemetry_plot.record_snapshot)
+        self.drone.remove_snapshot_listener(self.map_view.record)
+        streamer = getattr(self.drone, "setpoint_streamer", None)
+        if streamer is not None and self.telemetry_plot.record_setpoint in streamer.listeners:
+            streamer.listeners.remove(self.telemetry_plot.record_setpoint)
+    
+    def set_drone(self, drone_controller):
+        """Switch the dashboard to another controller without reconnecting anything"""
+        if drone_controller is self.drone:
+            return
+        # Never leave the previously focused vehicle with stale stick input
+        self.reset_controls()
+        self.drone.remove_snapshot_listener(self._snapshot_listener)
+        self.detach_history_views()
+        self.drone = drone_controller
+        self.drone.add_snapshot_listener(self._snapshot_listener)
+        self.telemetry_plot.clear()
+        self.map_view.clear()
+        self.attach_history_views()
+        self.reset_controls()
+        self.scheduler.reset()
+        self.latency.reset()
+        self.scheduler.render_all(self.drone.snapshot)
     
     def create_header(self):
         """Create simple header with soft dark theme"""
@@ -73,6 +201,10 @@ class DroneDashboard:
         left_panel = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         left_panel.grid(row=1, column=0, sticky="nsew", padx=(0, 15))
         
+        # Fleet table (multi-vehicle mode only)
+        if self.fleet:
+            self.create_fleet_panel(left_panel)
+        
         # Status cards
         self.create_status_cards(left_panel)
         
@@ -82,6 +214,51 @@ class DroneDashboard:
         # RC Controls
         self.create_rc_controls(left_panel)
     
+    def create_fleet_panel(self, parent):
+        """Create the fleet table - one selectable row per vehicle"""
+        fleet_frame = ctk.CTkFrame(parent,
+                                 fg_color=self.colors["surface_light"],
+                                 border_color=self.colors["border"],
+                                 border_width=1,
+                                 corner_radius=12)
+        fleet_frame.pack(fill="x", pady=(0, 20))
+        
+        content = ctk.CTkScrollableFrame(fleet_frame, fg_color="transparent", height=140)
+        content.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        ctk.CTkLabel(content, text="🛩️ Fleet",
+                   font=("Arial", 16, "bold"),
+                   text_color=self.colors["text_primary"]).pack(anchor="w", pady=(0, 10))
+        
+        self.fleet_rows = {}
+        for name in self.fleet.vehicles:
+            row = ctk.CTkButton(content, text=name,
+                              command=lambda n=name: self.fleet.set_focus(n),
+                              fg_color=self.colors["surface"],
+                              hover_color=self.colors["border"],
+                              font=("Courier", 12),
+                              anchor="w",
+                              height=28,
+                              corner_radius=6)
+            row.pack(fill="x", pady=2)
+            self.fleet_rows[name] = row
+    
+    def update_fleet_table(self):
+        """Refresh the fleet table at a fixed low rate, touching only rows that changed"""
+        try:
+            for row in self.fleet.fleet_table():
+                if row["connected"]:
+                    text = (f"{row['name']:<6} {'ARMED' if row['armed'] else 'safe ':<5} "
+                            f"{'AIR' if row['in_air'] else 'GND'} {row['altitude_m']:6.1f}m "
+                            f"{row['battery']:5.1f}%")
+                else:
+                    text = f"{row['name']:<6} connecting..."
+                color = self.colors["primary"] if row["focused"] else self.colors["surface"]
+                self.bindings.set(self.fleet_rows[row["name"]], text=text, fg_color=color)
+        except Exception as e:
+            log.error("Fleet table update error: %s", e)
+        self.root.after(self.FLEET_REFRESH_MS, self.update_fleet_table)
+    
     def create_status_cards(self, parent):
         """Create status display cards with dark theme"""
         status_frame = ctk.CTkFrame(parent, fg_color="transparent")
@@ -105,13 +282,23 @@ class DroneDashboard:
         
         # Flight status
         self.flight_card, flight_value = self.create_simple_card(grid_frame, "🛩️ Flight Mode", "Ground", self.colors["error"])
-        self.flight_card.grid(row=1, column=0, padx=(0, 10), pady=(10, 0), sticky="ew")
+        self.flight_card.grid(row=1, column=0, padx=(0, 10), pady=(10, 10), sticky="ew")
         self.card_values["flight"] = flight_value
         
         # GPS status
         self.gps_card, gps_value = self.create_simple_card(grid_frame, "🛰️ GPS", "No Fix", self.colors["error"])
-        self.gps_card.grid(row=1, column=1, padx=(10, 0), pady=(10, 0), sticky="ew")
+        self.gps_card.grid(row=1, column=1, padx=(10, 0), pady=(10, 10), sticky="ew")
         self.card_values["gps"] = gps_value
+        
+        # Link quality (state plus rate/jitter/staleness details)
+        self.link_card, link_value = self.create_simple_card(grid_frame, "📶 Link Quality", "Unknown", self.colors["text_secondary"])
+        self.link_card.grid(row=2, column=0, columnspan=2, pady=(10, 0), sticky="ew")
+        self.card_values["link"] = link_value
+        self.link_detail_label = ctk.CTkLabel(link_value.master, text="No telemetry yet",
+                                            font=("Courier", 11),
+                                            text_color=self.colors["text_secondary"],
+                                            justify="left")
+        self.link_detail_label.pack(anchor="w", pady=(5, 0))
     
     def create_simple_card(self, parent, title, value, color):
         """Create a simple status card and return card + value label"""
@@ -210,6 +397,13 @@ class DroneDashboard:
                                          height=40,
                                          corner_radius=8)
         self.gyro_test_btn.grid(row=2, column=0, columnspan=2, padx=5, pady=4, sticky="ew")
+        
+        # Result of the last action (queued, done, failed, timed out or cancelled)
+        self.pending_actions = []
+        self.action_label = ctk.CTkLabel(content, text="",
+                                       font=("Arial", 12),
+                                       text_color=self.colors["text_secondary"])
+        self.action_label.pack(anchor="w", pady=(10, 0))
     
     def create_rc_controls(self, parent):
         """Create RC controls panel with dark theme"""
@@ -284,19 +478,19 @@ class DroneDashboard:
         # Store references
         if label == "Throttle":
             self.throttle_slider = slider
-            self.throttle_label = value_label
+            self.throttle_value_label = value_label
             slider.configure(command=lambda v: self.on_throttle_change(v, value_label))
         elif label == "Yaw":
             self.yaw_slider = slider
-            self.yaw_label = value_label
+            self.yaw_value_label = value_label
             slider.configure(command=lambda v: self.on_yaw_change(v, value_label))
         elif label == "Pitch":
             self.pitch_slider = slider
-            self.pitch_label = value_label
+            self.pitch_value_label = value_label
             slider.configure(command=lambda v: self.on_pitch_change(v, value_label))
         elif label == "Roll":
             self.roll_slider = slider
-            self.roll_label = value_label
+            self.roll_value_label = value_label
             slider.configure(command=lambda v: self.on_roll_change(v, value_label))
     
     def create_visualization_panel(self):
@@ -316,9 +510,12 @@ class DroneDashboard:
                    font=("Arial", 18, "bold"),
                    text_color=self.colors["text_primary"]).pack(anchor="w", pady=(0, 20))
         
-        # Attitude indicator
-        att_frame = ctk.CTkFrame(content, fg_color="transparent")
-        att_frame.pack(fill="both", expand=True, pady=(0, 20))
+        # Attitude indicator and moving map side by side
+        views_frame = ctk.CTkFrame(content, fg_color="transparent")
+        views_frame.pack(fill="both", expand=True, pady=(0, 20))
+        
+        att_frame = ctk.CTkFrame(views_frame, fg_color="transparent")
+        att_frame.pack(side="left", fill="both", expand=True)
         
         ctk.CTkLabel(att_frame, text="Attitude Indicator",
                    font=("Arial", 14, "bold"),
@@ -326,6 +523,18 @@ class DroneDashboard:
         
         self.canvas = ctk.CTkCanvas(att_frame, width=400, height=300, bg="#0A0A0A", highlightthickness=0)
         self.canvas.pack(pady=10)
+        if self.attitude_renderer == "raster":
+            # One cached PIL frame per 0.5° of roll/pitch, swapped in as a single image
+            self.attitude_indicator = RasterAttitudeIndicator(self.canvas)
+        else:
+            self.attitude_indicator = AttitudeIndicator(self.canvas)
+        
+        # Latency debug overlay (created last so it stays above the indicator)
+        self.latency_overlay = self.canvas.create_text(8, 8, text="", anchor="nw", fill="#30D158",
+                                                       font=("Courier", 9), state="hidden")
+        self.root.bind("<F3>", lambda e: self.toggle_latency_overlay())
+        
+        self.create_map_view(views_frame)
         
         # Telemetry data
         telemetry_frame = ctk.CTkFrame(content, fg_color="transparent")
@@ -382,6 +591,16 @@ class DroneDashboard:
                                         text_color=self.colors["text_primary"])
         self.battery_label.pack(side="left", padx=(5, 0))
         
+        # Telemetry history plots (10 minute window, one min/max stroke per pixel column)
+        ctk.CTkLabel(content, text="Telemetry History",
+                   font=("Arial", 14, "bold"),
+                   text_color=self.colors["text_secondary"]).pack(pady=(10, 5))
+        
+        self.plot_canvas = ctk.CTkCanvas(content, width=600, height=400, bg="#0A0A0A", highlightthickness=0)
+        self.plot_canvas.pack(fill="x")
+        self.telemetry_plot = TelemetryPlot(self.plot_canvas)
+        self.attach_history_views()
+        
         # Status message
         self.status_label = ctk.CTkLabel(content, 
                                        text="Ready to connect",
@@ -389,278 +608,257 @@ class DroneDashboard:
                                        text_color=self.colors["text_secondary"])
         self.status_label.pack(pady=(10, 0))
     
+    def create_map_view(self, parent):
+        """Moving map over the offline tile set (track and vehicle only if no tiles are given)"""
+        map_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        map_frame.pack(side="left", fill="both", expand=True, padx=(20, 0))
+        
+        ctk.CTkLabel(map_frame, text="Map",
+                   font=("Arial", 14, "bold"),
+                   text_color=self.colors["text_secondary"]).pack(pady=(0, 10))
+        
+        self.map_canvas = ctk.CTkCanvas(map_frame, width=300, height=300, bg="#1C1C1E", highlightthickness=0)
+        self.map_canvas.pack(pady=10)
+        tile_source = open_tile_source(self.map_tiles) if self.map_tiles else None
+        self.map_view = MapView(self.map_canvas, tile_source)
+        
+        # Mouse wheel zoom (Windows/macOS delta, X11 buttons 4/5)
+        zoom_by = lambda step: self.map_view.set_zoom(self.map_view.zoom + step)
+        self.map_canvas.bind("<MouseWheel>", lambda e: zoom_by(1 if e.delta > 0 else -1))
+        self.map_canvas.bind("<Button-4>", lambda e: zoom_by(1))
+        self.map_canvas.bind("<Button-5>", lambda e: zoom_by(-1))
+    
     # Control callbacks
     def on_throttle_change(self, value, label):
         throttle = float(value) / 100.0
-        label.configure(text=f"{int(value)}%")
+        self.bindings.set(label, text=f"{int(value)}%")
         self.drone.update_controls(throttle=throttle)
     
     def on_yaw_change(self, value, label):
         yaw = float(value) / 100.0
-        label.configure(text=f"{int(value)}%")
+        self.bindings.set(label, text=f"{int(value)}%")
         self.drone.update_controls(yaw=yaw)
     
     def on_pitch_change(self, value, label):
         pitch = float(value) / 100.0
-        label.configure(text=f"{int(value)}%")
+        self.bindings.set(label, text=f"{int(value)}%")
         self.drone.update_controls(pitch=pitch)
     
     def on_roll_change(self, value, label):
         roll = float(value) / 100.0
-        label.configure(text=f"{int(value)}%")
+        self.bindings.set(label, text=f"{int(value)}%")
         self.drone.update_controls(roll=roll)
     
+    def attach_joystick(self, joystick):
+        """Mirror joystick-driven control values onto the sliders at UI rate (the joystick writes the controls itself)"""
+        self.joystick = joystick
+        self._joystick_version = None
+        self.refresh_joystick_sliders()
+    
+    def refresh_joystick_sliders(self):
+        joystick = self.joystick
+        if joystick.version != self._joystick_version:
+            self._joystick_version = joystick.version
+            sliders = [(self.throttle_slider, self.throttle_value_label), (self.yaw_slider, self.yaw_value_label),
+                       (self.pitch_slider, self.pitch_value_label), (self.roll_slider, self.roll_value_label)]
+            for (slider, label), value in zip(sliders, joystick.values):
+                # CTkSlider.set does not fire the slider command, so this never feeds back into the controls
+                slider.set(value * 100.0)
+                self.bindings.set(label, text=f"{int(value * 100.0)}%")
+        self.root.after(self.JOYSTICK_REFRESH_MS, self.refresh_joystick_sliders)
+    
     def reset_controls(self):
         """Reset all controls to zero"""
         for slider in [self.throttle_slider, self.yaw_slider, self.pitch_slider, self.roll_slider]:
             slider.set(0)
         
-        for label in [self.throttle_label, self.yaw_label, self.pitch_label, self.roll_label]:
-            label.configure(text="0%")
+        for label in [self.throttle_value_label, self.yaw_value_label, self.pitch_value_label, self.roll_value_label]:
+            self.bindings.set(label, text="0%")
         
-        self.drone.update_controls(0, 0, 0, 0)
+        self.drone.update_controls(throttle=0, yaw=0, pitch=0, roll=0)
     
-    # Action handlers
+    # Action handlers - queued on the controller's command scheduler, results shown on the actions card
     def arm_drone(self):
-        print("ARM button clicked")
-        if self.drone.loop and self.drone.loop.is_running():
-            asyncio.run_coroutine_threadsafe(self.drone.arm(), self.drone.loop)
+        log.info("ARM button clicked")
+        self.run_action("arm")
     
     def takeoff(self):
-        print("TAKEOFF button clicked")
-        if self.drone.loop and self.drone.loop.is_running():
-            asyncio.run_coroutine_threadsafe(self.drone.takeoff(), self.drone.loop)
+        log.info("TAKEOFF button clicked")
+        self.run_action("takeoff")
     
     def land(self):
-        print("LAND button clicked")
-        if self.drone.loop and self.drone.loop.is_running():
-            asyncio.run_coroutine_threadsafe(self.drone.land(), self.drone.loop)
+        log.info("LAND button clicked")
+        self.run_action("land")
     
     def disarm(self):
-        print("DISARM button clicked")
-        if self.drone.loop and self.drone.loop.is_running():
-            asyncio.run_coroutine_threadsafe(self.drone.disarm(), self.drone.loop)
+        log.info("DISARM button clicked")
+        self.run_action("disarm")
     
     def test_gyroscope(self):
         """Test gyroscope data"""
-        print("🟡 GYRO TEST button clicked")
-        if self.drone.loop and self.drone.loop.is_running():
-            asyncio.run_coroutine_threadsafe(self.drone.test_gyroscope(), self.drone.loop)
+        log.info("🟡 GYRO TEST button clicked")
+        self.run_action("test_gyroscope")
     
-    def update_ui(self):
-        """Update all UI elements"""
-        try:
-            # Update connection status
-            if self.drone.connected:
-                self.card_values["connection"].configure(text="Connected", text_color=self.colors["success"])
-            else:
-                self.card_values["connection"].configure(text="Disconnected", text_color=self.colors["error"])
-            
-            # Update armed status
-            if self.drone.armed:
-                self.card_values["armed"].configure(text="Armed", text_color=self.colors["success"])
-            else:
-                self.card_values["armed"].configure(text="Disarmed", text_color=self.colors["error"])
-            
-            # Update flight status
-            if self.drone.in_air:
-                self.card_values["flight"].configure(text="In Flight", text_color=self.colors["success"])
-                self.status_label.configure(text="Manual control active - Use sliders to fly")
-            else:
-                self.card_values["flight"].configure(text="On Ground", text_color=self.colors["text_secondary"])
-                self.status_label.configure(text="Ready for takeoff")
-            
-            # Update GPS status
-            if self.drone.gps_fix >= 3:
-                self.card_values["gps"].configure(text="Good Fix", text_color=self.colors["success"])
-            elif self.drone.gps_fix >= 2:
-                self.card_values["gps"].configure(text="Weak Fix", text_color=self.colors["warning"])
-            else:
-                self.card_values["gps"].configure(text="No Fix", text_color=self.colors["error"])
-            
-            # Update position data
-            lat, lon, alt = self.drone.position
-            self.lat_label.configure(text=f"Latitude: {lat:.6f}")
-            self.lon_label.configure(text=f"Longitude: {lon:.6f}")
-            self.alt_label.configure(text=f"Altitude: {alt:.1f} m")
-            
-            # Update attitude data
-            roll, pitch, yaw = self.drone.attitude
-            self.roll_label.configure(text=f"Roll: {roll:.1f}°")
-            self.pitch_label.configure(text=f"Pitch: {pitch:.1f}°")
-            self.yaw_label.configure(text=f"Yaw: {yaw:.1f}°")
-            
-            # DEBUG: Print attitude values to verify they're changing
-            print(f"🎯 Dashboard Attitude - Roll: {roll:.1f}°, Pitch: {pitch:.1f}°, Yaw: {yaw:.1f}°")
-            
-            # Update battery
-            self.battery_label.configure(text=f"{self.drone.battery:.1f}%")
-            
-            # Update attitude indicator
-            self.draw_attitude_indicator(roll, pitch)
-            
-        except Exception as e:
-            print(f"UI update error: {e}")
-        
-        # Schedule next update
-        self.root.after(100, self.update_ui)
+    def run_action(self, action):
+        """Queue a flight action and watch its result future from the GUI thread"""
+        if not (self.drone.loop and self.drone.loop.is_running()):
+            self.bindings.set(self.action_label, text="Not connected", text_color=self.colors["error"])
+            return
+        self.pending_actions.append((action, self.drone, self.drone.request(action)))
+        self.bindings.set(self.action_label, text=f"⏳ {self.ACTION_NAMES[action]}...",
+                          text_color=self.colors["text_secondary"])
+        if len(self.pending_actions) == 1:
+            self.root.after(self.ACTION_POLL_MS, self.poll_actions)
+    
+    def poll_actions(self):
+        """Report finished actions; keeps polling while any are outstanding"""
+        still_pending = []
+        for action, drone, future in self.pending_actions:
+            if not future.done():
+                still_pending.append((action, drone, future))
+                continue
+            if drone is self.drone:
+                self.show_action_result(action, future)
+        self.pending_actions = still_pending
+        if still_pending:
+            self.root.after(self.ACTION_POLL_MS, self.poll_actions)
+    
+    def show_action_result(self, action, future):
+        name = self.ACTION_NAMES[action]
+        if future.cancelled():
+            text, color = f"⛔ {name} cancelled", "warning"
+        elif isinstance(future.exception(), asyncio.TimeoutError):
+            text, color = f"⏱️ {name} timed out", "error"
+        elif future.exception() is not None:
+            text, color = f"❌ {name} error: {future.exception()}", "error"
+        elif future.result():
+            text, color = f"✅ {name} done", "success"
+        else:
+            text, color = f"❌ {name} failed", "error"
+        self.bindings.set(self.action_label, text=text, text_color=self.colors[color])
+    
+    def render_status(self, snapshot):
+        """Status cards, touching only widgets whose display changed"""
+        bind = self.bindings.set
+        
+        # Update connection status
+        if snapshot.connected:
+            bind(self.card_values["connection"], text="Connected", text_color=self.colors["success"])
+        else:
+            bind(self.card_values["connection"], text="Disconnected", text_color=self.colors["error"])
+        
+        # Update armed status
+        if snapshot.armed:
+            bind(self.card_values["armed"], text="Armed", text_color=self.colors["success"])
+        else:
+            bind(self.card_values["armed"], text="Disarmed", text_color=self.colors["error"])
+        
+        # Update flight status
+        if snapshot.in_air:
+            bind(self.card_values["flight"], text="In Flight", text_color=self.colors["success"])
+            bind(self.status_label, text="Manual control active - Use sliders to fly")
+        else:
+            bind(self.card_values["flight"], text="On Ground", text_color=self.colors["text_secondary"])
+            bind(self.status_label, text="Ready for takeoff")
+        
+        # Update GPS status
+        if snapshot.gps_fix >= 3:
+            bind(self.card_values["gps"], text="Good Fix", text_color=self.colors["success"])
+        elif snapshot.gps_fix >= 2:
+            bind(self.card_values["gps"], text="Weak Fix", text_color=self.colors["warning"])
+        else:
+            bind(self.card_values["gps"], text="No Fix", text_color=self.colors["error"])
+    
+    def render_position(self, snapshot):
+        """Position labels"""
+        bind = self.bindings.set
+        lat, lon, alt = snapshot.position
+        bind(self.lat_label, text=f"Latitude: {lat:.6f}")
+        bind(self.lon_label, text=f"Longitude: {lon:.6f}")
+        bind(self.alt_label, text=f"Altitude: {alt:.1f} m")
+    
+    def render_attitude(self, snapshot):
+        """Attitude labels and the attitude indicator"""
+        bind = self.bindings.set
+        roll, pitch, yaw = snapshot.attitude
+        bind(self.roll_label, text=f"Roll: {roll:.1f}°")
+        bind(self.pitch_label, text=f"Pitch: {pitch:.1f}°")
+        bind(self.yaw_label, text=f"Yaw: {yaw:.1f}°")
+        
+        self.draw_attitude_indicator(roll, pitch)
+        
+        if attitude_log.isEnabledFor(logging.DEBUG):
+            attitude_log.debug("🎯 Dashboard Attitude - Roll: %.1f°, Pitch: %.1f°, Yaw: %.1f°", roll, pitch, yaw)
+    
+    def render_battery(self, snapshot):
+        """Battery label"""
+        self.bindings.set(self.battery_label, text=f"{snapshot.battery:.1f}%")
+    
+    def render_link(self, snapshot):
+        """Link quality card - state from the snapshot, details from the link monitor"""
+        bind = self.bindings.set
+        colors = {LINK_OK: "success", LINK_DEGRADED: "warning", LINK_LOST: "error"}
+        bind(self.card_values["link"], text=snapshot.link.title(),
+             text_color=self.colors[colors.get(snapshot.link, "text_secondary")])
+        
+        monitor = getattr(self.drone, "link", None)
+        if monitor is None:
+            return
+        metrics = monitor.metrics()
+        streams = [s for s in metrics["streams"].values() if s["age_s"] is not None]
+        if not streams:
+            bind(self.link_detail_label, text="No telemetry yet")
+            return
+        summary = (f"{sum(s['rate_hz'] for s in streams):.0f} msg/s  "
+                   f"jitter ≤{max(s['jitter_ms'] for s in streams):.1f} ms  "
+                   f"oldest {max(s['age_s'] for s in streams):.1f} s  "
+                   f"reconnects {metrics['reconnects']}")
+        rates = "  ".join(self.format_stream_rate(label, metrics["streams"][name])
+                          for name, label in self.LINK_STREAM_LABELS.items() if name in metrics["streams"])
+        lines = [summary, rates + " Hz"]
+        if metrics["reason"]:
+            lines.append(metrics["reason"])
+        bind(self.link_detail_label, text="\n".join(lines))
+    
+    def format_stream_rate(self, label, stream):
+        """`att 48` or, with a requested rate from the rate profile, `att 48/50`"""
+        if stream["expected_hz"]:
+            return f"{label} {stream['rate_hz']:.0f}/{stream['expected_hz']:g}"
+        return f"{label} {stream['rate_hz']:.0f}"
+    
+    def render_plots(self, snapshot):
+        """Telemetry history plots (cost independent of the window length)"""
+        self.telemetry_plot.render()
+    
+    def render_map(self, snapshot):
+        """Moving map (tiles, simplified track, vehicle marker)"""
+        self.map_view.render()
+    
+    def render_latency(self, snapshot):
+        """Latency debug overlay (only while it is shown)"""
+        if self.show_latency:
+            self.canvas.itemconfigure(self.latency_overlay, text=self.latency.overlay_text())
+    
+    def toggle_latency_overlay(self):
+        self.show_latency = not self.show_latency
+        self.canvas.itemconfigure(self.latency_overlay, state="normal" if self.show_latency else "hidden")
+        self.render_latency(self.drone.snapshot)
+    
+    def export_latency(self, path):
+        """Write the latency report as JSON, with per-stream sample and dropped-sample counts"""
+        extra = None
+        hub = getattr(self.drone, "telemetry", None)
+        if hub is not None:
+            extra = {"streams": {name: {"samples": stats.samples, "dropped": stats.dropped}
+                                 for name, stats in hub.stats.items()}}
+        self.latency.write_json(path, extra)
+    
+    def get_render_stats(self):
+        """Applied vs skipped widget updates and scheduler frame counts since startup"""
+        stats = self.bindings.stats()
+        stats.update(self.scheduler.stats())
+        return stats
     
     def draw_attitude_indicator(self, roll, pitch):
-        """Fixed attitude indicator - properly displays roll and pitch"""
-        canvas = self.canvas
-        canvas.delete("all")
-        
-        width = canvas.winfo_width()
-        height = canvas.winfo_height()
-        
-        if width <= 1 or height <= 1:
-            width, height = 400, 300
-        
-        center_x = width // 2
-        center_y = height // 2
-        
-        # Create background
-        canvas.create_rectangle(0, 0, width, height, fill="#0A0A0A", outline="")
-        
-        # Convert roll to radians - IMPORTANT: Negative for correct visual rotation
-        roll_rad = -math.radians(roll)
-        
-        # Pitch scaling - adjust this value to control sensitivity
-        pitch_scale = 2.5  # pixels per degree of pitch
-        
-        # Calculate horizon offset based on pitch
-        # Positive pitch (nose up) moves horizon DOWN, negative pitch (nose down) moves horizon UP
-        horizon_offset = pitch * pitch_scale
-        
-        # Draw sky and ground with proper rotation
-        self.draw_rotated_horizon(canvas, width, height, center_x, center_y, horizon_offset, roll_rad)
-        
-        # Draw pitch ladder
-        self.draw_pitch_ladder(canvas, width, height, center_x, center_y, horizon_offset, roll_rad, pitch_scale)
-        
-        # Draw fixed aircraft reference (always centered)
-        self.draw_fixed_aircraft(canvas, center_x, center_y)
-    
-    def draw_rotated_horizon(self, canvas, width, height, center_x, center_y, horizon_offset, roll_rad):
-        """Draw the rotated horizon line separating sky and ground"""
-        
-        # Calculate horizon line endpoints (very long line)
-        line_length = max(width, height) * 2
-        
-        # Calculate rotated line endpoints
-        x1 = center_x - line_length * math.cos(roll_rad)
-        y1 = center_y + horizon_offset - line_length * math.sin(roll_rad)
-        x2 = center_x + line_length * math.cos(roll_rad) 
-        y2 = center_y + horizon_offset + line_length * math.sin(roll_rad)
-        
-        # Draw sky (above horizon)
-        sky_points = [
-            0, 0,                    # Top-left corner
-            width, 0,                # Top-right corner  
-            x2, y2,                  # Horizon right
-            x1, y1,                  # Horizon left
-        ]
-        canvas.create_polygon(sky_points, fill="#1E3A8A", outline="")  # Dark blue sky
-        
-        # Draw ground (below horizon)  
-        ground_points = [
-            x1, y1,                  # Horizon left
-            x2, y2,                  # Horizon right
-            width, height,           # Bottom-right
-            0, height,               # Bottom-left
-        ]
-        canvas.create_polygon(ground_points, fill="#78350F", outline="")  # Brown ground
-        
-        # Draw horizon line
-        canvas.create_line(x1, y1, x2, y2, fill="#FFFFFF", width=3)
-    
-    def draw_pitch_ladder(self, canvas, width, height, center_x, center_y, horizon_offset, roll_rad, pitch_scale):
-        """Draw pitch reference lines"""
-        
-        # Pitch values to display (in degrees)
-        pitch_angles = [-30, -20, -10, 0, 10, 20, 30]
-        
-        for angle in pitch_angles:
-            # Calculate line position
-            line_y_offset = horizon_offset + (angle * pitch_scale)
-            line_center_y = center_y + line_y_offset
-            
-            # Line length
-            if angle == 0:
-                line_length = 120  # Longer horizon line
-            else:
-                line_length = 80   # Shorter pitch lines
-            
-            # Calculate rotated line endpoints
-            x1 = center_x - line_length * math.cos(roll_rad)
-            y1 = line_center_y - line_length * math.sin(roll_rad)
-            x2 = center_x + line_length * math.cos(roll_rad)
-            y2 = line_center_y + line_length * math.sin(roll_rad)
-            
-            # Choose color and width
-            if angle == 0:
-                color = "#FFFFFF"  # White horizon
-                line_width = 3
-            else:
-                color = "#CCCCCC"  # Gray pitch lines  
-                line_width = 1
-            
-            # Draw the line
-            canvas.create_line(x1, y1, x2, y2, fill=color, width=line_width)
-            
-            # Add angle labels for non-zero pitches
-            if angle != 0:
-                label_offset = 20
-                label_x = center_x + (line_length + label_offset) * math.cos(roll_rad)
-                label_y = line_center_y + (line_length + label_offset) * math.sin(roll_rad)
-                
-                # Only draw label if it's visible
-                if 0 <= label_y <= height:
-                    canvas.create_text(
-                        label_x, label_y, 
-                        text=str(abs(angle)) + "°", 
-                        fill="#CCCCCC", 
-                        font=("Arial", 10),
-                        angle=math.degrees(roll_rad)  # Rotate text with horizon
-                    )
-    
-    def draw_fixed_aircraft(self, canvas, center_x, center_y):
-        """Draw the fixed aircraft reference (always centered and level)"""
-        
-        # Aircraft wings (horizontal)
-        wing_length = 60
-        wing_width = 6
-        canvas.create_rectangle(
-            center_x - wing_length//2, center_y - wing_width//2,
-            center_x + wing_length//2, center_y + wing_width//2,
-            fill="#EF4444", outline="#FFFFFF", width=2  # Red wings
-        )
-        
-        # Aircraft body (vertical)  
-        body_length = 40
-        body_width = 8
-        canvas.create_rectangle(
-            center_x - body_width//2, center_y - body_length//2,
-            center_x + body_width//2, center_y + body_length//2,
-            fill="#3B82F6", outline="#FFFFFF", width=1  # Blue body
-        )
-        
-        # Center reference dot
-        canvas.create_oval(
-            center_x - 6, center_y - 6,
-            center_x + 6, center_y + 6,
-            fill="#F59E0B", outline="#FFFFFF", width=1  # Amber center
-        )
-        
-        # Fixed reference cross (always straight)
-        cross_size = 25
-        canvas.create_line(
-            center_x - cross_size, center_y,
-            center_x + cross_size, center_y,
-            fill="#10B981", width=2, dash=(4, 2)  # Green dashed
-        )
-        canvas.create_line(
-            center_x, center_y - cross_size,
-            center_x, center_y + cross_size, 
-            fill="#10B981", width=2, dash=(4, 2)  # Green dashed
-        )
\ No newline at end of file
+        """Move the retained-mode attitude indicator (no-op when roll/pitch are unchanged)"""
+        return self.attitude_indicator.update(roll, pitch)
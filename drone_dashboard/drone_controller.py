@@ -1,256 +1,492 @@
 import asyncio
+import logging
 from mavsdk import System
 from mavsdk.offboard import (OffboardError, VelocityBodyYawspeed, PositionNedYaw)
 import math
+import time
+import log_config
+from command_scheduler import PRIORITY_FLIGHT, PRIORITY_NORMAL, PRIORITY_SAFETY, CommandScheduler
+from control_shaping import ControlShaper, active_axes
+from link_monitor import LINK_UNKNOWN, LinkMonitor
+from setpoint_streamer import ControlState, SetpointStreamer
+from telemetry_hub import TelemetryHub
+from telemetry_rates import apply_rates, log_rate_report, rate_report, resolve_profile
+from telemetry_snapshot import TelemetrySnapshot
+
+log = logging.getLogger(__name__)
+
+# Hot-path debug channels
+attitude_log = log_config.channel("drone_controller.attitude", max_per_s=0.5)
+controls_log = log_config.channel("drone_controller.controls", max_per_s=5)
 
 class DroneController:
-    def __init__(self):
-        self.drone = System()
+    # Flight actions run through the command scheduler: (priority lane, timeout in s,
+    # queued/running actions they cancel). Land and disarm drop any pending climb-out.
+    ACTIONS = {
+        "land": (PRIORITY_SAFETY, 30.0, ("arm", "takeoff", "manual_takeoff_override", "quick_fix_offboard",
+                                         "start_offboard_mode")),
+        "disarm": (PRIORITY_SAFETY, 10.0, ("arm", "takeoff", "land", "manual_takeoff_override",
+                                           "quick_fix_offboard", "start_offboard_mode")),
+        "arm": (PRIORITY_FLIGHT, 10.0, ()),
+        "takeoff": (PRIORITY_FLIGHT, 30.0, ()),
+        "start_offboard_mode": (PRIORITY_FLIGHT, 10.0, ()),
+        "stop_offboard_mode": (PRIORITY_FLIGHT, 10.0, ()),
+        "manual_takeoff_override": (PRIORITY_FLIGHT, 10.0, ()),
+        "quick_fix_offboard": (PRIORITY_FLIGHT, 10.0, ()),
+        "test_gyroscope": (PRIORITY_NORMAL, 5.0, ()),
+    }
+    
+    # Takeoff: target altitude, the share of it PX4's climb must reach before
+    # RC control takes over, the altitude that counts as airborne even if
+    # in_air has not flipped yet, and how long to wait for the climb
+    TAKEOFF_ALTITUDE = 5.0
+    HANDOVER_FRACTION = 0.9
+    AIRBORNE_ALTITUDE = 2.0
+    TAKEOFF_TIMEOUT = 20.0
+    OVERRIDE_TIMEOUT = 5.0
+    
+    def __init__(self, setpoint_rate_hz=20.0, system=None, rate_profile=None, shaping=None):
+        self.drone = system if system is not None else System()
         self.connected = False
         self.in_air = False
         self.armed = False
         self.loop = None
         self.offboard_started = False
         self.manual_offboard_override = False
+        # Held by everything that starts or stops offboard; land/disarm set
+        # landing_requested first so a start already in flight backs out
+        self._offboard_lock = asyncio.Lock()
+        self.landing_requested = False
+        self.time_to_control = None
         
-        # Control parameters
-        self.throttle = 0.0
-        self.yaw = 0.0
-        self.pitch = 0.0
-        self.roll = 0.0
+        # Control parameters - latest value, streamed at a fixed rate while in offboard
+        self.controls = ControlState()
+        self._logged_controls_version = 0
+        # Sticks -> velocity: expo, slew, battery caps and the altitude/geofence envelope
+        self.shaping = dict(shaping or {})
+        self.shaper = ControlShaper(**self.shaping)
+        self.setpoint_streamer = SetpointStreamer(self.build_setpoint, self.send_setpoint,
+                                                  rate_hz=setpoint_rate_hz)
         
         # Position and attitude info
         self.position = (0, 0, 0)
         self.attitude = (0, 0, 0)
         self.battery = 0.0
         self.gps_fix = 0
+        self.flight_mode = "UNKNOWN"
+        self.velocity = (0, 0, 0)
+        self.link_state = LINK_UNKNOWN
+        
+        # Latest published snapshot (replaced atomically, never mutated)
+        self._snapshot_seq = 0
+        self.snapshot = TelemetrySnapshot()
+        self.snapshot_listeners = []
+        self._waiters = []
+        
+        # Telemetry streams, at the rates requested by the profile (None = autopilot defaults)
+        self.telemetry = TelemetryHub()
+        self._register_streams()
+        self.rate_profile = rate_profile
+        self.stream_rates = resolve_profile(rate_profile)
+        self._rate_check = None
+        
+        # Link health supervisor - detects a lost link and reconnects
+        self.link = LinkMonitor(self, expected_rates=self.stream_rates)
+        
+        # Flight actions: prioritized, deduplicated, cancellable
+        self.commands = CommandScheduler()
         
     async def connect(self, connection_string="udp://:14540"):
         """Connect to the drone"""
-        print(f"🔗 Connecting to drone: {connection_string}")
+        log.info("🔗 Connecting to drone: %s", connection_string)
         
         try:
             await self.drone.connect(system_address=connection_string)
             
             # Wait for connection
-            print("⏳ Waiting for drone connection...")
+            log.info("⏳ Waiting for drone connection...")
             async for state in self.drone.core.connection_state():
                 if state.is_connected:
-                    print("✅ Connected to drone!")
+                    log.info("✅ Connected to drone!")
                     self.connected = True
+                    self.publish_snapshot()
                     break
             
-            # Start status monitoring
-            asyncio.create_task(self.monitor_status())
-            asyncio.create_task(self.monitor_position())
-            asyncio.create_task(self.monitor_attitude_enhanced())  # Enhanced attitude monitoring
-            asyncio.create_task(self.monitor_battery())
-            asyncio.create_task(self.monitor_gps())
+            # Request stream rates, then start supervised telemetry streams and the link health monitor
+            await self.apply_stream_rates()
+            self.telemetry.start()
+            self.link.start()
             
-            print("📊 Enhanced status monitoring started")
+            log.info("📊 Telemetry hub started (%s streams)", len(self.telemetry.streams))
             
         except Exception as e:
-            print(f"❌ Connection failed: {e}")
+            log.error("❌ Connection failed: %s", e)
+    
+    async def apply_stream_rates(self):
+        """Ask the autopilot for the configured stream rates (on connect and every reconnect)"""
+        if not self.stream_rates:
+            return
+        await apply_rates(self.drone.telemetry, self.stream_rates)
+        # Restart the settle window: a check left over from before a reconnect
+        # would measure the freshly reset stream stats
+        if self._rate_check is not None:
+            self._rate_check.cancel()
+        self._rate_check = asyncio.create_task(self._check_stream_rates())
     
-    async def monitor_status(self):
-        """Monitor drone status"""
-        async for is_armed in self.drone.telemetry.armed():
-            self.armed = is_armed
+    async def _check_stream_rates(self, settle_s=5.0):
+        """Log requested vs achieved rates once the streams have settled"""
+        await asyncio.sleep(settle_s)
+        log_rate_report(self.rate_report())
+    
+    def rate_report(self):
+        """Requested vs measured rate for every telemetry stream"""
+        return rate_report(self.telemetry, self.stream_rates)
+    
+    def publish_snapshot(self):
+        """Publish the current state as a new immutable snapshot"""
+        self._snapshot_seq += 1
+        self.snapshot = TelemetrySnapshot(
+            seq=self._snapshot_seq,
+            timestamp=time.monotonic(),
+            connected=self.connected,
+            armed=self.armed,
+            in_air=self.in_air,
+            position=self.position,
+            attitude=self.attitude,
+            battery=self.battery,
+            gps_fix=self.gps_fix,
+            flight_mode=self.flight_mode,
+            velocity=self.velocity,
+            link=self.link_state,
+            received=self.telemetry.arrival,
+        )
+        for listener in self.snapshot_listeners:
+            listener(self.snapshot)
+        if self._waiters:
+            self._wake_waiters(self.snapshot)
+        return self.snapshot
+    
+    def _wake_waiters(self, snapshot):
+        waiting = []
+        for condition, future in self._waiters:
+            if future.done():
+                continue
+            if condition(snapshot):
+                future.set_result(snapshot)
+            else:
+                waiting.append((condition, future))
+        self._waiters = waiting
+    
+    async def wait_until(self, condition, timeout):
+        """Wait until `condition(snapshot)` holds for the current or a newly published snapshot
         
-        async for is_in_air in self.drone.telemetry.in_air():
-            old_state = self.in_air
-            self.in_air = is_in_air
-            
-            if is_in_air and not old_state:
-                print("🛫 Drone is now IN AIR - RC controls can be used!")
-                await self.start_offboard_mode()
-            elif not is_in_air and old_state:
-                print("🛬 Drone has LANDED - RC controls disabled")
-            
-            if not is_in_air and self.offboard_started:
-                await self.stop_offboard_mode()
-    
-    async def monitor_position(self):
-        """Monitor drone position"""
-        async for position in self.drone.telemetry.position():
-            self.position = (position.latitude_deg, position.longitude_deg, 
-                           position.relative_altitude_m)
-    
-    async def monitor_attitude_enhanced(self):
-        """Enhanced attitude monitoring with better data handling"""
-        print("🎯 Starting enhanced attitude monitoring...")
+        Wakes on the publish that satisfies it, with no polling delay.
+        Returns that snapshot, or None if `timeout` seconds pass first.
+        """
+        if condition(self.snapshot):
+            return self.snapshot
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((condition, future))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            if not future.done():
+                future.cancel()
+    
+    def is_airborne(self, snapshot):
+        """In the air, or high enough that in_air is evidently lagging"""
+        return snapshot.in_air or snapshot.position[2] > self.AIRBORNE_ALTITUDE
+    
+    def reached_takeoff_altitude(self, snapshot):
+        """Close enough to TAKEOFF_ALTITUDE to hand over from PX4's takeoff climb"""
+        return snapshot.position[2] >= self.HANDOVER_FRACTION * self.TAKEOFF_ALTITUDE
+    
+    def add_snapshot_listener(self, listener):
+        """Call `listener(snapshot)` on the asyncio thread after every publish"""
+        self.snapshot_listeners.append(listener)
+    
+    def remove_snapshot_listener(self, listener):
+        if listener in self.snapshot_listeners:
+            self.snapshot_listeners.remove(listener)
+    
+    def _register_streams(self):
+        """Register every telemetry stream with the hub"""
+        hub = self.telemetry
+        hub.register("armed", lambda: self.drone.telemetry.armed(), self.on_armed)
+        hub.register("in_air", lambda: self.drone.telemetry.in_air(), self.on_in_air)
+        hub.register("position", lambda: self.drone.telemetry.position(), self.on_position)
+        hub.register("attitude_euler", lambda: self.drone.telemetry.attitude_euler(), self.on_attitude)
+        hub.register("battery", lambda: self.drone.telemetry.battery(), self.on_battery)
+        hub.register("gps_info", lambda: self.drone.telemetry.gps_info(), self.on_gps_info)
+        hub.register("flight_mode", lambda: self.drone.telemetry.flight_mode(), self.on_flight_mode)
+        hub.register("velocity_ned", lambda: self.drone.telemetry.velocity_ned(), self.on_velocity)
+    
+    def on_armed(self, is_armed):
+        """Handle armed state updates"""
+        self.armed = is_armed
+        self.publish_snapshot()
+    
+    async def on_in_air(self, is_in_air):
+        """Handle in-air state updates"""
+        old_state = self.in_air
+        self.in_air = is_in_air
+        self.publish_snapshot()
         
-        last_print_time = asyncio.get_event_loop().time()
-        print_interval = 2.0  # Print every 2 seconds
+        # Offboard is started by takeoff() (or the manual override), not here: starting it
+        # as soon as in_air flips would replace the takeoff climb with a hold near the ground
+        if is_in_air and not old_state:
+            log.info("🛫 Drone is now IN AIR")
+        elif not is_in_air and old_state:
+            log.info("🛬 Drone has LANDED - RC controls disabled")
         
-        async for attitude in self.drone.telemetry.attitude_euler():
-            current_time = asyncio.get_event_loop().time()
-            
-            # Convert to degrees
-            roll_deg = math.degrees(attitude.roll_rad)
-            pitch_deg = math.degrees(attitude.pitch_rad) 
-            yaw_deg = math.degrees(attitude.yaw_rad)
-            
-            # Update attitude
-            self.attitude = (roll_deg, pitch_deg, yaw_deg)
-            
-            # Print periodically for debugging
-            if current_time - last_print_time >= print_interval:
-                print(f"📊 Attitude - Roll: {roll_deg:6.1f}°, Pitch: {pitch_deg:6.1f}°, Yaw: {yaw_deg:6.1f}°")
-                last_print_time = current_time
-                
-                # Also print if we have significant movement
-                if abs(roll_deg) > 10 or abs(pitch_deg) > 10:
-                    print(f"🎢 Significant movement detected!")
-    
-    async def monitor_battery(self):
-        """Monitor battery status"""
-        async for battery in self.drone.telemetry.battery():
-            self.battery = battery.remaining_percent * 100
-    
-    async def monitor_gps(self):
-        """Monitor GPS status"""
-        async for gps_info in self.drone.telemetry.gps_info():
-            old_fix = self.gps_fix
-            self.gps_fix = gps_info.fix_type.value
+        if not is_in_air and self.offboard_started:
+            await self.stop_offboard_mode()
+    
+    def on_position(self, position):
+        """Handle position updates"""
+        self.position = (position.latitude_deg, position.longitude_deg, 
+                         position.relative_altitude_m)
+        self.publish_snapshot()
+    
+    def on_attitude(self, attitude):
+        """Handle attitude updates"""
+        # Convert to degrees
+        roll_deg = math.degrees(attitude.roll_rad)
+        pitch_deg = math.degrees(attitude.pitch_rad) 
+        yaw_deg = math.degrees(attitude.yaw_rad)
+        
+        # Update attitude
+        self.attitude = (roll_deg, pitch_deg, yaw_deg)
+        self.publish_snapshot()
+        
+        # Debug output - rate-limited, and free when debug is off
+        if attitude_log.isEnabledFor(logging.DEBUG):
+            attitude_log.debug("📊 Attitude - Roll: %6.1f°, Pitch: %6.1f°, Yaw: %6.1f°", roll_deg, pitch_deg, yaw_deg)
             
-            if self.gps_fix != old_fix:
-                fix_names = {0: "No GPS", 1: "No Fix", 2: "2D Fix", 3: "3D Fix", 4: "DGPS", 5: "RTK Float", 6: "RTK Fixed"}
-                fix_name = fix_names.get(self.gps_fix, f"Unknown ({self.gps_fix})")
-                print(f"🛰️ GPS status: {fix_name} ({gps_info.num_satellites} satellites)")
+            # Also report significant movement
+            if abs(roll_deg) > 10 or abs(pitch_deg) > 10:
+                attitude_log.debug("🎢 Significant movement detected!")
+    
+    def on_battery(self, battery):
+        """Handle battery updates"""
+        self.battery = battery.remaining_percent * 100
+        self.publish_snapshot()
+    
+    def on_gps_info(self, gps_info):
+        """Handle GPS updates"""
+        old_fix = self.gps_fix
+        self.gps_fix = gps_info.fix_type.value
+        self.publish_snapshot()
+        
+        if self.gps_fix != old_fix:
+            fix_names = {0: "No GPS", 1: "No Fix", 2: "2D Fix", 3: "3D Fix", 4: "DGPS", 5: "RTK Float", 6: "RTK Fixed"}
+            fix_name = fix_names.get(self.gps_fix, f"Unknown ({self.gps_fix})")
+            log.info("🛰️ GPS status: %s (%s satellites)", fix_name, gps_info.num_satellites)
+    
+    def on_flight_mode(self, flight_mode):
+        """Handle flight mode updates"""
+        self.flight_mode = flight_mode.name
+        self.publish_snapshot()
+    
+    def on_velocity(self, velocity):
+        """Handle NED velocity updates"""
+        self.velocity = (velocity.north_m_s, velocity.east_m_s, velocity.down_m_s)
+        self.publish_snapshot()
+    
+    async def perform(self, action):
+        """Run a flight action (a name from ACTIONS) through the command scheduler and return its result"""
+        priority, timeout, supersedes = self.ACTIONS[action]
+        future = self.commands.submit(action, getattr(self, action), priority, timeout, supersedes)
+        # Shielded: a caller giving up must not cancel the command for everyone else waiting on it
+        return await asyncio.shield(future)
+    
+    def request(self, action):
+        """Queue a flight action from any thread; returns a concurrent.futures.Future with its result"""
+        return asyncio.run_coroutine_threadsafe(self.perform(action), self.loop)
+    
+    def cancel_action(self, action):
+        """Cancel a queued or running flight action (any thread)"""
+        self.loop.call_soon_threadsafe(self.commands.cancel, action)
     
     async def arm(self):
         """Arm the drone"""
-        print("🟡 Attempting to arm...")
+        log.info("🟡 Attempting to arm...")
         if not self.connected:
-            print("❌ Not connected to drone")
+            log.error("❌ Not connected to drone")
             return False
         
         try:
+            self.landing_requested = False
             await self.drone.action.arm()
-            print("✅ Drone armed successfully!")
+            log.info("✅ Drone armed successfully!")
             return True
         except Exception as e:
-            print(f"❌ Arming failed: {e}")
+            log.error("❌ Arming failed: %s", e)
             return False
     
     async def disarm(self):
         """Disarm the drone"""
-        print("🟡 Attempting to disarm...")
+        log.info("🟡 Attempting to disarm...")
+        self.landing_requested = True
         try:
-            if self.offboard_started:
-                await self.stop_offboard_mode()
+            async with self._offboard_lock:
+                if self.offboard_started:
+                    await self._stop_offboard()
             await self.drone.action.disarm()
-            print("✅ Drone disarmed successfully!")
+            log.info("✅ Drone disarmed successfully!")
             return True
         except Exception as e:
-            print(f"❌ Disarming failed: {e}")
+            log.error("❌ Disarming failed: %s", e)
             return False
     
     async def takeoff(self):
-        """Takeoff to 5 meters - Enhanced version"""
-        print("🚀 Attempting takeoff...")
+        """Takeoff to TAKEOFF_ALTITUDE and hand over to RC control as soon as the climb gets there"""
+        log.info("🚀 Attempting takeoff...")
         
         if not self.armed:
-            print("🟡 Drone not armed, arming first...")
+            log.info("🟡 Drone not armed, arming first...")
             armed = await self.arm()
             if not armed:
                 return False
         
         try:
-            await self.drone.action.set_takeoff_altitude(5.0)
+            self.landing_requested = False
+            await self.drone.action.set_takeoff_altitude(self.TAKEOFF_ALTITUDE)
+            lat, lon, _ = self.position
+            if lat or lon:
+                self.shaper.set_home(lat, lon)
             await self.drone.action.takeoff()
-            print("✅ Takeoff command sent successfully!")
+            started = time.monotonic()
+            log.info("✅ Takeoff command sent successfully!")
             
-            # Wait for takeoff
-            await asyncio.sleep(8)
+            # Wake the moment the climb reaches the takeoff altitude; starting offboard
+            # earlier would replace PX4's climb with a zero-stick hold near the ground
+            snapshot = await self.wait_until(self.reached_takeoff_altitude, self.TAKEOFF_TIMEOUT)
+            if snapshot is None:
+                snapshot = self.snapshot
+                if not self.is_airborne(snapshot):
+                    log.error("❌ Not airborne after %.0fs", self.TAKEOFF_TIMEOUT)
+                    return False
+                # Airborne but short of the target (e.g. altitude not reported): hand over anyway
+                log.warning("⚠️ Only at %.1fm after %.0fs, taking RC control below the takeoff altitude",
+                            snapshot.position[2], self.TAKEOFF_TIMEOUT)
             
             # If still not in air but at altitude, override
-            if not self.in_air and self.position[2] > 2.0:
-                print("🔄 Overriding in_air status (high altitude detected)")
+            if not snapshot.in_air:
+                log.info("🔄 Overriding in_air status (altitude %.1fm)", snapshot.position[2])
                 self.in_air = True
-                await self.start_offboard_mode()
-                return True
-                
-            return self.in_air
+                self.publish_snapshot()
+            
+            if not await self.start_offboard_mode():
+                return False
+            self.time_to_control = time.monotonic() - started
+            log.info("⏱️ RC control available %.2fs after the takeoff command (%.1fm)",
+                     self.time_to_control, snapshot.position[2])
+            return True
             
         except Exception as e:
-            print(f"❌ Takeoff failed: {e}")
+            log.error("❌ Takeoff failed: %s", e)
             return False
     
     async def land(self):
         """Land the drone"""
-        print("🛬 Attempting to land...")
+        log.info("🛬 Attempting to land...")
+        self.landing_requested = True
         try:
-            if self.offboard_started:
-                await self.stop_offboard_mode()
+            async with self._offboard_lock:
+                if self.offboard_started:
+                    await self._stop_offboard()
             await self.drone.action.land()
-            print("✅ Land command sent successfully!")
+            log.info("✅ Land command sent successfully!")
             return True
         except Exception as e:
-            print(f"❌ Landing failed: {e}")
+            log.error("❌ Landing failed: %s", e)
             return False
     
     async def start_offboard_mode(self):
         """Start offboard mode for RC controls"""
-        if self.offboard_started:
-            return True
-            
-        print("🟡 Starting offboard mode for RC controls...")
-        try:
-            await self.drone.offboard.set_velocity_body(VelocityBodyYawspeed(0, 0, 0, 0))
-            await self.drone.offboard.start()
-            print("✅ Offboard mode started successfully!")
-            print("🎮 RC CONTROLS ARE NOW ACTIVE - Move the sliders!")
-            self.offboard_started = True
-            return True
-        except OffboardError as e:
-            print(f"❌ Failed to start offboard mode: {e}")
-            return False
+        # Takeoff and the in_air handler may both ask at the same moment
+        async with self._offboard_lock:
+            if self.offboard_started:
+                return True
+                
+            log.info("🟡 Starting offboard mode for RC controls...")
+            try:
+                await self.drone.offboard.set_velocity_body(VelocityBodyYawspeed(0, 0, 0, 0))
+                self.shaper.reset()
+                await self.drone.offboard.start()
+                if self.landing_requested:
+                    # Land or disarm came in while offboard was starting: hand back to them
+                    log.warning("⛔ Landing requested while offboard was starting, leaving offboard")
+                    await self.drone.offboard.stop()
+                    return False
+                log.info("✅ Offboard mode started successfully!")
+                log.info("🎮 RC CONTROLS ARE NOW ACTIVE - Move the sliders!")
+                self.offboard_started = True
+                self.setpoint_streamer.start()
+                return True
+            except OffboardError as e:
+                log.error("❌ Failed to start offboard mode: %s", e)
+                return False
     
     async def stop_offboard_mode(self):
         """Stop offboard mode"""
+        async with self._offboard_lock:
+            return await self._stop_offboard()
+    
+    async def _stop_offboard(self):
+        # Caller holds _offboard_lock
         if not self.offboard_started:
             return True
             
+        await self.setpoint_streamer.stop()
         try:
             await self.drone.offboard.stop()
-            print("✅ Offboard mode stopped")
+            log.info("✅ Offboard mode stopped")
             self.offboard_started = False
             return True
         except OffboardError as e:
-            print(f"❌ Failed to stop offboard mode: {e}")
+            log.error("❌ Failed to stop offboard mode: %s", e)
             return False
     
     async def manual_takeoff_override(self):
-        """Manual override for takeoff detection"""
-        print("🔄 Manual takeoff override activated!")
-        if self.position[2] > 2.0:
-            print(f"🎯 Overriding in_air status (altitude: {self.position[2]:.1f}m)")
+        """Manual override for takeoff detection (waits briefly for the vehicle to climb through AIRBORNE_ALTITUDE)"""
+        log.info("🔄 Manual takeoff override activated!")
+        snapshot = await self.wait_until(lambda s: s.position[2] > self.AIRBORNE_ALTITUDE, self.OVERRIDE_TIMEOUT)
+        if snapshot is not None:
+            log.info("🎯 Overriding in_air status (altitude: %.1fm)", snapshot.position[2])
             self.in_air = True
+            self.publish_snapshot()
             await self.start_offboard_mode()
             return True
         else:
-            print("❌ Cannot override - altitude too low")
+            log.error("❌ Cannot override - altitude too low")
             return False
     
     async def quick_fix_offboard(self):
         """Quick fix for current situation"""
-        print("🔧 Applying quick fix for offboard mode...")
+        log.info("🔧 Applying quick fix for offboard mode...")
+        self.landing_requested = False
         try:
-            await self.drone.offboard.set_velocity_body(VelocityBodyYawspeed(0, 0, 0, 0))
-            await self.drone.offboard.start()
-            print("✅ Offboard mode started!")
-            self.offboard_started = True
+            async with self._offboard_lock:
+                await self.drone.offboard.set_velocity_body(VelocityBodyYawspeed(0, 0, 0, 0))
+                self.shaper.reset()
+                await self.drone.offboard.start()
+                log.info("✅ Offboard mode started!")
+                self.offboard_started = True
+                self.setpoint_streamer.start()
             self.in_air = True
+            self.publish_snapshot()
             return True
         except Exception as e:
-            print(f"❌ Quick fix failed: {e}")
+            log.error("❌ Quick fix failed: %s", e)
             return False
     
     async def test_gyroscope(self):
         """Test method to verify gyroscope data"""
-        print("🧪 Testing gyroscope data...")
+        log.info("🧪 Testing gyroscope data...")
         
         try:
             # Get a single attitude reading
@@ -259,52 +495,59 @@ class DroneController:
                 pitch_deg = math.degrees(attitude.pitch_rad)
                 yaw_deg = math.degrees(attitude.yaw_rad)
                 
-                print(f"🧭 Gyro Test - Roll: {roll_deg:.1f}°, Pitch: {pitch_deg:.1f}°, Yaw: {yaw_deg:.1f}°")
+                log.info("🧭 Gyro Test - Roll: %.1f°, Pitch: %.1f°, Yaw: %.1f°", roll_deg, pitch_deg, yaw_deg)
                 break  # Just get one reading
                 
             return True
         except Exception as e:
-            print(f"❌ Gyroscope test failed: {e}")
+            log.error("❌ Gyroscope test failed: %s", e)
             return False
     
-    async def set_rc_controls(self):
-        """Set RC-like controls using offboard mode"""
-        if not self.in_air:
-            return
+    def build_setpoint(self):
+        """Build the velocity setpoint for the current control state"""
+        shaped = self.shaper.shape(self.controls.values, self.snapshot)
+        forward_velocity, right_velocity, up_velocity, yaw_speed = shaped.tolist()
+        down_velocity = -up_velocity
         
-        if not self.offboard_started:
-            success = await self.start_offboard_mode()
-            if not success:
-                return
+        # Report each new non-trivial input once, not on every streamed setpoint
+        if (controls_log.isEnabledFor(logging.DEBUG) and
+                self.controls.version != self._logged_controls_version):
+            self._logged_controls_version = self.controls.version
+            if active_axes(shaped):
+                controls_log.debug("🎮 RC Controls - Fwd: %.1fm/s, Right: %.1fm/s, Down: %.1fm/s, Yaw: %.1f°/s",
+                                   forward_velocity, right_velocity, down_velocity, yaw_speed)
+        
+        return VelocityBodyYawspeed(
+            forward_m_s=forward_velocity,
+            right_m_s=right_velocity,
+            down_m_s=down_velocity,
+            yawspeed_deg_s=yaw_speed
+        )
     
-        try:
-            forward_velocity = self.pitch * 3.0
-            right_velocity = self.roll * 3.0
-            down_velocity = -self.throttle * 2.0
-            yaw_speed = self.yaw * 60.0
-            
-            if any([abs(forward_velocity) > 0.1, abs(right_velocity) > 0.1, 
-                    abs(down_velocity) > 0.1, abs(yaw_speed) > 1.0]):
-                print(f"🎮 RC Controls - Fwd: {forward_velocity:.1f}m/s, Right: {right_velocity:.1f}m/s, Down: {down_velocity:.1f}m/s, Yaw: {yaw_speed:.1f}°/s")
-            
-            velocity_command = VelocityBodyYawspeed(
-                forward_m_s=forward_velocity,
-                right_m_s=right_velocity,
-                down_m_s=down_velocity,
-                yawspeed_deg_s=yaw_speed
-            )
-            
-            await self.drone.offboard.set_velocity_body(velocity_command)
-            
-        except Exception as e:
-            print(f"❌ Control command failed: {e}")
-    
-    def update_controls(self, throttle=0, yaw=0, pitch=0, roll=0):
-        """Update control inputs from GUI"""
-        self.throttle = max(-1.0, min(1.0, throttle))
-        self.yaw = max(-1.0, min(1.0, yaw))
-        self.pitch = max(-1.0, min(1.0, pitch))
-        self.roll = max(-1.0, min(1.0, roll))
+    async def send_setpoint(self, setpoint):
+        """Send one velocity setpoint to the offboard plugin"""
+        await self.drone.offboard.set_velocity_body(setpoint)
+    
+    @property
+    def throttle(self):
+        return self.controls.values[0]
+    
+    @property
+    def yaw(self):
+        return self.controls.values[1]
+    
+    @property
+    def pitch(self):
+        return self.controls.values[2]
+    
+    @property
+    def roll(self):
+        return self.controls.values[3]
+    
+    def update_controls(self, throttle=None, yaw=None, pitch=None, roll=None):
+        """Update control inputs from GUI
         
-        if self.in_air:
-            asyncio.run_coroutine_threadsafe(self.set_rc_controls(), self.loop)
\ No newline at end of file
+        Only overwrites the latest-value control state; the setpoint streamer
+        picks it up on its next tick. Axes left as None keep their value.
+        """
+        self.controls.set(throttle=throttle, yaw=yaw, pitch=pitch, roll=roll)
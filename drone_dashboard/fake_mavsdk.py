@@ -0,0 +1,154 @@
+import asyncio
+import math
+from types import SimpleNamespace
+
+# Default emission rate per telemetry stream (Hz)
+DEFAULT_RATES = {
+    "armed": 1,
+    "in_air": 1,
+    "position": 10,
+    "attitude_euler": 50,
+    "battery": 1,
+    "gps_info": 1,
+    "flight_mode": 1,
+    "velocity_ned": 10,
+}
+
+
+class _Enum(SimpleNamespace):
+    pass
+
+
+async def _stream(rate_hz, make_sample):
+    """Yield `make_sample(i)` at `rate_hz`, in bursts when the rate exceeds the loop's timer resolution"""
+    loop = asyncio.get_running_loop()
+    period = 1.0 / rate_hz
+    start = loop.time()
+    i = 0
+    while True:
+        due = int((loop.time() - start) / period) + 1
+        while i < due:
+            yield make_sample(i)
+            i += 1
+        await asyncio.sleep(max(0.0, start + i * period - loop.time()))
+
+
+class FakeTelemetry:
+    """Synthetic telemetry plugin emitting the streams DroneController subscribes to
+
+    The `set_rate_*` calls change the rate of streams subscribed afterwards,
+    like an autopilot honouring MAV_CMD_SET_MESSAGE_INTERVAL.
+    """
+
+    def __init__(self, rates):
+        self.rates = rates
+
+    async def set_rate_position(self, rate_hz):
+        self.rates["position"] = rate_hz
+
+    async def set_rate_attitude(self, rate_hz):
+        self.rates["attitude_euler"] = rate_hz
+
+    async def set_rate_velocity_ned(self, rate_hz):
+        self.rates["velocity_ned"] = rate_hz
+
+    async def set_rate_battery(self, rate_hz):
+        self.rates["battery"] = rate_hz
+
+    async def set_rate_gps_info(self, rate_hz):
+        self.rates["gps_info"] = rate_hz
+
+    async def set_rate_in_air(self, rate_hz):
+        self.rates["in_air"] = rate_hz
+
+    def armed(self):
+        return _stream(self.rates["armed"], lambda i: True)
+
+    def in_air(self):
+        return _stream(self.rates["in_air"], lambda i: True)
+
+    def position(self):
+        rate = self.rates["position"]
+        return _stream(rate, lambda i: SimpleNamespace(
+            latitude_deg=47.397742 + 1e-6 * math.sin(i / rate),
+            longitude_deg=8.545594 + 1e-6 * math.cos(i / rate),
+            absolute_altitude_m=488.0 + 10.0,
+            relative_altitude_m=10.0 + math.sin(i / rate)))
+
+    def attitude_euler(self):
+        rate = self.rates["attitude_euler"]
+        return _stream(rate, lambda i: SimpleNamespace(
+            roll_rad=0.3 * math.sin(i / rate),
+            pitch_rad=0.2 * math.cos(i / rate),
+            yaw_rad=(i / rate) % (2 * math.pi) - math.pi,
+            timestamp_us=int(1e6 * i / rate)))
+
+    def battery(self):
+        rate = self.rates["battery"]
+        return _stream(rate, lambda i: SimpleNamespace(
+            voltage_v=16.0, remaining_percent=max(0.0, 1.0 - i / rate / 3600.0)))
+
+    def gps_info(self):
+        return _stream(self.rates["gps_info"], lambda i: SimpleNamespace(
+            num_satellites=12, fix_type=_Enum(value=3, name="FIX_3D")))
+
+    def flight_mode(self):
+        return _stream(self.rates["flight_mode"], lambda i: _Enum(value=7, name="OFFBOARD"))
+
+    def velocity_ned(self):
+        rate = self.rates["velocity_ned"]
+        return _stream(rate, lambda i: SimpleNamespace(
+            north_m_s=math.cos(i / rate), east_m_s=math.sin(i / rate), down_m_s=0.0))
+
+
+class FakeCore:
+    async def connection_state(self):
+        yield SimpleNamespace(is_connected=True, uuid=1)
+        while True:
+            await asyncio.sleep(3600)
+
+
+class FakeAction:
+    async def arm(self):
+        pass
+
+    async def disarm(self):
+        pass
+
+    async def set_takeoff_altitude(self, altitude):
+        pass
+
+    async def takeoff(self):
+        pass
+
+    async def land(self):
+        pass
+
+
+class FakeOffboard:
+    def __init__(self):
+        self.setpoints = 0
+
+    async def set_velocity_body(self, setpoint):
+        self.setpoints += 1
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+
+class FakeSystem:
+    """Stand-in for `mavsdk.System` that needs no mavsdk_server or vehicle"""
+
+    def __init__(self, rates=None):
+        self.rates = dict(DEFAULT_RATES)
+        self.rates.update(rates or {})
+        self.core = FakeCore()
+        self.telemetry = FakeTelemetry(self.rates)
+        self.action = FakeAction()
+        self.offboard = FakeOffboard()
+
+    async def connect(self, system_address=None):
+        pass
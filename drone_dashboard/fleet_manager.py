@@ -0,0 +1,139 @@
+import asyncio
+import logging
+
+from mavsdk import System
+
+from drone_controller import DroneController
+
+log = logging.getLogger(__name__)
+
+BASE_UDP_PORT = 14540
+BASE_GRPC_PORT = 50051
+
+
+class FleetManager:
+    """Runs and supervises several DroneController instances on one asyncio loop
+
+    Each vehicle gets its own MAVSDK System (and therefore its own
+    mavsdk_server on a separate gRPC port), so vehicles never share a
+    connection. `start()` spawns one supervisor task per vehicle that keeps
+    retrying `connect()` with backoff until the link is up. The focused
+    vehicle is the one the dashboard displays and commands; switching focus
+    never reconnects anything.
+    """
+
+    def __init__(self, retry_delay=2.0, max_retry_delay=30.0, rate_profile=None, shaping=None):
+        self.vehicles = {}
+        self.rate_profile = rate_profile
+        self.shaping = shaping
+        self.connection_strings = {}
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.focused = None
+        self.focus_listeners = []
+        self._loop = None
+        self._tasks = {}
+
+    @classmethod
+    def from_connection_strings(cls, connection_strings, **kwargs):
+        fleet = cls(**kwargs)
+        for i, connection_string in enumerate(connection_strings):
+            fleet.add_vehicle(f"UAV{i + 1}", connection_string, grpc_port=BASE_GRPC_PORT + i)
+        return fleet
+
+    @classmethod
+    def sitl(cls, count, **kwargs):
+        """Fleet of `count` PX4 SITL instances on consecutive UDP ports (14540, 14541, ...)"""
+        return cls.from_connection_strings(
+            [f"udp://:{BASE_UDP_PORT + i}" for i in range(count)], **kwargs)
+
+    @property
+    def loop(self):
+        return self._loop
+
+    @loop.setter
+    def loop(self, loop):
+        self._loop = loop
+        for controller in self.vehicles.values():
+            controller.loop = loop
+
+    def add_vehicle(self, name, connection_string, grpc_port=None, controller=None):
+        """Add a vehicle; it is connected by `start()` (or right away if the fleet is running)"""
+        if name in self.vehicles:
+            raise ValueError(f"Vehicle '{name}' already in fleet")
+        if controller is None:
+            port = grpc_port if grpc_port is not None else BASE_GRPC_PORT + len(self.vehicles)
+            controller = DroneController(system=System(port=port), rate_profile=self.rate_profile,
+                                         shaping=self.shaping)
+        controller.loop = self._loop
+        self.vehicles[name] = controller
+        self.connection_strings[name] = connection_string
+        if self.focused is None:
+            self.focused = name
+        if self._tasks:
+            self._start_vehicle(name)
+        return controller
+
+    @property
+    def focused_controller(self):
+        return self.vehicles[self.focused] if self.focused else None
+
+    def set_focus(self, name):
+        """Make `name` the focused vehicle and notify listeners (GUI thread)"""
+        if name not in self.vehicles or name == self.focused:
+            return
+        self.focused = name
+        for listener in self.focus_listeners:
+            listener(name, self.vehicles[name])
+
+    async def start(self):
+        """Spawn a connection supervisor for every vehicle (must run inside the loop)"""
+        self.loop = asyncio.get_running_loop()
+        for name in self.vehicles:
+            self._start_vehicle(name)
+        log.info("🛩️ Fleet started with %d vehicles", len(self.vehicles))
+
+    def _start_vehicle(self, name):
+        self._tasks[name] = asyncio.create_task(self._supervise(name), name=f"fleet:{name}")
+
+    async def _supervise(self, name):
+        controller = self.vehicles[name]
+        delay = self.retry_delay
+        while not controller.connected:
+            await controller.connect(self.connection_strings[name])
+            if controller.connected:
+                break
+            log.warning("⚠️ %s not connected, retrying in %.0fs", name, delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_retry_delay)
+
+    async def stop(self):
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for controller in self.vehicles.values():
+            await controller.commands.stop()
+            await controller.link.stop()
+            await controller.telemetry.stop()
+            await controller.setpoint_streamer.stop()
+
+    def fleet_table(self):
+        """One row per vehicle, built from each controller's latest snapshot"""
+        rows = []
+        for name, controller in self.vehicles.items():
+            snapshot = controller.snapshot
+            rows.append({
+                "name": name,
+                "focused": name == self.focused,
+                "connected": snapshot.connected,
+                "armed": snapshot.armed,
+                "in_air": snapshot.in_air,
+                "altitude_m": snapshot.position[2],
+                "battery": snapshot.battery,
+                "gps_fix": snapshot.gps_fix,
+                "flight_mode": snapshot.flight_mode,
+                "seq": snapshot.seq,
+            })
+        return rows
@@ -0,0 +1,206 @@
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from flight_recorder import (CHUNK_HEADER, CHUNK_MAGIC, FILE_HEADER, FILE_MAGIC,
+                             INDEX_ENTRY, INDEX_HEADER, INDEX_MAGIC, write_index)
+from telemetry_snapshot import TelemetrySnapshot
+
+# Same layout as flight_recorder.INDEX_ENTRY, readable in one np.frombuffer call
+INDEX_DTYPE = np.dtype([("channel", "<u2"), ("count", "<u4"), ("t_first", "<f8"),
+                        ("t_last", "<f8"), ("offset", "<u8")])
+assert INDEX_DTYPE.itemsize == INDEX_ENTRY.size
+
+
+class ChannelIndex:
+    """Chunk table of one channel, sorted by time"""
+
+    def __init__(self, channel_id, name, fields, entries):
+        self.channel_id = channel_id
+        self.name = name
+        self.fields = fields
+        self.width = len(fields) + 1
+        self.t_first = entries["t_first"]
+        self.t_last = entries["t_last"]
+        self.offset = entries["offset"].astype(np.int64)
+        self.count = entries["count"].astype(np.int64)
+
+    @property
+    def samples(self):
+        return int(self.count.sum())
+
+
+class FlightLog:
+    """Memory-mapped reader for logs written by `FlightRecorder`
+
+    Only the file header and the sparse time index (loaded from `<log>.idx`,
+    or built by walking the chunk headers) are parsed up front. Sample data
+    is returned as NumPy views straight into the mapping, without copying.
+    """
+
+    def __init__(self, path, save_index=True):
+        self.path = path
+        self._file = open(path, "rb")
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._parse_header()
+        entries = self._load_index()
+        if entries is None:
+            entries = self._scan_chunks()
+            if save_index:
+                try:
+                    write_index(path, self._size, entries.tolist())
+                except OSError:
+                    pass
+
+        self.channels = {}
+        for channel_id, (name, fields) in enumerate(self._channel_defs):
+            mine = entries[entries["channel"] == channel_id]
+            mine = mine[np.argsort(mine["t_first"], kind="stable")]
+            self.channels[name] = ChannelIndex(channel_id, name, fields, mine)
+
+    def _parse_header(self):
+        buf = self._mmap
+        magic, version, channel_count, self.wall_start, self.monotonic_start = FILE_HEADER.unpack_from(buf, 0)
+        if magic != FILE_MAGIC:
+            raise ValueError(f"{self.path} is not a flight log")
+        self.version = version
+
+        pos = FILE_HEADER.size
+        self._channel_defs = []
+        for _ in range(channel_count):
+            name, pos = _read_str(buf, pos)
+            (field_count,) = struct.unpack_from("<H", buf, pos)
+            pos += 2
+            fields = []
+            for _ in range(field_count):
+                field, pos = _read_str(buf, pos)
+                fields.append(field)
+            self._channel_defs.append((name, tuple(fields)))
+        self._data_start = pos + (-pos % 8)
+
+    def _load_index(self):
+        try:
+            with open(self.path + ".idx", "rb") as f:
+                raw = f.read()
+        except OSError:
+            return None
+        if len(raw) < INDEX_HEADER.size:
+            return None
+        magic, log_size, count = INDEX_HEADER.unpack_from(raw, 0)
+        if magic != INDEX_MAGIC or log_size != self._size:
+            return None
+        return np.frombuffer(raw, dtype=INDEX_DTYPE, count=count, offset=INDEX_HEADER.size)
+
+    def _scan_chunks(self):
+        """Build the index by hopping from chunk header to chunk header"""
+        buf = self._mmap
+        pos = self._data_start
+        entries = []
+        while pos + CHUNK_HEADER.size <= self._size:
+            magic, channel_id, width, count, t_first, t_last = CHUNK_HEADER.unpack_from(buf, pos)
+            data_offset = pos + CHUNK_HEADER.size
+            end = data_offset + 8 * width * count
+            if magic != CHUNK_MAGIC or end > self._size:
+                break  # truncated tail (recorder did not close cleanly)
+            entries.append((channel_id, count, t_first, t_last, data_offset))
+            pos = end
+        return np.array(entries, dtype=INDEX_DTYPE)
+
+    @property
+    def time_range(self):
+        """(first, last) monotonic timestamp over all channels"""
+        firsts = [float(c.t_first[0]) for c in self.channels.values() if len(c.t_first)]
+        lasts = [float(c.t_last[-1]) for c in self.channels.values() if len(c.t_last)]
+        if not firsts:
+            return (self.monotonic_start, self.monotonic_start)
+        return (min(firsts), max(lasts))
+
+    def _chunk_view(self, channel, i):
+        count = int(channel.count[i])
+        return np.frombuffer(self._mmap, dtype="<f8", count=count * channel.width,
+                             offset=int(channel.offset[i])).reshape(count, channel.width)
+
+    def chunks(self, name, t0=None, t1=None):
+        """Yield zero-copy views (rows x [t, *fields]) of a channel within [t0, t1]"""
+        channel = self.channels[name]
+        first = 0 if t0 is None else int(np.searchsorted(channel.t_last, t0, side="left"))
+        last = len(channel.t_first) if t1 is None else int(np.searchsorted(channel.t_first, t1, side="right"))
+        for i in range(first, last):
+            view = self._chunk_view(channel, i)
+            if t0 is not None and channel.t_first[i] < t0:
+                view = view[np.searchsorted(view[:, 0], t0, side="left"):]
+            if t1 is not None and channel.t_last[i] > t1:
+                view = view[:np.searchsorted(view[:, 0], t1, side="right")]
+            if len(view):
+                yield view
+
+    def window(self, name, t0=None, t1=None):
+        """Rows of a channel within [t0, t1]; a view when the window lies in one chunk"""
+        views = list(self.chunks(name, t0, t1))
+        if len(views) == 1:
+            return views[0]
+        if not views:
+            return np.empty((0, self.channels[name].width))
+        return np.concatenate(views)
+
+    def column(self, name, field, t0=None, t1=None):
+        """(timestamps, values) of one field of a channel"""
+        channel = self.channels[name]
+        rows = self.window(name, t0, t1)
+        return rows[:, 0], rows[:, channel.fields.index(field) + 1]
+
+    def sample_at(self, name, t):
+        """Latest row of a channel at or before `t`, or None"""
+        channel = self.channels[name]
+        i = int(np.searchsorted(channel.t_first, t, side="right")) - 1
+        if i < 0:
+            return None
+        view = self._chunk_view(channel, i)
+        j = int(np.searchsorted(view[:, 0], t, side="right")) - 1
+        return view[j]
+
+    def snapshot_at(self, t, seq=0):
+        """Rebuild the TelemetrySnapshot the dashboard would have seen at time `t`"""
+        fields = {"seq": seq, "timestamp": t, "connected": True}
+        for name, key, convert in _SNAPSHOT_FIELDS:
+            if name not in self.channels:
+                continue
+            row = self.sample_at(name, t)
+            if row is not None:
+                fields[key] = convert(row[1:])
+        return TelemetrySnapshot(**fields)
+
+    def close(self):
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # views handed out are still alive; the mapping goes away with them
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Flight log channel -> TelemetrySnapshot field
+_SNAPSHOT_FIELDS = (
+    ("armed", "armed", lambda v: bool(v[0])),
+    ("in_air", "in_air", lambda v: bool(v[0])),
+    ("position", "position", lambda v: tuple(float(x) for x in v)),
+    ("attitude", "attitude", lambda v: tuple(float(x) for x in v)),
+    ("battery", "battery", lambda v: float(v[0])),
+    ("gps", "gps_fix", lambda v: int(v[0])),
+    ("velocity", "velocity", lambda v: tuple(float(x) for x in v)),
+)
+
+
+def _read_str(buf, pos):
+    (length,) = struct.unpack_from("<H", buf, pos)
+    pos += 2
+    return bytes(buf[pos:pos + length]).decode("utf-8"), pos + length
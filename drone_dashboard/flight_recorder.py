@@ -0,0 +1,212 @@
+import logging
+import struct
+import threading
+import time
+from array import array
+
+log = logging.getLogger(__name__)
+
+# Binary flight log layout (little-endian)
+#
+#   file header   FILE_HEADER, then per channel: name, field count, field names
+#                 (strings are uint16 length + UTF-8), zero-padded to 8 bytes
+#   chunks        CHUNK_HEADER followed by `count` rows of `width` float64
+#                 values; column 0 is the monotonic timestamp
+#
+# On close the recorder also writes a sparse time index next to the log
+# (`<log>.idx`): INDEX_HEADER followed by one INDEX_ENTRY per chunk.
+FILE_MAGIC = b"DDFLOG1\0"
+FILE_HEADER = struct.Struct("<8sIIdd")        # magic, version, channel count, wall start, monotonic start
+CHUNK_MAGIC = b"CHNK"
+CHUNK_HEADER = struct.Struct("<4sHHIdd4x")    # magic, channel id, width, count, t_first, t_last
+INDEX_MAGIC = b"DDFIDX1\0"
+INDEX_HEADER = struct.Struct("<8sQI")         # magic, log size, entry count
+INDEX_ENTRY = struct.Struct("<HIddQ")         # channel id, count, t_first, t_last, data offset
+FORMAT_VERSION = 1
+
+# Channel name -> (field names, nominal rate in Hz used to share the RAM budget)
+CHANNELS = {
+    "armed": (("armed",), 1),
+    "in_air": (("in_air",), 1),
+    "position": (("latitude_deg", "longitude_deg", "relative_altitude_m"), 10),
+    "attitude": (("roll_deg", "pitch_deg", "yaw_deg"), 50),
+    "battery": (("remaining_percent",), 1),
+    "gps": (("fix_type",), 1),
+    "velocity": (("north_m_s", "east_m_s", "down_m_s"), 10),
+    "setpoint": (("throttle", "yaw", "pitch", "roll",
+                  "forward_m_s", "right_m_s", "down_m_s", "yawspeed_deg_s"), 20),
+}
+
+
+class ChannelRing:
+    """Preallocated float64 ring buffer of fixed-width rows for one channel"""
+
+    def __init__(self, channel_id, name, fields, capacity):
+        self.channel_id = channel_id
+        self.name = name
+        self.fields = fields
+        self.width = len(fields) + 1
+        self.capacity = max(1, capacity)
+        self.data = array("d", bytes(8 * self.width * self.capacity))
+        self.written = 0
+        self.flushed = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self):
+        return len(self.data) * self.data.itemsize
+
+    def append(self, timestamp, values):
+        width = self.width
+        with self._lock:
+            start = (self.written % self.capacity) * width
+            self.data[start] = timestamp
+            self.data[start + 1:start + width] = array("d", values)
+            self.written += 1
+
+    def drain(self):
+        """Take all rows not yet flushed; return (raw bytes, count, t_first, t_last)"""
+        with self._lock:
+            pending = self.written - self.flushed
+            if pending > self.capacity:
+                # Writer fell behind - the oldest rows have been overwritten
+                self.dropped += pending - self.capacity
+                self.flushed = self.written - self.capacity
+                pending = self.capacity
+            if pending == 0:
+                return None
+
+            first = self.flushed % self.capacity
+            last = first + pending
+            width = self.width
+            if last <= self.capacity:
+                rows = self.data[first * width:last * width]
+            else:
+                rows = self.data[first * width:] + self.data[:(last - self.capacity) * width]
+            self.flushed = self.written
+
+        return rows.tobytes(), pending, rows[0], rows[(pending - 1) * width]
+
+
+class FlightRecorder:
+    """Records every telemetry sample into per-channel ring buffers and a binary log
+
+    `record()` is called on the asyncio thread and only copies a few floats
+    into a preallocated ring. A background writer thread drains the rings to
+    disk every `flush_interval` seconds. Total ring memory is capped at
+    `max_ram_bytes`; if the writer cannot keep up the oldest samples are
+    overwritten and counted as dropped.
+    """
+
+    def __init__(self, path, max_ram_bytes=8 * 1024 * 1024, flush_interval=0.5, channels=CHANNELS):
+        self.path = path
+        self.max_ram_bytes = max_ram_bytes
+        self.flush_interval = flush_interval
+        self.rings = {}
+        self.index = []
+        self.chunks_written = 0
+
+        total_weight = sum(rate * (len(fields) + 1) for fields, rate in channels.values())
+        for channel_id, (name, (fields, rate)) in enumerate(channels.items()):
+            share = max_ram_bytes * rate * (len(fields) + 1) / total_weight
+            capacity = int(share // (8 * (len(fields) + 1)))
+            self.rings[name] = ChannelRing(channel_id, name, fields, capacity)
+
+        self._file = open(path, "wb")
+        self._write_header()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._writer_loop, name="flight-recorder", daemon=True)
+        self._thread.start()
+
+    def _write_header(self):
+        header = bytearray(FILE_HEADER.pack(FILE_MAGIC, FORMAT_VERSION, len(self.rings),
+                                            time.time(), time.monotonic()))
+        for ring in self.rings.values():
+            header += _pack_str(ring.name)
+            header += struct.pack("<H", len(ring.fields))
+            for field in ring.fields:
+                header += _pack_str(field)
+        header += bytes(-len(header) % 8)
+        self._file.write(header)
+        self._offset = len(header)
+
+    def record(self, channel, *values, timestamp=None):
+        """Append one sample to a channel (cheap, safe to call from the asyncio loop)"""
+        self.rings[channel].append(time.monotonic() if timestamp is None else timestamp, values)
+
+    def attach(self, controller):
+        """Record every telemetry stream and streamed setpoint of a DroneController"""
+        hub = controller.telemetry
+        hub.subscribe("armed", lambda sample: self.record("armed", controller.armed))
+        hub.subscribe("in_air", lambda sample: self.record("in_air", controller.in_air))
+        hub.subscribe("position", lambda sample: self.record("position", *controller.position))
+        hub.subscribe("attitude_euler", lambda sample: self.record("attitude", *controller.attitude))
+        hub.subscribe("battery", lambda sample: self.record("battery", controller.battery))
+        hub.subscribe("gps_info", lambda sample: self.record("gps", controller.gps_fix))
+        hub.subscribe("velocity_ned", lambda sample: self.record("velocity", *controller.velocity))
+        controller.setpoint_streamer.listeners.append(
+            lambda setpoint: self.record("setpoint", *controller.controls.values,
+                                         setpoint.forward_m_s, setpoint.right_m_s,
+                                         setpoint.down_m_s, setpoint.yawspeed_deg_s))
+
+    def flush(self):
+        """Drain all rings to disk (called by the writer thread)"""
+        for ring in self.rings.values():
+            drained = ring.drain()
+            if drained is None:
+                continue
+            data, count, t_first, t_last = drained
+            self._file.write(CHUNK_HEADER.pack(CHUNK_MAGIC, ring.channel_id, ring.width,
+                                               count, t_first, t_last))
+            data_offset = self._offset + CHUNK_HEADER.size
+            self._file.write(data)
+            self._offset = data_offset + len(data)
+            self.index.append((ring.channel_id, count, t_first, t_last, data_offset))
+            self.chunks_written += 1
+        self._file.flush()
+
+    def _writer_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                log.error("❌ Flight recorder write failed: %s", e)
+
+    def close(self):
+        """Stop the writer, flush the remaining samples and write the time index"""
+        if self._file.closed:
+            return
+        self._stop.set()
+        self._thread.join()
+        self.flush()
+        self._file.close()
+        write_index(self.path, self._offset, self.index)
+
+    def stats(self):
+        return {
+            "ram_bytes": sum(ring.nbytes for ring in self.rings.values()),
+            "bytes_written": self._offset,
+            "chunks_written": self.chunks_written,
+            "samples": {name: ring.written for name, ring in self.rings.items()},
+            "dropped": {name: ring.dropped for name, ring in self.rings.items()},
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_index(log_path, log_size, entries):
+    """Write the sparse time index for a log"""
+    with open(log_path + ".idx", "wb") as f:
+        f.write(INDEX_HEADER.pack(INDEX_MAGIC, log_size, len(entries)))
+        for entry in entries:
+            f.write(INDEX_ENTRY.pack(*entry))
+
+
+def _pack_str(text):
+    data = text.encode("utf-8")
+    return struct.pack("<H", len(data)) + data
@@ -0,0 +1,187 @@
+import errno
+import logging
+import os
+import select
+import struct
+import threading
+import time
+
+from setpoint_streamer import AXES
+
+log = logging.getLogger(__name__)
+
+# Linux joystick API (linux/joystick.h): struct js_event
+JS_EVENT = struct.Struct("IhBB")  # time (ms), value, type, number
+JS_EVENT_BUTTON = 0x01
+JS_EVENT_AXIS = 0x02
+JS_EVENT_INIT = 0x80
+AXIS_MAX = 32767.0
+
+DEFAULT_DEVICE = "/dev/input/js0"
+
+# Control axis -> (device axis number, inverted). Mode 2 on an Xbox-style pad
+# as the Linux joystick driver numbers it: left stick throttle/yaw, right
+# stick pitch/roll; stick "up" is negative on the device.
+DEFAULT_MAPPING = {
+    "throttle": (1, True),
+    "yaw": (0, False),
+    "pitch": (4, True),
+    "roll": (3, False),
+}
+
+
+def shape(value, deadzone, expo):
+    """Deadzone (rescaled so the output still reaches ±1) followed by a cubic expo curve"""
+    magnitude = abs(value)
+    if magnitude <= deadzone:
+        return 0.0
+    x = min(1.0, (magnitude - deadzone) / (1.0 - deadzone))
+    x = (1.0 - expo) * x + expo * x * x * x
+    return x if value > 0 else -x
+
+
+def encode_event(value, number, kind=JS_EVENT_AXIS, time_ms=0):
+    """One js_event record, e.g. for writing a file-backed fake device"""
+    return JS_EVENT.pack(time_ms & 0xFFFFFFFF, value, kind, number)
+
+
+class JoystickInput:
+    """Reads a Linux joystick device on its own thread and drives the manual controls
+
+    Axis events are read as they arrive; at most `rate_hz` times per second,
+    and only when an axis moved, the four mapped axes are shaped (deadzone,
+    expo) and written with one `sink(throttle=, yaw=, pitch=, roll=)` call,
+    e.g. `controller.update_controls`, so the control state is updated
+    atomically. If the device disappears the sticks are centred and the
+    device is reopened once it is back.
+
+    Any file of js_event records works as a device: a FIFO, or a plain file
+    that is appended to (see `encode_event`).
+    """
+
+    def __init__(self, sink, path=DEFAULT_DEVICE, mapping=None, deadzone=0.05, expo=0.3, rate_hz=100.0,
+                 reopen_delay=1.0):
+        self.sink = sink
+        self.path = path
+        self.mapping = dict(mapping or DEFAULT_MAPPING)
+        self.deadzone = deadzone
+        self.expo = expo
+        self.period = 1.0 / rate_hz
+        self.reopen_delay = reopen_delay
+
+        # Shaped axes as last sent, replaced in one assignment (read by the UI)
+        self.values = (0.0, 0.0, 0.0, 0.0)
+        self.version = 0
+        self.connected = False
+        self.events = 0
+        self.updates = 0
+
+        self._raw = {}
+        self._dirty = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="joystick", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def as_dict(self):
+        return dict(zip(AXES, self.values))
+
+    def stats(self):
+        return {
+            "device": self.path,
+            "connected": self.connected,
+            "events": self.events,
+            "updates": self.updates,
+        }
+
+    def _run(self):
+        missing_logged = False
+        while not self._stop.is_set():
+            try:
+                fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+            except OSError as e:
+                if not missing_logged:
+                    log.warning("⚠️ Joystick %s not available (%s), waiting for it...", self.path, e.strerror)
+                    missing_logged = True
+                self._stop.wait(self.reopen_delay)
+                continue
+            missing_logged = False
+            self.connected = True
+            log.info("🕹️ Joystick %s opened", self.path)
+            try:
+                self._read_loop(fd)
+            except OSError as e:
+                if e.errno not in (errno.ENODEV, errno.EBADF):
+                    log.error("❌ Joystick read failed: %s", e)
+                log.warning("⚠️ Joystick %s disconnected, sticks centred", self.path)
+            finally:
+                os.close(fd)
+                self.connected = False
+                self._raw.clear()
+                self._send((0.0, 0.0, 0.0, 0.0))
+
+    def _read_loop(self, fd):
+        pending = b""
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
+            # Sleep until the next event while the sticks are idle; the first move is sent at once
+            timeout = max(0.0, next_tick - time.monotonic()) if self._dirty else 0.5
+            readable, _, _ = select.select([fd], [], [], timeout)
+            if readable:
+                try:
+                    data = os.read(fd, JS_EVENT.size * 64)
+                except BlockingIOError:
+                    data = None
+                if data:
+                    pending += data
+                    usable = len(pending) - len(pending) % JS_EVENT.size
+                    for _, value, kind, number in JS_EVENT.iter_unpack(pending[:usable]):
+                        self._on_event(value, kind, number)
+                    pending = pending[usable:]
+                elif data == b"":
+                    # End of a file-backed device: wait for more to be appended
+                    self._stop.wait(self.period)
+
+            now = time.monotonic()
+            if now >= next_tick:
+                if self._dirty:
+                    self._dirty = False
+                    self._send(self._shaped())
+                next_tick = max(next_tick + self.period, now)
+
+    def _on_event(self, value, kind, number):
+        self.events += 1
+        if kind & ~JS_EVENT_INIT == JS_EVENT_AXIS:
+            self._raw[number] = max(-1.0, value / AXIS_MAX)
+            self._dirty = True
+
+    def _shaped(self):
+        values = []
+        for axis in AXES:
+            number, inverted = self.mapping[axis]
+            raw = self._raw.get(number, 0.0)
+            value = shape(-raw if inverted else raw, self.deadzone, self.expo)
+            values.append(value)
+        return tuple(values)
+
+    def _send(self, values):
+        if values == self.values:
+            return
+        self.values = values
+        self.version += 1
+        self.updates += 1
+        try:
+            self.sink(**dict(zip(AXES, values)))
+        except Exception as e:
+            log.error("❌ Joystick control update failed: %s", e)
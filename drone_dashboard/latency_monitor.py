@@ -0,0 +1,165 @@
+import json
+import math
+import time
+
+# Stages of a sample's way to the screen, in order:
+#   dispatch - arrival from MAVSDK until the controller published the snapshot
+#   queue    - published until the UI frame picked it up
+#   render   - the panel's render callback
+#   paint    - end of the frame until Tk had redrawn (first idle callback after it)
+#   total    - arrival until painted
+STAGES = ("dispatch", "queue", "render", "paint", "total")
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram: constant memory and O(1) recording at any sample rate
+
+    Buckets grow geometrically (`buckets_per_decade` per factor of ten), so
+    reported percentiles are accurate to a few percent from microseconds to
+    seconds.
+    """
+
+    __slots__ = ("min_ms", "buckets_per_decade", "counts", "count", "total_ms", "max_ms")
+
+    def __init__(self, min_ms=0.01, max_ms=60000.0, buckets_per_decade=20):
+        self.min_ms = min_ms
+        self.buckets_per_decade = buckets_per_decade
+        self.counts = [0] * (int(math.log10(max_ms / min_ms) * buckets_per_decade) + 2)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds):
+        ms = 1000.0 * seconds
+        if ms <= self.min_ms:
+            index = 0
+        else:
+            index = min(int(math.log10(ms / self.min_ms) * self.buckets_per_decade) + 1, len(self.counts) - 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, fraction):
+        """Upper edge of the bucket holding the given fraction of samples, in ms"""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.min_ms * 10.0 ** (index / self.buckets_per_decade), self.max_ms)
+        return self.max_ms
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean": self.total_ms / self.count if self.count else 0.0,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.max_ms,
+        }
+
+    def clear(self):
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+
+class _PanelLatency:
+    __slots__ = ("stages", "renders", "coalesced", "dropped")
+
+    def __init__(self):
+        self.stages = {stage: LatencyHistogram() for stage in STAGES}
+        self.renders = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+
+class LatencyMonitor:
+    """Telemetry-to-pixel latency per render panel, broken down by stage
+
+    Fed by the RenderScheduler on the GUI thread. A snapshot carries
+    `received` (arrival of the sample that produced it) and `timestamp`
+    (publish time); the scheduler adds the render start/end and paint times.
+    `coalesced` counts snapshots a panel never showed because a newer one
+    replaced them first, `dropped` counts renders that raised.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.panels = {}
+
+    def _panel(self, name):
+        panel = self.panels.get(name)
+        if panel is None:
+            panel = self.panels[name] = _PanelLatency()
+        return panel
+
+    def record_render(self, name, snapshot, skipped, start, end, ok=True):
+        """One panel render of `snapshot`; `skipped` is how many newer-than-shown snapshots it superseded"""
+        panel = self._panel(name)
+        panel.coalesced += max(skipped, 0)
+        if not ok:
+            panel.dropped += 1
+            return
+        received = snapshot.received or snapshot.timestamp
+        stages = panel.stages
+        stages["dispatch"].record(snapshot.timestamp - received)
+        stages["queue"].record(start - snapshot.timestamp)
+        stages["render"].record(end - start)
+        panel.renders += 1
+
+    def record_paint(self, name, snapshot, frame_end, painted):
+        panel = self._panel(name)
+        panel.stages["paint"].record(painted - frame_end)
+        panel.stages["total"].record(painted - (snapshot.received or snapshot.timestamp))
+
+    def reset(self):
+        self.started = time.monotonic()
+        self.panels.clear()
+
+    def summary(self, name, stage="total"):
+        panel = self.panels.get(name)
+        return panel.stages[stage].summary() if panel else LatencyHistogram().summary()
+
+    def export(self):
+        """Machine-readable report: per panel, per stage percentiles (ms) and counters"""
+        return {
+            "window_s": time.monotonic() - self.started,
+            "panels": {
+                name: {
+                    "renders": panel.renders,
+                    "coalesced": panel.coalesced,
+                    "dropped": panel.dropped,
+                    "stages_ms": {stage: histogram.summary() for stage, histogram in panel.stages.items()},
+                }
+                for name, panel in self.panels.items()
+            },
+        }
+
+    def write_json(self, path, extra=None):
+        report = self.export()
+        if extra:
+            report.update(extra)
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    def overlay_text(self, names=("attitude", "position")):
+        """Short multi-line summary for the on-screen debug overlay"""
+        lines = ["latency ms   p50    p95    p99"]
+        for name in names:
+            panel = self.panels.get(name)
+            if panel is None:
+                continue
+            for stage in STAGES:
+                s = panel.stages[stage].summary()
+                label = f"{name[:3]} {stage}"
+                lines.append(f"{label:<12}{s['p50']:5.1f}  {s['p95']:5.1f}  {s['p99']:5.1f}")
+            lines.append(f"{name[:3]} renders {panel.renders}  coalesced {panel.coalesced}  dropped {panel.dropped}")
+        return "\n".join(lines)
@@ -0,0 +1,205 @@
+import asyncio
+import logging
+import time
+
+log = logging.getLogger(__name__)
+
+LINK_UNKNOWN = "UNKNOWN"
+LINK_OK = "OK"
+LINK_DEGRADED = "DEGRADED"
+LINK_LOST = "LOST"
+LINK_STATES = (LINK_UNKNOWN, LINK_OK, LINK_DEGRADED, LINK_LOST)
+
+
+class LinkMonitor:
+    """Watches link health from the telemetry hub's per-stream stats and reconnects when it is lost
+
+    The link is DEGRADED when any stream that has been producing goes quiet
+    for `degraded_after` seconds (or several of its own periods, whichever is
+    longer), or falls below half of its `expected_rates` entry. It is LOST
+    when every stream has been silent for `lost_after` seconds or MAVSDK
+    reports the connection down. A lost link marks the controller
+    disconnected, waits for MAVSDK to see the vehicle again (with backoff),
+    re-requests the stream rates and re-subscribes all streams. If no
+    telemetry arrives within `lost_after` of that, the link is LOST again
+    and the next attempt waits with backoff.
+    """
+
+    def __init__(self, controller, expected_rates=None, degraded_after=1.0, lost_after=3.0, check_hz=4.0,
+                 reconnect_delay=1.0, max_reconnect_delay=15.0):
+        self.controller = controller
+        self.expected_rates = dict(expected_rates or {})
+        self.degraded_after = degraded_after
+        self.lost_after = lost_after
+        self.check_interval = 1.0 / check_hz
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self.state = LINK_UNKNOWN
+        self.state_since = time.monotonic()
+        self.reason = ""
+        self.reconnects = 0
+        self.lost_count = 0
+        self._tasks = []
+        self._connection_up = True
+        # When the last reconnect finished (None once telemetry flowed again),
+        # and how many reconnects in a row brought no telemetry back
+        self._reconnected_at = None
+        self._failed_reconnects = 0
+
+    @property
+    def hub(self):
+        return self.controller.telemetry
+
+    def start(self):
+        """Start the health check and the MAVSDK connection-state watcher (must run inside the loop)"""
+        if self._tasks:
+            return
+        self._connection_up = True
+        self._tasks = [asyncio.create_task(self._run(), name="link:monitor"),
+                       asyncio.create_task(self._watch_connection(), name="link:connection")]
+
+    async def stop(self):
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stream_health(self, now=None):
+        """Rate, jitter and time since the last sample for every stream"""
+        now = now if now is not None else time.monotonic()
+        health = {}
+        for name, stats in self.hub.stats.items():
+            age = stats.age(now)
+            health[name] = {
+                "rate_hz": stats.rate(),
+                "expected_hz": self.expected_rates.get(name),
+                "jitter_ms": stats.jitter_ms(),
+                "age_s": age,
+                "samples": stats.samples,
+                "restarts": stats.restarts,
+            }
+        return health
+
+    def evaluate(self, now=None):
+        """Classify the link from the current stream stats; returns `(state, reason)`"""
+        now = now if now is not None else time.monotonic()
+        if not self._connection_up:
+            return LINK_LOST, "MAVSDK reports disconnected"
+
+        ages = {}
+        for name, stats in self.hub.stats.items():
+            age = stats.age(now)
+            if age is not None:
+                ages[name] = age
+        if not ages:
+            if self._reconnected_at is not None and now - self._reconnected_at > self.lost_after:
+                return LINK_LOST, f"no telemetry {now - self._reconnected_at:.1f}s after reconnecting"
+            return LINK_UNKNOWN, "no telemetry yet"
+        freshest = min(ages.values())
+        if freshest > self.lost_after:
+            return LINK_LOST, f"no telemetry for {freshest:.1f}s"
+
+        for name, age in ages.items():
+            stats = self.hub.stats[name]
+            rate = stats.rate()
+            expected = self.expected_rates.get(name)
+            period = 1.0 / (expected or rate) if (expected or rate) else 0.0
+            if age > max(self.degraded_after, 3 * period):
+                return LINK_DEGRADED, f"{name} silent for {age:.1f}s"
+            if expected and len(stats.intervals) >= 10 and rate < 0.5 * expected:
+                return LINK_DEGRADED, f"{name} at {rate:.0f}/{expected:.0f} Hz"
+        return LINK_OK, ""
+
+    def metrics(self):
+        """Link state plus per-stream health, for the UI and logs"""
+        now = time.monotonic()
+        return {
+            "state": self.state,
+            "reason": self.reason,
+            "state_age_s": now - self.state_since,
+            "reconnects": self.reconnects,
+            "lost_count": self.lost_count,
+            "streams": self.stream_health(now),
+        }
+
+    def _set_state(self, state, reason):
+        if state == LINK_OK:
+            self._reconnected_at = None
+            self._failed_reconnects = 0
+        if state == self.state:
+            self.reason = reason
+            return
+        previous = self.state
+        self.state = state
+        self.state_since = time.monotonic()
+        self.reason = reason
+        if state == LINK_OK:
+            log.info("📶 Link %s (was %s)", state, previous)
+        elif state == LINK_UNKNOWN:
+            # Expected right after (re)connecting, until telemetry flows again
+            log.info("📶 Link %s: %s", state, reason)
+        else:
+            log.warning("⚠️ Link %s: %s", state, reason)
+        self.controller.link_state = state
+        self.controller.publish_snapshot()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.check_interval)
+            state, reason = self.evaluate()
+            self._set_state(state, reason)
+            if state == LINK_LOST:
+                await self._reconnect()
+
+    async def _watch_connection(self):
+        try:
+            async for state in self.controller.drone.core.connection_state():
+                if state.is_connected != self._connection_up:
+                    self._connection_up = state.is_connected
+                    log.info("🔗 MAVSDK connection state: %s",
+                             "connected" if state.is_connected else "disconnected")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.error("❌ Connection state watcher failed: %s", e)
+
+    async def _wait_for_connection(self):
+        async for state in self.controller.drone.core.connection_state():
+            if state.is_connected:
+                return
+
+    async def _reconnect(self):
+        """Mark the vehicle disconnected, wait for it to come back and re-subscribe every stream"""
+        self.lost_count += 1
+        self.controller.connected = False
+        self.controller.publish_snapshot()
+
+        if self._reconnected_at is not None:
+            # The previous reconnect brought no telemetry back (MAVSDK may still
+            # see the vehicle, so waiting for the connection would return at once)
+            self._failed_reconnects += 1
+            backoff = min(self.reconnect_delay * 2 ** (self._failed_reconnects - 1), self.max_reconnect_delay)
+            log.warning("⚠️ No telemetry after reconnecting, retrying in %.1fs", backoff)
+            await asyncio.sleep(backoff)
+
+        delay = self.reconnect_delay
+        while True:
+            try:
+                await asyncio.wait_for(self._wait_for_connection(), timeout=delay)
+                break
+            except asyncio.TimeoutError:
+                delay = min(delay * 2, self.max_reconnect_delay)
+                log.warning("⚠️ Vehicle still unreachable, waiting up to %.1fs", delay)
+
+        self.reconnects += 1
+        self._connection_up = True
+        for stats in self.hub.stats.values():
+            stats.reset_window()
+        # The autopilot may have rebooted and forgotten the requested rates
+        await self.controller.apply_stream_rates()
+        await self.hub.restart()
+        self.controller.connected = True
+        self._reconnected_at = time.monotonic()
+        log.info("🔄 Link re-established, %s streams re-subscribed", len(self.hub.streams))
+        self._set_state(LINK_UNKNOWN, "waiting for telemetry")
@@ -0,0 +1,124 @@
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+_listener = None
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full
+
+    The calling thread (Tk or the asyncio loop) therefore never waits on a
+    slow terminal; dropped records are counted.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record):
+        # Formatting happens on the listener thread, not on the caller
+        return record
+
+
+class RateLimitFilter(logging.Filter):
+    """Let through at most `max_per_s` records per call site (logger + message template)"""
+
+    def __init__(self, max_per_s):
+        super().__init__()
+        self.min_interval = 1.0 / max_per_s
+        self.suppressed = 0
+        self._last = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last.get(key, float("-inf")) < self.min_interval:
+                self.suppressed += 1
+                return False
+            self._last[key] = now
+        return True
+
+
+def channel(name, max_per_s):
+    """Logger for a hot-path debug channel, rate-limited to `max_per_s` records per call site
+
+    Callers should guard expensive argument preparation with
+    `logger.isEnabledFor(logging.DEBUG)`, so the channel costs nothing when
+    debug output is off.
+    """
+    logger = logging.getLogger(name)
+    if not any(isinstance(f, RateLimitFilter) for f in logger.filters):
+        logger.addFilter(RateLimitFilter(max_per_s))
+    return logger
+
+
+def parse_module_levels(spec):
+    """Parse "drone_controller=DEBUG,dashboard.attitude=DEBUG" into a dict"""
+    levels = {}
+    for item in (spec or "").split(","):
+        name, sep, level = item.strip().partition("=")
+        if sep:
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def current_levels():
+    """(root level, {logger name: level}) as configured in this process, to repeat in a worker process"""
+    levels = {}
+    for name, logger in logging.Logger.manager.loggerDict.items():
+        if isinstance(logger, logging.Logger) and logger.level != logging.NOTSET:
+            levels[name] = logging.getLevelName(logger.level)
+    return logging.getLevelName(logging.getLogger().level), levels
+
+
+def setup_logging(level="INFO", module_levels=None, stream=None, max_queue=10000):
+    """Route all logging through a bounded queue drained by a background thread
+
+    `module_levels` maps logger names to levels; entries from the
+    DRONE_LOG_LEVELS environment variable are applied on top.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    log_queue = queue.Queue(max_queue)
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(logging.Formatter(LOG_FORMAT, datefmt="%H:%M:%S"))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(DroppingQueueHandler(log_queue))
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+
+    levels = dict(module_levels or {})
+    levels.update(parse_module_levels(os.environ.get("DRONE_LOG_LEVELS")))
+    for name, module_level in levels.items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """Flush queued records and stop the background thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,11 +1,39 @@
+import startup_timing
+import argparse
 import asyncio
+import logging
+import os
 import threading
 import customtkinter as ctk
-from dashboard import DroneDashboard
-from drone_controller import DroneController
+from joystick_input import DEFAULT_DEVICE
+from log_config import parse_module_levels, setup_logging, shutdown_logging
+from telemetry_rates import RATE_PROFILES
+
+log = logging.getLogger(__name__)
 
 class DroneApp:
-    def __init__(self):
+    def __init__(self, record_path=None, record_ram_mb=8, replay_path=None, replay_speed=1.0, max_fps=60,
+                 vehicles=None, process=False, attitude_renderer="canvas",
+                 map_tiles=None, fast_start=False, latency_report=None, rate_profile=None,
+                 joystick=None, deadzone=0.05, expo=0.3, shaping=None):
+        self.record_path = record_path
+        self.record_ram_mb = record_ram_mb
+        self.replay_path = replay_path
+        self.replay_speed = replay_speed
+        self.vehicles = vehicles
+        self.latency_report = latency_report
+        self.rate_profile = rate_profile
+        self.shaping = shaping
+        self.joystick_options = dict(path=joystick, deadzone=deadzone, expo=expo)
+        self.joystick = None
+        self.dashboard_options = dict(max_fps=max_fps, attitude_renderer=attitude_renderer, map_tiles=map_tiles)
+        self.dashboard = None
+        self.replay = replay_path is not None
+        self.fleet = None
+        self.process = process and not self.replay and not (vehicles and len(vehicles) > 1)
+        self.connection_string = vehicles[0] if vehicles else "udp://:14540"
+        self.recorders = []
+        
         # Use soft dark theme like Apple Dark Mode
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
@@ -14,34 +42,210 @@ class DroneApp:
         self.root = ctk.CTk()
         self.root.title("Drone Control Dashboard")
         self.root.geometry("1200x800")
+        startup_timing.mark("window_created")
+        self.root.after(0, lambda: startup_timing.mark("first_frame"))
         
-        # Initialize drone controller
-        self.drone_controller = DroneController()
-        
-        # Initialize dashboard
-        self.dashboard = DroneDashboard(self.root, self.drone_controller)
+        if fast_start:
+            # Skeleton window now; backend (MAVSDK import + server spin-up) and heavy GUI
+            # modules load on background threads while Tk is already responsive
+            self.skeleton = ctk.CTkLabel(self.root, text="Starting Drone Control Dashboard...",
+                                       font=("Arial", 16), text_color="#98989D")
+            self.skeleton.pack(expand=True)
+            self.backend_ready = threading.Event()
+            threading.Thread(target=self.preload_gui_modules, name="preload", daemon=True).start()
+            self.async_thread = threading.Thread(target=self.run_backend, daemon=True)
+            self.async_thread.start()
+            self.root.after(10, self.build_dashboard_when_ready)
+        else:
+            self.create_backend()
+            self.create_dashboard(lazy=False)
+            
+            # Start async loop in separate thread
+            self.async_thread = threading.Thread(target=self.run_async_loop, daemon=True)
+            self.async_thread.start()
+    
+    def create_backend(self):
+        """Create the drone controller (a fleet of them, or play back a recorded flight instead) and recorders"""
+        if self.replay:
+            from replay_controller import ReplayController
+            self.drone_controller = ReplayController(self.replay_path, speed=self.replay_speed)
+        elif self.vehicles and len(self.vehicles) > 1:
+            from fleet_manager import FleetManager
+            self.fleet = FleetManager.from_connection_strings(self.vehicles, rate_profile=self.rate_profile,
+                                                              shaping=self.shaping)
+            self.drone_controller = self.fleet.focused_controller
+        elif self.process:
+            # Telemetry ingestion in a worker process; it also owns the recorder
+            from telemetry_process import ProcessDroneProxy
+            self.drone_controller = ProcessDroneProxy(
+                record_path=self.record_path, record_ram_bytes=int(self.record_ram_mb * 1024 * 1024),
+                rate_profile=self.rate_profile, shaping=self.shaping)
+        else:
+            from drone_controller import DroneController
+            self.drone_controller = DroneController(rate_profile=self.rate_profile, shaping=self.shaping)
+        startup_timing.watch_first_telemetry(self.drone_controller)
+        startup_timing.mark("controller_created")
         
-        # Start async loop in separate thread
-        self.async_thread = threading.Thread(target=self.run_async_loop, daemon=True)
-        self.async_thread.start()
+        # Optional flight recorder (one log per vehicle in fleet mode)
+        if self.record_path and not self.replay and not self.process:
+            from flight_recorder import FlightRecorder
+            ram_bytes = int(self.record_ram_mb * 1024 * 1024)
+            if self.fleet:
+                base, ext = os.path.splitext(self.record_path)
+                targets = [(f"{base}.{name}{ext}", controller) for name, controller in self.fleet.vehicles.items()]
+            else:
+                targets = [(self.record_path, self.drone_controller)]
+            for path, controller in targets:
+                recorder = FlightRecorder(path, max_ram_bytes=ram_bytes)
+                recorder.attach(controller)
+                self.recorders.append(recorder)
+                log.info("💾 Recording telemetry to %s", path)
+    
+    def create_dashboard(self, lazy):
+        """Initialize dashboard"""
+        from dashboard import DroneDashboard
+        self.dashboard = DroneDashboard(self.root, self.drone_controller, fleet=self.fleet, lazy=lazy,
+                                        **self.dashboard_options)
+        if self.replay:
+            self.root.title(f"Drone Control Dashboard - Replay: {self.replay_path}")
+            self.bind_replay_keys()
+        elif self.joystick_options["path"]:
+            self.start_joystick()
+        startup_timing.mark("dashboard_created")
+    
+    def start_joystick(self):
+        """Drive the manual controls of the displayed vehicle from a joystick"""
+        from joystick_input import JoystickInput
+        self.joystick = JoystickInput(lambda **axes: self.dashboard.drone.update_controls(**axes),
+                                      **self.joystick_options)
+        self.dashboard.attach_joystick(self.joystick)
+        self.joystick.start()
+    
+    def preload_gui_modules(self):
+        """Import the dashboard (numpy, PIL, widget modules) off the GUI thread"""
+        import dashboard  # noqa: F401
+        startup_timing.mark("gui_modules_imported")
+    
+    def run_backend(self):
+        """Fast start: create the controller and connect on this thread, in parallel with the GUI"""
+        try:
+            self.create_backend()
+        finally:
+            self.backend_ready.set()
+        self.run_async_loop()
+    
+    def build_dashboard_when_ready(self):
+        if not self.backend_ready.is_set():
+            self.root.after(10, self.build_dashboard_when_ready)
+            return
+        if not hasattr(self, "drone_controller"):
+            log.error("❌ Backend failed to start")
+            return
+        self.skeleton.destroy()
+        self.create_dashboard(lazy=True)
+    
+    def bind_replay_keys(self):
+        """Space: pause/resume, Left/Right: seek 10 s, +/-: double/halve speed, Home: restart"""
+        replay = self.drone_controller
+        self.root.bind("<space>", lambda e: replay.toggle_pause())
+        self.root.bind("<Left>", lambda e: replay.seek_relative(-10))
+        self.root.bind("<Right>", lambda e: replay.seek_relative(10))
+        self.root.bind("<plus>", lambda e: replay.set_speed(replay.speed * 2))
+        self.root.bind("<minus>", lambda e: replay.set_speed(replay.speed / 2))
+        self.root.bind("<Home>", lambda e: replay.seek(0))
+        log.info("📼 Replay keys: Space pause, ←/→ seek 10s, +/- speed, Home restart")
     
     def run_async_loop(self):
         """Run asyncio loop in separate thread"""
         try:
-            self.drone_controller.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.drone_controller.loop)
-            self.drone_controller.loop.run_until_complete(self.drone_controller.connect())
-            self.drone_controller.loop.run_forever()
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            if self.fleet:
+                # All vehicles share this one loop
+                self.fleet.loop = loop
+                loop.run_until_complete(self.fleet.start())
+            else:
+                self.drone_controller.loop = loop
+                loop.run_until_complete(self.drone_controller.connect(self.connection_string))
+            loop.run_forever()
         except Exception as e:
-            print(f"❌ Async loop error: {e}")
+            log.error("❌ Async loop error: %s", e)
     
     def run(self):
         """Start the application"""
         try:
             self.root.mainloop()
         except Exception as e:
-            print(f"❌ GUI error: {e}")
+            log.error("❌ GUI error: %s", e)
+        finally:
+            if self.joystick is not None:
+                self.joystick.stop()
+            for recorder in self.recorders:
+                recorder.close()
+            if self.dashboard is not None and hasattr(self.dashboard, "map_view"):
+                self.dashboard.map_view.close()
+            if self.dashboard is not None and self.latency_report:
+                self.dashboard.export_latency(self.latency_report)
+                log.info("⏱️ Latency report written to %s", self.latency_report)
+            if self.process and getattr(self.drone_controller, "loop", None) is not None:
+                future = asyncio.run_coroutine_threadsafe(self.drone_controller.stop(), self.drone_controller.loop)
+                future.result(timeout=10)
+            shutdown_logging()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Drone Control Dashboard")
+    parser.add_argument("--record", metavar="PATH", help="record all telemetry to a binary flight log")
+    parser.add_argument("--record-ram-mb", type=float, default=8,
+                        help="RAM ceiling for the recorder ring buffers (default: 8)")
+    parser.add_argument("--replay", metavar="PATH", help="play back a recorded flight log instead of connecting")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed, 0.1x to 100x (default: 1)")
+    parser.add_argument("--vehicle", action="append", metavar="URL",
+                        help="vehicle connection string; repeat for fleet mode (default: udp://:14540)")
+    parser.add_argument("--fleet", type=int, metavar="N",
+                        help="fleet of N SITL vehicles on udp://:14540, :14541, ...")
+    parser.add_argument("--process", action="store_true",
+                        help="run telemetry ingestion in a separate worker process (single vehicle)")
+    parser.add_argument("--rate-profile", choices=sorted(RATE_PROFILES),
+                        help="request per-stream telemetry rates for this link type (default: autopilot defaults)")
+    parser.add_argument("--attitude-renderer", choices=("canvas", "raster"), default="canvas",
+                        help="attitude indicator backend: canvas items or cached PIL frames (default: canvas)")
+    parser.add_argument("--map-tiles", metavar="PATH",
+                        help="offline basemap: an .mbtiles file or a {z}/{x}/{y}.png tile directory")
+    parser.add_argument("--fast-start", action="store_true",
+                        help="show the window immediately and load MAVSDK and the panels in the background")
+    parser.add_argument("--startup-report", metavar="PATH",
+                        help="write startup milestones (ms) as JSON once the first telemetry arrives")
+    parser.add_argument("--latency-report", metavar="PATH",
+                        help="write telemetry-to-pixel latency percentiles as JSON on exit (F3 shows them live)")
+    parser.add_argument("--joystick", nargs="?", const=DEFAULT_DEVICE, metavar="DEVICE",
+                        help=f"fly the manual controls from a Linux joystick (default device: {DEFAULT_DEVICE})")
+    parser.add_argument("--deadzone", type=float, default=0.05, help="joystick stick deadzone, 0-1 (default: 0.05)")
+    parser.add_argument("--expo", type=float, default=0.3, help="joystick expo, 0 linear to 1 cubic (default: 0.3)")
+    parser.add_argument("--max-altitude", type=float, metavar="M",
+                        help="altitude ceiling for the manual controls, metres above home (default: none)")
+    parser.add_argument("--geofence-radius", type=float, metavar="M",
+                        help="keep the manual controls within this radius of the takeoff point (default: none)")
+    parser.add_argument("--max-fps", type=int, default=60, help="maximum UI frame rate (default: 60)")
+    parser.add_argument("--log-level", default="INFO", help="root log level (default: INFO)")
+    parser.add_argument("--log-levels", metavar="NAME=LEVEL,...",
+                        help="per-module levels, e.g. drone_controller.attitude=DEBUG,dashboard.attitude=DEBUG")
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    app = DroneApp()
+    args = parse_args()
+    setup_logging(args.log_level, parse_module_levels(args.log_levels))
+    if args.startup_report:
+        startup_timing.add_hook(startup_timing.report_hook(args.startup_report))
+    vehicles = args.vehicle
+    if args.fleet:
+        from fleet_manager import BASE_UDP_PORT
+        vehicles = [f"udp://:{BASE_UDP_PORT + i}" for i in range(args.fleet)]
+    app = DroneApp(record_path=args.record, record_ram_mb=args.record_ram_mb,
+                   replay_path=args.replay, replay_speed=args.speed, max_fps=args.max_fps,
+                   vehicles=vehicles, process=args.process,
+                   attitude_renderer=args.attitude_renderer, map_tiles=args.map_tiles,
+                   fast_start=args.fast_start, latency_report=args.latency_report,
+                   rate_profile=args.rate_profile, joystick=args.joystick,
+                   deadzone=args.deadzone, expo=args.expo,
+                   shaping=dict(max_altitude_m=args.max_altitude, geofence_radius_m=args.geofence_radius))
     app.run()
\ No newline at end of file
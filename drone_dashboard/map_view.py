@@ -0,0 +1,369 @@
+import io
+import logging
+import math
+import os
+import queue
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+log = logging.getLogger(__name__)
+
+TILE_SIZE = 256
+
+
+def lonlat_to_pixel(lat, lon, zoom):
+    """Web Mercator global pixel coordinates of a position at `zoom` (scalars or arrays)"""
+    scale = TILE_SIZE * 2.0 ** zoom
+    lat = np.clip(lat, -85.05112878, 85.05112878)
+    x = (np.asarray(lon) + 180.0) / 360.0 * scale
+    sin_lat = np.sin(np.radians(lat))
+    y = (0.5 - np.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)) * scale
+    return x, y
+
+
+def simplify_track(points, tolerance):
+    """Douglas-Peucker simplification of an (n, 2) array; keeps the endpoints"""
+    n = len(points)
+    if n < 3:
+        return points
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start = points[first]
+        direction = points[last] - start
+        segment = points[first + 1:last] - start
+        length = math.hypot(direction[0], direction[1])
+        if length == 0.0:
+            distances = np.hypot(segment[:, 0], segment[:, 1])
+        else:
+            distances = np.abs(segment[:, 0] * direction[1] - segment[:, 1] * direction[0]) / length
+        index = int(np.argmax(distances))
+        if distances[index] > tolerance:
+            split = first + 1 + index
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return points[keep]
+
+
+class DirectoryTileSource:
+    """Tiles from a `{z}/{x}/{y}.png` directory tree (XYZ scheme, as most tile downloaders write)"""
+
+    def __init__(self, root, pattern="{z}/{x}/{y}.png"):
+        self.root = root
+        self.pattern = pattern
+
+    def read(self, z, x, y):
+        path = os.path.join(self.root, self.pattern.format(z=z, x=x, y=y))
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def close(self):
+        pass
+
+
+class MBTilesSource:
+    """Tiles from an MBTiles (SQLite, TMS row order) file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        # Every thread's connection, so close() can reach the ones opened by pool threads
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        # sqlite connections are per thread; tiles are read from the decode pool
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def read(self, z, x, y):
+        row = self._connection().execute(
+            "SELECT tile_data FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+            (z, x, (1 << z) - 1 - y)).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+
+def open_tile_source(path):
+    """MBTiles file or tile directory, chosen by path"""
+    if path.endswith(".mbtiles"):
+        return MBTilesSource(path)
+    return DirectoryTileSource(path)
+
+
+class TileCache:
+    """LRU of decoded tiles; misses are read and decoded on a thread pool
+
+    `get()` never blocks: it returns the tile if cached, otherwise queues a
+    decode and returns None. Decoded images come back through a queue and
+    are turned into Tk images by `collect()` on the GUI thread, because Tk
+    objects must not be created from worker threads.
+    """
+
+    def __init__(self, source, max_tiles=256, workers=4, photo_factory=None):
+        if photo_factory is None:
+            from PIL import ImageTk
+            photo_factory = ImageTk.PhotoImage
+        self.source = source
+        self.max_tiles = max_tiles
+        self.photo_factory = photo_factory
+        self.hits = 0
+        self.misses = 0
+        self.missing = 0
+        self._tiles = OrderedDict()
+        self._pending = set()
+        self._absent = set()
+        self._decoded = queue.SimpleQueue()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tile-decode")
+
+    def get(self, key):
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            self.hits += 1
+            return tile
+        self.misses += 1
+        if key not in self._pending and key not in self._absent:
+            self._pending.add(key)
+            self._pool.submit(self._decode, key)
+        return None
+
+    def _decode(self, key):
+        image = None
+        try:
+            data = self.source.read(*key)
+            if data is not None:
+                image = Image.open(io.BytesIO(data)).convert("RGB")
+                image.load()
+        except Exception as e:
+            log.warning("⚠️ Tile %s unreadable: %s", key, e)
+        self._decoded.put((key, image))
+
+    def collect(self):
+        """Move finished decodes into the cache (GUI thread); returns how many arrived"""
+        arrived = 0
+        while True:
+            try:
+                key, image = self._decoded.get_nowait()
+            except queue.Empty:
+                return arrived
+            self._pending.discard(key)
+            if image is None:
+                # Not in the offline set - remember so it is not requested every frame
+                self.missing += 1
+                if len(self._absent) > 4096:
+                    self._absent.clear()
+                self._absent.add(key)
+                continue
+            self._tiles[key] = self.photo_factory(image)
+            arrived += 1
+            while len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "tiles": len(self._tiles),
+            "pending": len(self._pending),
+            "hits": self.hits,
+            "misses": self.misses,
+            "missing": self.missing,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        # Queued decodes are dropped; running ones finish before their connections close
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self.source.close()
+
+
+class FlightTrack:
+    """Flown track with per-zoom Douglas-Peucker simplification maintained incrementally
+
+    The raw track only grows. For each zoom level the simplified prefix is
+    kept and only the raw tail since the last simplification is processed,
+    so an hour-long track costs the same per frame as a short one.
+    """
+
+    def __init__(self, tolerance_px=1.0, tail_points=200):
+        self.tolerance_px = tolerance_px
+        self.tail_points = tail_points
+        self._lat = []
+        self._lon = []
+        self._simplified = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._lat)
+
+    def append(self, lat, lon):
+        with self._lock:
+            if self._lat and self._lat[-1] == lat and self._lon[-1] == lon:
+                return
+            self._lat.append(lat)
+            self._lon.append(lon)
+
+    def clear(self):
+        with self._lock:
+            self._lat.clear()
+            self._lon.clear()
+            self._simplified.clear()
+
+    def pixels(self, zoom):
+        """Simplified track as an (n, 2) array of global pixel coordinates at `zoom`"""
+        with self._lock:
+            count = len(self._lat)
+            done, prefix = self._simplified.get(zoom, (0, np.zeros((0, 2))))
+            # Anchor the tail on the last simplified point so the segments join
+            start = max(done - 1, 0)
+            x, y = lonlat_to_pixel(np.array(self._lat[start:count]), np.array(self._lon[start:count]), zoom)
+        tail = np.column_stack((x, y))
+        if count - done >= self.tail_points:
+            simplified = simplify_track(tail, self.tolerance_px)
+            prefix = np.concatenate((prefix[:-1], simplified)) if len(prefix) else simplified
+            self._simplified[zoom] = (count, prefix)
+            return prefix
+        if len(prefix) == 0:
+            return tail
+        return np.concatenate((prefix[:-1], tail))
+
+
+class MapView:
+    """Moving map on a Tk canvas: offline tiles, the flown track and the vehicle marker
+
+    The view follows the vehicle. Canvas items are created once (a fixed
+    grid of tile image items, one track line, one marker) and moved or
+    re-imaged on each render, like the attitude indicator.
+    """
+
+    def __init__(self, canvas, tile_source=None, zoom=17, min_zoom=3, max_zoom=19,
+                 default_size=(300, 300), max_tiles=256, photo_factory=None):
+        self.canvas = canvas
+        self.zoom = zoom
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.default_size = default_size
+        self.tiles = TileCache(tile_source, max_tiles, photo_factory=photo_factory) if tile_source else None
+        self.track = FlightTrack()
+        self.redraws = 0
+        self._position = None
+        self._drawn = None
+        self._tile_items = []
+
+        self._background = canvas.create_rectangle(0, 0, 0, 0, fill="#1C1C1E", outline="")
+        self._track_line = canvas.create_line(0, 0, 0, 0, fill="#FF9F0A", width=2, state="hidden")
+        self._marker = canvas.create_oval(0, 0, 0, 0, fill="#0A84FF", outline="#FFFFFF", width=2, state="hidden")
+        self._label = canvas.create_text(6, 6, text="", anchor="nw", fill="#98989D", font=("Arial", 9))
+
+    def _canvas_size(self):
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return self.default_size
+        return width, height
+
+    def record(self, snapshot):
+        """Append the snapshot's position to the track (telemetry thread)"""
+        lat, lon, _ = snapshot.position
+        if lat or lon:
+            self.track.append(lat, lon)
+            self._position = (lat, lon)
+
+    def set_zoom(self, zoom):
+        self.zoom = max(self.min_zoom, min(self.max_zoom, zoom))
+        self._drawn = None
+
+    def clear(self):
+        self.track.clear()
+        self._position = None
+        self._drawn = None
+
+    def render(self):
+        """Redraw if the vehicle moved, the zoom changed or tiles arrived; returns True if redrawn"""
+        arrived = self.tiles.collect() if self.tiles else 0
+        size = self._canvas_size()
+        state = (size, self.zoom, self._position, len(self.track))
+        if state == self._drawn and not arrived:
+            return False
+        self._drawn = state
+
+        width, height = size
+        canvas = self.canvas
+        canvas.coords(self._background, 0, 0, width, height)
+        if self._position is None:
+            # Also after clear() on a focus switch: hide the previous vehicle's track and tiles
+            for item in (self._track_line, self._marker, *self._tile_items):
+                canvas.itemconfigure(item, state="hidden")
+            canvas.itemconfigure(self._label, text="Waiting for position...")
+            return True
+
+        center_x, center_y = lonlat_to_pixel(*self._position, self.zoom)
+        origin_x = float(center_x) - width / 2
+        origin_y = float(center_y) - height / 2
+        self._render_tiles(origin_x, origin_y, width, height)
+
+        points = self.track.pixels(self.zoom)
+        if len(points) >= 2:
+            screen = points - (origin_x, origin_y)
+            canvas.coords(self._track_line, *screen.ravel().tolist())
+            canvas.itemconfigure(self._track_line, state="normal")
+        else:
+            canvas.itemconfigure(self._track_line, state="hidden")
+        canvas.coords(self._marker, width / 2 - 6, height / 2 - 6, width / 2 + 6, height / 2 + 6)
+        canvas.itemconfigure(self._marker, state="normal")
+        canvas.itemconfigure(self._label, text=f"z{self.zoom}  {len(points)}/{len(self.track)} pts")
+        for item in (self._track_line, self._marker, self._label):
+            canvas.tag_raise(item)
+        self.redraws += 1
+        return True
+
+    def _render_tiles(self, origin_x, origin_y, width, height):
+        if self.tiles is None:
+            return
+        first_x = int(origin_x // TILE_SIZE)
+        first_y = int(origin_y // TILE_SIZE)
+        last_x = int((origin_x + width) // TILE_SIZE)
+        last_y = int((origin_y + height) // TILE_SIZE)
+        limit = 1 << self.zoom
+
+        slots = [(x, y) for y in range(first_y, last_y + 1) for x in range(first_x, last_x + 1)]
+        while len(self._tile_items) < len(slots):
+            self._tile_items.append(self.canvas.create_image(0, 0, anchor="nw", state="hidden"))
+
+        for item, (x, y) in zip(self._tile_items, slots):
+            tile = self.tiles.get((self.zoom, x % limit, y)) if 0 <= y < limit else None
+            if tile is None:
+                self.canvas.itemconfigure(item, state="hidden")
+                continue
+            self.canvas.coords(item, x * TILE_SIZE - origin_x, y * TILE_SIZE - origin_y)
+            self.canvas.itemconfigure(item, image=tile, state="normal")
+        for item in self._tile_items[len(slots):]:
+            self.canvas.itemconfigure(item, state="hidden")
+
+    def close(self):
+        if self.tiles is not None:
+            self.tiles.close()
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+
+from flight_log import FlightLog
+from setpoint_streamer import ControlState
+from telemetry_snapshot import TelemetrySnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayController:
+    """Drop-in stand-in for DroneController that plays back a recorded flight log
+
+    Exposes the same telemetry attributes (connected/armed/in_air/position/
+    attitude/battery/gps_fix) and snapshot publishing as DroneController, so
+    DroneDashboard runs unchanged. Playback is paced against the loop clock
+    at `speed` x real time and publishes at most `tick_hz` snapshots per
+    second; it can be paused, sped up and seeked from any thread.
+    """
+
+    MIN_SPEED = 0.1
+    MAX_SPEED = 100.0
+
+    def __init__(self, log_path, speed=1.0, tick_hz=100.0, loop_playback=False):
+        self.log = FlightLog(log_path)
+        self.start_time, self.end_time = self.log.time_range
+        self.tick_hz = tick_hz
+        self.loop_playback = loop_playback
+        self.speed = 1.0
+        self.set_speed(speed)
+
+        self.loop = None
+        self.connected = False
+        self.paused = False
+        self.finished = False
+        self.log_time = self.start_time
+        self._seek_to = None
+        self._task = None
+
+        self.controls = ControlState()
+        self.snapshot = TelemetrySnapshot()
+        self.snapshot_listeners = []
+        self._snapshot_seq = 0
+
+    # Same telemetry attributes as DroneController, read from the current snapshot
+    @property
+    def armed(self):
+        return self.snapshot.armed
+
+    @property
+    def in_air(self):
+        return self.snapshot.in_air
+
+    @property
+    def position(self):
+        return self.snapshot.position
+
+    @property
+    def attitude(self):
+        return self.snapshot.attitude
+
+    @property
+    def battery(self):
+        return self.snapshot.battery
+
+    @property
+    def gps_fix(self):
+        return self.snapshot.gps_fix
+
+    @property
+    def elapsed(self):
+        """Seconds into the recording"""
+        return self.log_time - self.start_time
+
+    @property
+    def duration(self):
+        return self.end_time - self.start_time
+
+    def add_snapshot_listener(self, listener):
+        self.snapshot_listeners.append(listener)
+
+    def remove_snapshot_listener(self, listener):
+        if listener in self.snapshot_listeners:
+            self.snapshot_listeners.remove(listener)
+
+    async def connect(self, connection_string=None):
+        """Start playback (mirrors DroneController.connect)"""
+        logger.info("📼 Replaying %s (%.0fs at %gx)", self.log.path, self.duration, self.speed)
+        self.connected = True
+        self._publish(self.start_time)
+        self._task = asyncio.create_task(self._playback())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.log.close()
+
+    # Playback controls - safe to call from the GUI thread
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def toggle_pause(self):
+        self.paused = not self.paused
+
+    def set_speed(self, speed):
+        self.speed = max(self.MIN_SPEED, min(self.MAX_SPEED, float(speed)))
+
+    def seek(self, seconds):
+        """Jump to `seconds` from the start of the recording"""
+        self._seek_to = self.start_time + max(0.0, min(self.duration, seconds))
+
+    def seek_relative(self, seconds):
+        self.seek(self.elapsed + seconds)
+
+    def _publish(self, log_time):
+        self._snapshot_seq += 1
+        self.snapshot = self.log.snapshot_at(log_time, seq=self._snapshot_seq)
+        for listener in self.snapshot_listeners:
+            listener(self.snapshot)
+
+    async def _playback(self):
+        loop = asyncio.get_running_loop()
+        period = 1.0 / self.tick_hz
+        last_wall = loop.time()
+
+        while True:
+            await asyncio.sleep(period)
+            now = loop.time()
+            elapsed_wall, last_wall = now - last_wall, now
+
+            if self._seek_to is not None:
+                self.log_time, self._seek_to = self._seek_to, None
+                self.finished = False
+                self._publish(self.log_time)
+                continue
+
+            if self.paused or self.finished:
+                continue
+
+            self.log_time = min(self.end_time, self.log_time + elapsed_wall * self.speed)
+            self._publish(self.log_time)
+
+            if self.log_time >= self.end_time:
+                if self.loop_playback:
+                    self.log_time = self.start_time
+                else:
+                    self.finished = True
+                    logger.info("📼 Replay finished")
+
+    # Flight actions are not available while replaying
+    def update_controls(self, throttle=None, yaw=None, pitch=None, roll=None):
+        self.controls.set(throttle=throttle, yaw=yaw, pitch=pitch, roll=roll)
+
+    def request(self, action):
+        """Same interface as DroneController.request; only the gyro test does anything"""
+        return asyncio.run_coroutine_threadsafe(getattr(self, action)(), self.loop)
+
+    def cancel_action(self, action):
+        pass
+
+    async def _unavailable(self, action):
+        logger.error("❌ %s not available in replay mode", action)
+        return False
+
+    async def arm(self):
+        return await self._unavailable("Arm")
+
+    async def disarm(self):
+        return await self._unavailable("Disarm")
+
+    async def takeoff(self):
+        return await self._unavailable("Takeoff")
+
+    async def land(self):
+        return await self._unavailable("Land")
+
+    async def test_gyroscope(self):
+        roll, pitch, yaw = self.attitude
+        logger.info("🧭 Gyro Test (replay) - Roll: %.1f°, Pitch: %.1f°, Yaw: %.1f°", roll, pitch, yaw)
+        return True
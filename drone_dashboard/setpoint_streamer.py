@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import math
+from collections import deque
+
+log = logging.getLogger(__name__)
+
+
+AXES = ("throttle", "yaw", "pitch", "roll")
+
+
+class ControlState:
+    """Latest-value manual control state
+
+    The GUI thread overwrites it, the setpoint streamer reads it. All four
+    axes live in a single tuple that is replaced in one assignment, so a
+    reader never sees a half-applied update.
+    """
+
+    def __init__(self):
+        self.values = (0.0, 0.0, 0.0, 0.0)
+        self.version = 0
+
+    def set(self, throttle=None, yaw=None, pitch=None, roll=None):
+        """Update the given axes (clamped to -1..1); axes left as None keep their value"""
+        new = []
+        for old, value in zip(self.values, (throttle, yaw, pitch, roll)):
+            new.append(old if value is None else max(-1.0, min(1.0, float(value))))
+        self.values = tuple(new)
+        self.version += 1
+
+    def reset(self):
+        self.values = (0.0, 0.0, 0.0, 0.0)
+        self.version += 1
+
+    def as_dict(self):
+        return dict(zip(AXES, self.values))
+
+
+class SetpointStreamer:
+    """Sends offboard setpoints at a fixed rate from the latest control state
+
+    `source()` builds the setpoint to send and `send(setpoint)` is awaited
+    once per period, then every callable in `listeners` is called with the
+    setpoint that was sent. Send jitter (lateness against the fixed
+    schedule) and send latency are kept for the last `window` setpoints.
+    """
+
+    def __init__(self, source, send, rate_hz=20.0, window=200):
+        self.source = source
+        self.send = send
+        self.rate_hz = rate_hz
+        self.sent = 0
+        self.errors = 0
+        self.overruns = 0
+        self.listeners = []
+        self._jitter = deque(maxlen=window)
+        self._latency = deque(maxlen=window)
+        self._task = None
+
+    @property
+    def running(self):
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start streaming (must run inside the loop)"""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="setpoint-streamer")
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        period = 1.0 / self.rate_hz
+        next_time = loop.time()
+
+        while True:
+            started = loop.time()
+            self._jitter.append(started - next_time)
+
+            try:
+                setpoint = self.source()
+                await self.send(setpoint)
+                self.sent += 1
+                for listener in self.listeners:
+                    listener(setpoint)
+            except Exception as e:
+                self.errors += 1
+                log.error("❌ Control command failed: %s", e)
+
+            finished = loop.time()
+            self._latency.append(finished - started)
+
+            next_time += period
+            if finished > next_time:
+                # Fell behind - skip the missed slots instead of bursting to catch up
+                self.overruns += 1
+                next_time = finished + period - (finished - next_time) % period
+            await asyncio.sleep(next_time - finished)
+
+    def stats(self):
+        """Setpoint counts and jitter/latency (ms) over the recent window"""
+        return {
+            "rate_hz": self.rate_hz,
+            "sent": self.sent,
+            "errors": self.errors,
+            "overruns": self.overruns,
+            "jitter_ms": _summary(self._jitter),
+            "latency_ms": _summary(self._latency),
+        }
+
+
+def _summary(samples):
+    if not samples:
+        return {"mean": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+    return {
+        "mean": 1000.0 * sum(ordered) / len(ordered),
+        "p95": 1000.0 * p95,
+        "max": 1000.0 * ordered[-1],
+    }
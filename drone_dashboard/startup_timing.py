@@ -0,0 +1,68 @@
+import json
+import logging
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+# Reference point for every mark: when this module was first imported (main imports it first)
+_START = time.perf_counter()
+
+_marks = {}
+_hooks = []
+_lock = threading.Lock()
+
+
+def add_hook(hook):
+    """Call `hook(name, seconds_since_start)` for every mark, from the thread that made it"""
+    _hooks.append(hook)
+
+
+def mark(name):
+    """Record a startup milestone once (later marks with the same name are ignored)"""
+    elapsed = time.perf_counter() - _START
+    with _lock:
+        if name in _marks:
+            return _marks[name]
+        _marks[name] = elapsed
+    log.info("⏱️ Startup: %s at %.0f ms", name, 1000.0 * elapsed)
+    for hook in tuple(_hooks):
+        try:
+            hook(name, elapsed)
+        except Exception as e:
+            log.error("Startup hook failed: %s", e)
+    return elapsed
+
+
+def marks():
+    """Milestones in the order they happened, in milliseconds since start"""
+    with _lock:
+        return {name: 1000.0 * elapsed for name, elapsed in sorted(_marks.items(), key=lambda item: item[1])}
+
+
+def report_hook(path, final="first_telemetry"):
+    """Hook that writes all marks as JSON to `path` once `final` is reached"""
+    def hook(name, elapsed):
+        if name != final:
+            return
+        with open(path, "w") as f:
+            json.dump({"startup_ms": marks()}, f, indent=2)
+            f.write("\n")
+    return hook
+
+
+def watch_first_telemetry(controller):
+    """Mark `connected` and `first_telemetry` from a controller's snapshot stream"""
+    done = []
+
+    # Stays registered (and returns immediately) once done: removing itself
+    # while the controller iterates its listeners would skip the next one
+    def listener(snapshot):
+        if done or not snapshot.connected:
+            return
+        mark("connected")
+        hub = getattr(controller, "telemetry", None)
+        if hub is None or any(stats.samples for stats in hub.stats.values()):
+            mark("first_telemetry")
+            done.append(True)
+    controller.add_snapshot_listener(listener)
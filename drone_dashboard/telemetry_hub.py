@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import statistics
+import time
+from collections import deque
+
+log = logging.getLogger(__name__)
+
+
+class StreamStats:
+    """Per-stream counters kept by the hub, plus a window of recent inter-arrival times"""
+
+    __slots__ = ("samples", "restarts", "last_sample", "last_error", "intervals", "dropped")
+
+    def __init__(self, window=100):
+        self.samples = 0
+        self.restarts = 0
+        self.last_sample = None
+        self.last_error = None
+        self.intervals = deque(maxlen=window)
+        self.dropped = 0
+
+    def record(self, now):
+        if self.last_sample is not None:
+            self.intervals.append(now - self.last_sample)
+        self.samples += 1
+        self.last_sample = now
+
+    def age(self, now=None):
+        """Seconds since the last sample (None if the stream never produced one)"""
+        if self.last_sample is None:
+            return None
+        return (now if now is not None else time.monotonic()) - self.last_sample
+
+    def rate(self):
+        """Messages per second over the interval window"""
+        total = sum(self.intervals)
+        return len(self.intervals) / total if total > 0 else 0.0
+
+    def jitter_ms(self):
+        """Standard deviation of the inter-arrival time over the window"""
+        if len(self.intervals) < 2:
+            return 0.0
+        return 1000.0 * statistics.pstdev(self.intervals)
+
+    def reset_window(self):
+        self.intervals.clear()
+        self.last_sample = None
+
+
+class TelemetryHub:
+    """Owns all MAVSDK telemetry streams, supervises them and fans samples out to subscribers
+
+    Each stream runs in its own task, so a stream that stalls or fails never
+    blocks the others. A stream that raises or ends is restarted with
+    exponential backoff.
+    """
+
+    def __init__(self, restart_delay=0.5, max_restart_delay=10.0):
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.running = False
+        self.stats = {}
+        # Arrival time of the sample being dispatched right now (None between samples)
+        self.arrival = None
+        self._streams = {}
+        self._subscribers = {}
+        self._tasks = {}
+
+    def register(self, name, stream_factory, *handlers):
+        """Register a stream
+
+        `stream_factory` is called with no arguments and must return an async
+        iterator, e.g. `lambda: drone.telemetry.position()`. It is called again
+        every time the stream is (re)started.
+        """
+        if name in self._streams:
+            raise ValueError(f"Telemetry stream '{name}' already registered")
+
+        self._streams[name] = stream_factory
+        self._subscribers.setdefault(name, [])
+        self.stats[name] = StreamStats()
+        for handler in handlers:
+            self.subscribe(name, handler)
+
+        if self.running:
+            self._start_stream(name)
+
+    def subscribe(self, name, callback):
+        """Call `callback(sample)` for every sample of a stream
+
+        The callback may be a plain function or a coroutine function.
+        """
+        self._subscribers.setdefault(name, []).append(callback)
+
+    def unsubscribe(self, name, callback):
+        """Remove a subscriber added with `subscribe`"""
+        try:
+            self._subscribers[name].remove(callback)
+        except (KeyError, ValueError):
+            pass
+
+    @property
+    def streams(self):
+        return list(self._streams)
+
+    def start(self):
+        """Start a supervised task for every registered stream (must run inside the loop)"""
+        self.running = True
+        for name in self._streams:
+            self._start_stream(name)
+
+    async def stop(self):
+        """Cancel all stream tasks and wait for them to finish"""
+        self.running = False
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def restart(self):
+        """Tear down and re-subscribe every stream"""
+        await self.stop()
+        self.start()
+
+    def _start_stream(self, name):
+        task = self._tasks.get(name)
+        if task is not None and not task.done():
+            return
+        self._tasks[name] = asyncio.create_task(self._run_stream(name), name=f"telemetry:{name}")
+
+    async def _run_stream(self, name):
+        stats = self.stats[name]
+        delay = self.restart_delay
+
+        while True:
+            try:
+                async for sample in self._streams[name]():
+                    now = time.monotonic()
+                    stats.record(now)
+                    delay = self.restart_delay
+                    await self._dispatch(name, sample, now)
+                log.warning("⚠️ Telemetry stream '%s' ended, restarting...", name)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                stats.last_error = e
+                log.error("❌ Telemetry stream '%s' failed: %s", name, e)
+
+            stats.restarts += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_restart_delay)
+
+    async def _dispatch(self, name, sample, arrival):
+        for callback in tuple(self._subscribers[name]):
+            self.arrival = arrival
+            try:
+                result = callback(sample)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.stats[name].dropped += 1
+                log.error("❌ Telemetry subscriber for '%s' failed: %s", name, e)
+            finally:
+                self.arrival = None
@@ -0,0 +1,231 @@
+import math
+import threading
+
+import numpy as np
+
+
+class MinMaxRing:
+    """Fixed-size ring of min/max buckets covering a sliding time window
+
+    The window is split into `columns` equal buckets (one per pixel column).
+    `append` folds a sample into the bucket its timestamp falls in, so memory
+    and per-sample cost are O(1) and reading the whole window back is
+    O(columns) regardless of how many samples it spans (10 minutes at 50 Hz
+    is 30 000 samples, still read back as 600 min/max pairs).
+    """
+
+    def __init__(self, window_s, columns, fields=1):
+        self.window_s = window_s
+        self.columns = columns
+        self.fields = fields
+        self.bucket_s = window_s / columns
+        self.mins = np.zeros((columns, fields))
+        self.maxs = np.zeros((columns, fields))
+        self.bucket_ids = np.full(columns, -1, dtype=np.int64)
+        self.head = None
+        self.samples = 0
+        self._min = self._max = None
+        self._lock = threading.Lock()
+
+    def append(self, timestamp, values):
+        bucket = int(timestamp // self.bucket_s)
+        with self._lock:
+            if bucket == self.head:
+                # Same pixel column: fold into the open bucket with plain floats (no NumPy per sample)
+                self._min = [v if v < m else m for v, m in zip(values, self._min)]
+                self._max = [v if v > m else m for v, m in zip(values, self._max)]
+            else:
+                self._close_bucket()
+                self.head = bucket
+                self._min = list(values)
+                self._max = list(values)
+            self.samples += 1
+
+    def _close_bucket(self):
+        if self.head is None:
+            return
+        slot = self.head % self.columns
+        self.bucket_ids[slot] = self.head
+        self.mins[slot] = self._min
+        self.maxs[slot] = self._max
+
+    def clear(self):
+        with self._lock:
+            self.bucket_ids.fill(-1)
+            self.head = None
+            self.samples = 0
+
+    def window(self):
+        """`(columns, mins, maxs)` for the buckets present in the window, oldest first"""
+        with self._lock:
+            if self.head is None:
+                empty = np.zeros((0, self.fields))
+                return np.zeros(0, dtype=np.int64), empty, empty
+            self._close_bucket()
+            ids = np.arange(self.head - self.columns + 1, self.head + 1)
+            slots = ids % self.columns
+            valid = self.bucket_ids[slots] == ids
+            return np.flatnonzero(valid), self.mins[slots[valid]], self.maxs[slots[valid]]
+
+
+def column_polyline(columns, mins, maxs, x0, x_scale, y0, y_scale):
+    """Flat canvas coords for a min/max envelope: one vertical min-max stroke per pixel column"""
+    strokes = np.empty((len(columns), 2))
+    strokes[:, 0] = y0 - mins * y_scale
+    strokes[:, 1] = y0 - maxs * y_scale
+    # Alternate the stroke direction so neighbouring columns join without long diagonals
+    strokes[1::2] = strokes[1::2, ::-1]
+    coords = np.empty((len(columns), 4))
+    coords[:, 0] = coords[:, 2] = x0 + columns * x_scale
+    coords[:, 1] = strokes[:, 0]
+    coords[:, 3] = strokes[:, 1]
+    return coords.ravel().tolist()
+
+
+class PlotStrip:
+    """One labelled plot area with one or more series sharing a y axis"""
+
+    __slots__ = ("title", "series", "colors", "y_range", "ring", "frame", "title_item",
+                 "max_item", "min_item", "lines", "box")
+
+    def __init__(self, title, series, colors, y_range, ring):
+        self.title = title
+        self.series = series
+        self.colors = colors
+        self.y_range = y_range
+        self.ring = ring
+        self.lines = []
+        self.box = None
+
+
+class TelemetryPlot:
+    """Scrolling time-series plots on a Tk canvas, drawn from MinMaxRing buffers
+
+    Samples are recorded from the telemetry thread; `render()` runs on the
+    GUI thread and costs O(columns) per strip: one `canvas.coords` call per
+    series with at most two points per pixel column, however long the
+    window is. Canvas items are created once, like the attitude indicator.
+    """
+
+    STRIPS = (
+        ("Altitude (m)", ("alt",), ("#0A84FF",), None),
+        ("Attitude (°)", ("roll", "pitch"), ("#FF453A", "#30D158"), None),
+        # Own strip at a fixed range: autoscaled with roll and pitch, ±180° flattens them
+        ("Heading (°)", ("yaw",), ("#FF9F0A",), (-180.0, 180.0)),
+        ("Battery (%)", ("battery",), ("#30D158",), (0.0, 100.0)),
+        ("Speed (m/s)", ("cmd horiz", "horiz", "cmd climb", "climb"),
+         ("#98989D", "#0A84FF", "#BF5AF2", "#FF9F0A"), None),
+    )
+
+    def __init__(self, canvas, window_s=600.0, columns=600, default_size=(600, 400)):
+        self.canvas = canvas
+        self.window_s = window_s
+        self.columns = columns
+        self.default_size = default_size
+        self.redraws = 0
+        self._size = None
+        self._drawn = None
+        self.strips = [PlotStrip(title, series, colors, y_range, MinMaxRing(window_s, columns, len(series)))
+                       for title, series, colors, y_range in self.STRIPS]
+        self._altitude, self._attitude, self._heading, self._battery, self._speed = self.strips
+        self._commanded = (0.0, 0.0)
+        self._create_items()
+
+    def _create_items(self):
+        canvas = self.canvas
+        self._background = canvas.create_rectangle(0, 0, 0, 0, fill="#0A0A0A", outline="")
+        for strip in self.strips:
+            strip.frame = canvas.create_rectangle(0, 0, 0, 0, outline="#38383A")
+            strip.title_item = canvas.create_text(0, 0, text=strip.title, anchor="nw",
+                                                  fill="#98989D", font=("Arial", 9, "bold"))
+            strip.max_item = canvas.create_text(0, 0, text="", anchor="ne", fill="#98989D", font=("Arial", 8))
+            strip.min_item = canvas.create_text(0, 0, text="", anchor="se", fill="#98989D", font=("Arial", 8))
+            strip.lines = [canvas.create_line(0, 0, 0, 0, fill=color, width=1, state="hidden")
+                           for color in strip.colors]
+
+    # Recording (telemetry thread)
+
+    def record_snapshot(self, snapshot):
+        """Fold one TelemetrySnapshot into the rings"""
+        t = snapshot.timestamp
+        self._altitude.ring.append(t, (snapshot.position[2],))
+        roll, pitch, yaw = snapshot.attitude
+        self._attitude.ring.append(t, (roll, pitch))
+        self._heading.ring.append(t, (yaw,))
+        self._battery.ring.append(t, (snapshot.battery,))
+        north, east, down = snapshot.velocity
+        cmd_horizontal, cmd_climb = self._commanded
+        self._speed.ring.append(t, (cmd_horizontal, math.hypot(north, east), cmd_climb, -down))
+
+    def record_setpoint(self, setpoint):
+        """Remember the latest commanded body velocity (plotted with the next snapshot)"""
+        self._commanded = (math.hypot(setpoint.forward_m_s, setpoint.right_m_s), -setpoint.down_m_s)
+
+    def clear(self):
+        for strip in self.strips:
+            strip.ring.clear()
+        self._commanded = (0.0, 0.0)
+        self._drawn = None
+
+    # Rendering (GUI thread)
+
+    def _canvas_size(self):
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return self.default_size
+        return width, height
+
+    def render(self):
+        """Redraw every strip; returns False when no new samples arrived since the last render"""
+        size = self._canvas_size()
+        state = (size, tuple((strip.ring.head, strip.ring.samples) for strip in self.strips))
+        if state == self._drawn:
+            return False
+        if size != self._size:
+            self._size = size
+            self._layout(*size)
+        for strip in self.strips:
+            self._render_strip(strip)
+        self._drawn = state
+        self.redraws += 1
+        return True
+
+    def _layout(self, width, height):
+        coords = self.canvas.coords
+        coords(self._background, 0, 0, width, height)
+        strip_height = height / len(self.strips)
+        for i, strip in enumerate(self.strips):
+            top = i * strip_height
+            box = (4, top + 14, width - 4, top + strip_height - 2)
+            strip.box = box
+            coords(strip.frame, *box)
+            coords(strip.title_item, box[0] + 2, top + 1)
+            coords(strip.max_item, box[2] - 2, box[1] + 1)
+            coords(strip.min_item, box[2] - 2, box[3] - 1)
+
+    def _render_strip(self, strip):
+        canvas = self.canvas
+        columns, mins, maxs = strip.ring.window()
+        if len(columns) < 2:
+            for line in strip.lines:
+                canvas.itemconfigure(line, state="hidden")
+            return
+
+        if strip.y_range is not None:
+            low, high = strip.y_range
+        else:
+            low, high = float(mins.min()), float(maxs.max())
+            pad = 0.05 * (high - low) or 1.0
+            low, high = low - pad, high + pad
+
+        x0, top, x1, bottom = strip.box
+        x_scale = (x1 - x0) / (self.columns - 1)
+        y_scale = (bottom - top) / (high - low)
+        y0 = bottom + low * y_scale
+        for i, line in enumerate(strip.lines):
+            points = column_polyline(columns, mins[:, i], maxs[:, i], x0, x_scale, y0, y_scale)
+            canvas.coords(line, *points)
+            canvas.itemconfigure(line, state="normal")
+        canvas.itemconfigure(strip.max_item, text=f"{high:.1f}")
+        canvas.itemconfigure(strip.min_item, text=f"{low:.1f}")
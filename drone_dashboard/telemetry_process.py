@@ -0,0 +1,358 @@
+import asyncio
+import logging
+import multiprocessing as mp
+import struct
+from multiprocessing import shared_memory
+
+from link_monitor import LINK_STATES
+from log_config import current_levels, setup_logging, shutdown_logging
+from setpoint_streamer import ControlState
+from telemetry_snapshot import TelemetrySnapshot
+
+log = logging.getLogger(__name__)
+
+# Shared-memory layout: a uint64 seqlock counter followed by one packed
+# TelemetrySnapshot. The single writer bumps the counter to odd, writes the
+# fields, then bumps it to even; readers retry while it is odd or if it moved
+# while they were unpacking.
+SEQLOCK = struct.Struct("<Q")
+FIELDS = struct.Struct("<Qdd3?5x10d3i")  # seq, timestamp, received (0 = none), connected/armed/in_air,
+                                         # position, attitude, battery, velocity, gps_fix, mode, link
+SHM_SIZE = SEQLOCK.size + FIELDS.size
+FLIGHT_MODES = ("UNKNOWN", "READY", "TAKEOFF", "HOLD", "MISSION", "RETURN_TO_LAUNCH", "LAND", "OFFBOARD",
+                "FOLLOW_ME", "MANUAL", "ALTCTL", "POSCTL", "ACRO", "STABILIZED", "RATTITUDE")
+_MODE_INDEX = {name: i for i, name in enumerate(FLIGHT_MODES)}
+_LINK_INDEX = {name: i for i, name in enumerate(LINK_STATES)}
+
+
+class SharedSnapshot:
+    """Latest TelemetrySnapshot in shared memory, guarded by a seqlock (one writer, any readers)"""
+
+    def __init__(self, name=None, create=False):
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=SHM_SIZE)
+        self.buf = self.shm.buf
+        self.retries = 0
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def version(self):
+        """Seqlock counter; even and unchanged means no new snapshot"""
+        return SEQLOCK.unpack_from(self.buf, 0)[0]
+
+    def write(self, snapshot):
+        (version,) = SEQLOCK.unpack_from(self.buf, 0)
+        SEQLOCK.pack_into(self.buf, 0, version + 1)
+        FIELDS.pack_into(self.buf, SEQLOCK.size, snapshot.seq, snapshot.timestamp, snapshot.received or 0.0,
+                         snapshot.connected, snapshot.armed, snapshot.in_air,
+                         *snapshot.position, *snapshot.attitude, snapshot.battery, *snapshot.velocity,
+                         snapshot.gps_fix, _MODE_INDEX.get(snapshot.flight_mode, 0),
+                         _LINK_INDEX.get(snapshot.link, 0))
+        SEQLOCK.pack_into(self.buf, 0, version + 2)
+
+    def read(self):
+        """Return `(version, snapshot)`, unpacked straight from the shared buffer"""
+        while True:
+            (before,) = SEQLOCK.unpack_from(self.buf, 0)
+            if not before & 1:
+                fields = FIELDS.unpack_from(self.buf, SEQLOCK.size)
+                if SEQLOCK.unpack_from(self.buf, 0)[0] == before:
+                    break
+            self.retries += 1
+        (seq, timestamp, received, connected, armed, in_air, lat, lon, alt, roll, pitch, yaw,
+         battery, north, east, down, gps_fix, mode, link) = fields
+        return before, TelemetrySnapshot(
+            seq=seq, timestamp=timestamp, connected=connected, armed=armed, in_air=in_air,
+            position=(lat, lon, alt), attitude=(roll, pitch, yaw), battery=battery,
+            gps_fix=gps_fix, flight_mode=FLIGHT_MODES[mode], velocity=(north, east, down),
+            link=LINK_STATES[link], received=received or None)
+
+    def close(self, unlink=False):
+        self.buf.release()
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def run_worker(shm_name, conn, connection_string, record_path=None, record_ram_bytes=8 * 1024 * 1024,
+               fake_rates=None, rate_profile=None, shaping=None, log_levels=None):
+    """Worker process entry point: DroneController and all its monitors on a private loop
+
+    Every published snapshot goes into shared memory. The pipe carries
+    `("controls", {...})`, `("call", (request_id, action))`, `("cancel", action)`
+    and `("stop", None)` in, and `("result", (request_id, ok, value))` out
+    (`ok` is None if the action was cancelled). `fake_rates` swaps MAVSDK for
+    the synthetic fake_mavsdk system (benchmarks). `log_levels` is the
+    parent's `log_config.current_levels()`, so the worker logs at the same levels.
+    """
+    if log_levels is not None:
+        setup_logging(*log_levels)
+    from drone_controller import DroneController
+    from flight_recorder import FlightRecorder
+
+    system = None
+    if fake_rates is not None:
+        from fake_mavsdk import FakeSystem
+        system = FakeSystem(fake_rates)
+    shared = SharedSnapshot(shm_name)
+    controller = DroneController(system=system, rate_profile=rate_profile, shaping=shaping)
+    controller.add_snapshot_listener(shared.write)
+    recorder = None
+    if record_path:
+        recorder = FlightRecorder(record_path, max_ram_bytes=record_ram_bytes)
+        recorder.attach(controller)
+
+    async def call(request_id, method):
+        try:
+            result = await controller.perform(method)
+            conn.send(("result", (request_id, True, result)))
+        except asyncio.CancelledError:
+            # Superseded, preempted or cancelled by the GUI; ok=None cancels the GUI-side future
+            conn.send(("result", (request_id, None, None)))
+        except Exception as e:
+            conn.send(("result", (request_id, False, repr(e))))
+
+    async def serve():
+        loop = asyncio.get_running_loop()
+        controller.loop = loop
+        readable = asyncio.Event()
+        loop.add_reader(conn.fileno(), readable.set)
+        loop.create_task(controller.connect(connection_string))
+        while True:
+            await readable.wait()
+            readable.clear()
+            while conn.poll():
+                try:
+                    kind, payload = conn.recv()
+                except EOFError:
+                    return
+                if kind == "controls":
+                    controller.update_controls(**payload)
+                elif kind == "call":
+                    loop.create_task(call(*payload))
+                elif kind == "cancel":
+                    controller.commands.cancel(payload)
+                elif kind == "stop":
+                    return
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if recorder is not None:
+            recorder.close()
+        shared.close()
+        shutdown_logging()
+
+
+class ProcessDroneProxy:
+    """GUI-side stand-in for DroneController while the real one runs in a worker process
+
+    MAVSDK parsing and the monitors live in the worker, so they never contend
+    with Tk for the GIL. The GUI reads the latest snapshot from shared memory
+    (unpacked in place, only when the seqlock counter has moved); commands and
+    control values go back over a pipe. The proxy keeps the controller
+    interface the dashboard uses, including a `loop` for
+    `run_coroutine_threadsafe(proxy.arm(), proxy.loop)`.
+    """
+
+    def __init__(self, poll_hz=200.0, record_path=None, record_ram_bytes=8 * 1024 * 1024, fake_rates=None,
+                 rate_profile=None, shaping=None):
+        self.shared = SharedSnapshot(create=True)
+        self.shared.write(TelemetrySnapshot())
+        self.controls = ControlState()
+        self.snapshot_listeners = []
+        self.poll_interval = 1.0 / poll_hz
+        self.record_path = record_path
+        self.record_ram_bytes = record_ram_bytes
+        self.fake_rates = fake_rates
+        self.rate_profile = rate_profile
+        self.shaping = shaping
+        self.loop = None
+        self.process = None
+        self._conn = None
+        self._watcher = None
+        self._stopped = False
+        self._pending = {}
+        self._next_request = 0
+        self._version = -1
+        self._snapshot = TelemetrySnapshot()
+
+    @property
+    def snapshot(self):
+        if self._stopped:
+            # Shared memory is gone: keep returning the last snapshot read
+            return self._snapshot
+        version = self.shared.version
+        if version != self._version and not version & 1:
+            self._version, self._snapshot = self.shared.read()
+        return self._snapshot
+
+    @property
+    def connected(self):
+        return self.snapshot.connected
+
+    @property
+    def armed(self):
+        return self.snapshot.armed
+
+    @property
+    def in_air(self):
+        return self.snapshot.in_air
+
+    @property
+    def position(self):
+        return self.snapshot.position
+
+    @property
+    def attitude(self):
+        return self.snapshot.attitude
+
+    @property
+    def battery(self):
+        return self.snapshot.battery
+
+    @property
+    def gps_fix(self):
+        return self.snapshot.gps_fix
+
+    @property
+    def flight_mode(self):
+        return self.snapshot.flight_mode
+
+    @property
+    def velocity(self):
+        return self.snapshot.velocity
+
+    def add_snapshot_listener(self, listener):
+        """Call `listener(snapshot)` on the proxy's asyncio thread for every new snapshot"""
+        self.snapshot_listeners.append(listener)
+
+    def remove_snapshot_listener(self, listener):
+        if listener in self.snapshot_listeners:
+            self.snapshot_listeners.remove(listener)
+
+    async def connect(self, connection_string="udp://:14540"):
+        """Spawn the worker process and start forwarding its snapshots"""
+        self.loop = asyncio.get_running_loop()
+        ctx = mp.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=run_worker, name="telemetry-worker", daemon=True,
+            args=(self.shared.name, child_conn, connection_string, self.record_path, self.record_ram_bytes,
+                  self.fake_rates, self.rate_profile, self.shaping, current_levels()))
+        self.process.start()
+        child_conn.close()
+        self.loop.add_reader(self._conn.fileno(), self._on_reply)
+        self._watcher = self.loop.create_task(self._watch(), name="telemetry-watch")
+        log.info("🧵 Telemetry worker started (pid %s)", self.process.pid)
+
+    async def _watch(self):
+        """Poll the seqlock counter and notify listeners when a new snapshot lands"""
+        while not self._stopped:
+            version = self._version
+            snapshot = self.snapshot
+            if self._version != version:
+                for listener in self.snapshot_listeners:
+                    listener(snapshot)
+            if not self.process.is_alive():
+                log.error("❌ Telemetry worker exited (code %s)", self.process.exitcode)
+                return
+            await asyncio.sleep(self.poll_interval)
+
+    def _on_reply(self):
+        try:
+            while self._conn.poll():
+                _, (request_id, ok, value) = self._conn.recv()
+                future = self._pending.pop(request_id, None)
+                if future is None or future.done():
+                    continue
+                if ok:
+                    future.set_result(value)
+                elif ok is None:
+                    future.cancel()
+                else:
+                    future.set_exception(RuntimeError(value))
+        except (EOFError, OSError):
+            self.loop.remove_reader(self._conn.fileno())
+
+    async def _call(self, method):
+        if self._conn is None:
+            log.error("❌ Telemetry worker not running, cannot %s", method)
+            return None
+        self._next_request += 1
+        future = self.loop.create_future()
+        self._pending[self._next_request] = future
+        self._conn.send(("call", (self._next_request, method)))
+        return await future
+
+    async def perform(self, action):
+        """Run a flight action through the worker's command scheduler"""
+        return await self._call(action)
+
+    def request(self, action):
+        """Queue a flight action from any thread; returns a concurrent.futures.Future with its result"""
+        return asyncio.run_coroutine_threadsafe(self._call(action), self.loop)
+
+    def cancel_action(self, action):
+        """Cancel a queued or running flight action in the worker (any thread)"""
+        if self.loop is not None and self._conn is not None:
+            self.loop.call_soon_threadsafe(self._conn.send, ("cancel", action))
+
+    async def arm(self):
+        return await self._call("arm")
+
+    async def disarm(self):
+        return await self._call("disarm")
+
+    async def takeoff(self):
+        return await self._call("takeoff")
+
+    async def land(self):
+        return await self._call("land")
+
+    async def start_offboard_mode(self):
+        return await self._call("start_offboard_mode")
+
+    async def stop_offboard_mode(self):
+        return await self._call("stop_offboard_mode")
+
+    async def manual_takeoff_override(self):
+        return await self._call("manual_takeoff_override")
+
+    async def quick_fix_offboard(self):
+        return await self._call("quick_fix_offboard")
+
+    async def test_gyroscope(self):
+        return await self._call("test_gyroscope")
+
+    def update_controls(self, throttle=None, yaw=None, pitch=None, roll=None):
+        """Update the local control state and forward it to the worker (any thread)"""
+        self.controls.set(throttle=throttle, yaw=yaw, pitch=pitch, roll=roll)
+        if self.loop is not None and self._conn is not None:
+            self.loop.call_soon_threadsafe(self._send_controls, self.controls.version)
+
+    def _send_controls(self, version):
+        # Coalesce bursts of slider moves: only the newest version goes out
+        if version == self.controls.version:
+            self._conn.send(("controls", self.controls.as_dict()))
+
+    async def stop(self):
+        # Stop reading shared memory before it is closed and unlinked
+        self._stopped = True
+        if self._watcher is not None:
+            self._watcher.cancel()
+            await asyncio.gather(self._watcher, return_exceptions=True)
+            self._watcher = None
+        if self._conn is not None:
+            self.loop.remove_reader(self._conn.fileno())
+            try:
+                self._conn.send(("stop", None))
+            except OSError:
+                pass
+        if self.process is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.process.join, 5)
+        self.shared.close(unlink=True)
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+
+log = logging.getLogger(__name__)
+
+# Hub stream name -> MAVSDK Telemetry rate setter. armed and flight_mode have
+# no setter: they come from the autopilot heartbeat at its own rate.
+RATE_SETTERS = {
+    "position": "set_rate_position",
+    "attitude_euler": "set_rate_attitude",
+    "velocity_ned": "set_rate_velocity_ned",
+    "battery": "set_rate_battery",
+    "gps_info": "set_rate_gps_info",
+    "in_air": "set_rate_in_air",
+}
+
+# Requested stream rates (Hz) per link type
+RATE_PROFILES = {
+    # 57600 baud SiK-class radio: a smooth enough horizon, little else
+    "radio": {
+        "attitude_euler": 10,
+        "position": 4,
+        "velocity_ned": 4,
+        "battery": 0.5,
+        "gps_info": 0.5,
+        "in_air": 1,
+    },
+    # SITL or a wired/Wi-Fi companion link: bandwidth is not a concern
+    "sitl": {
+        "attitude_euler": 50,
+        "position": 20,
+        "velocity_ned": 20,
+        "battery": 1,
+        "gps_info": 1,
+        "in_air": 5,
+    },
+    # Flight recording: everything the analytics use at full resolution
+    "recording": {
+        "attitude_euler": 100,
+        "position": 50,
+        "velocity_ned": 50,
+        "battery": 2,
+        "gps_info": 5,
+        "in_air": 10,
+    },
+}
+
+# Achieved/requested ratio outside this range is reported as a mismatch
+RATE_TOLERANCE = (0.8, 1.25)
+
+
+def resolve_profile(profile):
+    """Rates for a profile name or an explicit {stream: hz} dict (None = autopilot defaults)"""
+    if profile is None:
+        return {}
+    if isinstance(profile, str):
+        if profile not in RATE_PROFILES:
+            raise ValueError(f"Unknown rate profile '{profile}', expected one of {sorted(RATE_PROFILES)}")
+        return dict(RATE_PROFILES[profile])
+    return dict(profile)
+
+
+async def apply_rates(telemetry, rates, timeout=5.0):
+    """Request every rate from the autopilot; returns {stream: None on success or the error}"""
+    results = {}
+    for name, rate_hz in rates.items():
+        setter = RATE_SETTERS.get(name)
+        if setter is None:
+            log.debug("Stream '%s' has no rate setter, left at the autopilot default", name)
+            continue
+        try:
+            await asyncio.wait_for(getattr(telemetry, setter)(float(rate_hz)), timeout)
+            results[name] = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            results[name] = e
+            log.warning("⚠️ Could not set %s rate to %g Hz: %s", name, rate_hz, e)
+    applied = sum(1 for error in results.values() if error is None)
+    log.info("📡 Telemetry rates requested for %d/%d streams", applied, len(results))
+    return results
+
+
+def rate_report(hub, rates):
+    """Requested vs achieved rate per stream, from the hub's measured inter-arrival times"""
+    report = {}
+    for name, stats in hub.stats.items():
+        requested = rates.get(name)
+        achieved = stats.rate()
+        ratio = achieved / requested if requested else None
+        report[name] = {
+            "requested_hz": requested,
+            "achieved_hz": achieved,
+            "ratio": ratio,
+            "ok": ratio is None or RATE_TOLERANCE[0] <= ratio <= RATE_TOLERANCE[1],
+        }
+    return report
+
+
+def log_rate_report(report):
+    for name, row in report.items():
+        if row["requested_hz"] is None:
+            continue
+        if row["ok"]:
+            log.info("📡 %s: %.1f Hz (requested %g)", name, row["achieved_hz"], row["requested_hz"])
+        else:
+            log.warning("⚠️ %s: %.1f Hz, requested %g Hz", name, row["achieved_hz"], row["requested_hz"])
@@ -0,0 +1,51 @@
+class TelemetrySnapshot:
+    """Immutable, versioned view of the vehicle state
+
+    The controller builds a new snapshot for every telemetry update and
+    publishes it with a single reference assignment, so a reader on another
+    thread always sees one coherent sample. `seq` increases by one for every
+    published snapshot; readers can skip work when it has not changed.
+    `received` is when the telemetry sample behind it arrived (None if the
+    snapshot was not caused by a sample), `timestamp` when it was published.
+    """
+
+    __slots__ = ("seq", "timestamp", "connected", "armed", "in_air",
+                 "position", "attitude", "battery", "gps_fix",
+                 "flight_mode", "velocity", "link", "received")
+
+    def __init__(self, seq=0, timestamp=0.0, connected=False, armed=False, in_air=False,
+                 position=(0, 0, 0), attitude=(0, 0, 0), battery=0.0, gps_fix=0,
+                 flight_mode="UNKNOWN", velocity=(0, 0, 0), link="UNKNOWN", received=None):
+        init = object.__setattr__
+        init(self, "seq", seq)
+        init(self, "timestamp", timestamp)
+        init(self, "connected", connected)
+        init(self, "armed", armed)
+        init(self, "in_air", in_air)
+        init(self, "position", tuple(position))
+        init(self, "attitude", tuple(attitude))
+        init(self, "battery", battery)
+        init(self, "gps_fix", gps_fix)
+        init(self, "flight_mode", flight_mode)
+        init(self, "velocity", tuple(velocity))
+        init(self, "link", link)
+        init(self, "received", received)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("TelemetrySnapshot is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("TelemetrySnapshot is immutable")
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"TelemetrySnapshot({fields})"
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def replace(self, **changes):
+        """Return a copy with some fields changed"""
+        fields = self.as_dict()
+        fields.update(changes)
+        return TelemetrySnapshot(**fields)
@@ -0,0 +1,198 @@
+import logging
+import time
+import tkinter as tk
+
+log = logging.getLogger(__name__)
+
+
+class _Panel:
+    __slots__ = ("name", "callback", "min_interval", "last_render", "last_seq", "always")
+
+    def __init__(self, name, callback, max_hz, always=False):
+        self.name = name
+        self.callback = callback
+        self.always = always
+        self.min_interval = 1.0 / max_hz if max_hz else 0.0
+        self.last_render = float("-inf")
+        self.last_seq = None
+
+
+class RenderScheduler:
+    """Event-driven UI refresh with an adaptive frame rate
+
+    The telemetry thread calls `notify()` whenever a new snapshot is
+    published. While data is flowing the scheduler renders at up to
+    `max_fps`; once nothing has changed for `idle_after` seconds it backs off
+    to an `idle_fps` heartbeat, and the next `notify()` wakes it up again
+    immediately. Each panel has its own rate limit and is only rendered when
+    the snapshot sequence number has moved since its last render, unless it
+    was added with `always=True` (panels showing ages or other wall-clock
+    state), in which case it is also refreshed on every frame, including the
+    idle heartbeat.
+
+    With a LatencyMonitor as `latency`, every panel render is timed and the
+    frame's paint is stamped from the first idle callback after it, which
+    Tk runs once it has redrawn.
+    """
+
+    WAKE_EVENT = "<<TelemetryWake>>"
+
+    def __init__(self, root, source, max_fps=60, idle_fps=2, idle_after=0.5, latency=None):
+        self.root = root
+        self.source = source
+        self.latency = latency
+        self.max_fps = max_fps
+        self.idle_fps = idle_fps
+        self.idle_after = idle_after
+
+        self.frames = 0
+        self.idle_frames = 0
+        self.wakeups = 0
+
+        self._panels = []
+        self._after_id = None
+        self._idle = False
+        self._wake_pending = False
+        self._last_activity = time.monotonic()
+        self._running = False
+
+    def add_panel(self, name, callback, max_hz=None, always=False):
+        """Render `callback(snapshot)` at most `max_hz` times per second (None = every frame)
+
+        With `always`, the panel is re-rendered even when the snapshot has not changed.
+        """
+        self._panels.append(_Panel(name, callback, max_hz, always))
+
+    def set_panel_rate(self, name, max_hz):
+        for panel in self._panels:
+            if panel.name == name:
+                panel.min_interval = 1.0 / max_hz if max_hz else 0.0
+
+    def reset(self):
+        """Forget what every panel last showed, so the next frame renders them all"""
+        # Needed when the source switches controllers: their sequence numbers are unrelated
+        for panel in self._panels:
+            panel.last_seq = None
+            panel.last_render = float("-inf")
+
+    def start(self):
+        self._running = True
+        self.root.bind(self.WAKE_EVENT, self._on_wake)
+        self._schedule(0)
+
+    def stop(self):
+        self._running = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def notify(self):
+        """Signal that new data is available (safe to call from any thread)
+
+        Wakeups are coalesced: at most one wake event is queued while the
+        scheduler is idling, and nothing is queued while it is already
+        rendering at full rate.
+        """
+        if not self._idle or self._wake_pending:
+            return
+        self._wake_pending = True
+        try:
+            self.root.event_generate(self.WAKE_EVENT, when="tail")
+        except (RuntimeError, tk.TclError):
+            # Tk not ready yet (or shutting down) - the heartbeat will pick the data up
+            self._wake_pending = False
+
+    def render_all(self, snapshot=None):
+        """Render every panel immediately, ignoring rate limits"""
+        snapshot = snapshot if snapshot is not None else self.source()
+        now = time.monotonic()
+        for panel in self._panels:
+            self._render_panel(panel, snapshot, now)
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "idle_frames": self.idle_frames,
+            "wakeups": self.wakeups,
+            "idle": self._idle,
+        }
+
+    def _on_wake(self, event=None):
+        self._wake_pending = False
+        if not self._running or not self._idle:
+            return
+        self.wakeups += 1
+        self._idle = False
+        self._schedule(0)
+
+    def _schedule(self, delay_ms):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        self._after_id = self.root.after(delay_ms, self._frame)
+
+    def _render_panel(self, panel, snapshot, now):
+        start = time.monotonic()
+        ok = True
+        try:
+            panel.callback(snapshot)
+        except Exception as e:
+            ok = False
+            log.error("UI update error (%s): %s", panel.name, e)
+        if self.latency is not None:
+            # Snapshots published since the last one this panel showed were never displayed
+            skipped = snapshot.seq - panel.last_seq - 1 if panel.last_seq is not None else 0
+            self.latency.record_render(panel.name, snapshot, skipped, start, time.monotonic(), ok)
+        panel.last_seq = snapshot.seq
+        panel.last_render = now
+
+    def _refresh_panel(self, panel, snapshot, now):
+        """Re-render an `always` panel for an unchanged snapshot (no latency to record)"""
+        try:
+            panel.callback(snapshot)
+        except Exception as e:
+            log.error("UI update error (%s): %s", panel.name, e)
+        panel.last_render = now
+
+    def _painted(self, names, snapshot, frame_end):
+        painted = time.monotonic()
+        for name in names:
+            self.latency.record_paint(name, snapshot, frame_end, painted)
+
+    def _frame(self):
+        self._after_id = None
+        if not self._running:
+            return
+
+        now = time.monotonic()
+        snapshot = self.source()
+        self.frames += 1
+
+        changed = False
+        pending = False
+        rendered = []
+        for panel in self._panels:
+            if panel.last_seq == snapshot.seq:
+                if panel.always and now - panel.last_render >= panel.min_interval:
+                    self._refresh_panel(panel, snapshot, now)
+                continue
+            changed = True
+            if now - panel.last_render < panel.min_interval:
+                pending = True
+                continue
+            self._render_panel(panel, snapshot, now)
+            rendered.append(panel.name)
+
+        if rendered and self.latency is not None:
+            self.root.after_idle(self._painted, rendered, snapshot, time.monotonic())
+
+        if changed:
+            self._last_activity = now
+
+        active = pending or now - self._last_activity < self.idle_after
+        self._idle = not active
+        if self._idle:
+            self.idle_frames += 1
+            delay = 1.0 / self.idle_fps
+        else:
+            delay = 1.0 / self.max_fps
+        self._schedule(max(1, int(delay * 1000)))
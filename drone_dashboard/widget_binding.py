@@ -0,0 +1,55 @@
+_MISSING = object()
+
+
+class WidgetBinder:
+    """Remembers the options last rendered on each widget and only reconfigures on change
+
+    `set(widget, text=..., text_color=...)` diffs the new options against the
+    ones last applied to that widget and calls `widget.configure()` with the
+    changed options only. Unchanged updates are counted and dropped, so a
+    steady value costs no Tk work at all.
+    """
+
+    def __init__(self):
+        self._rendered = {}
+        self.applied = 0
+        self.skipped = 0
+
+    def set(self, widget, **options):
+        """Apply `options` to `widget` if they differ from what is displayed; return True if applied"""
+        rendered = self._rendered.get(widget)
+        if rendered is None:
+            changed = options
+            rendered = self._rendered[widget] = {}
+        else:
+            changed = {key: value for key, value in options.items()
+                       if rendered.get(key, _MISSING) != value}
+
+        if not changed:
+            self.skipped += 1
+            return False
+
+        widget.configure(**changed)
+        rendered.update(changed)
+        self.applied += 1
+        return True
+
+    def invalidate(self, widget=None):
+        """Forget what was rendered (on one widget, or all) so the next `set` always applies"""
+        if widget is None:
+            self._rendered.clear()
+        else:
+            self._rendered.pop(widget, None)
+
+    def reset_stats(self):
+        self.applied = 0
+        self.skipped = 0
+
+    def stats(self):
+        """Counters of applied vs skipped updates"""
+        total = self.applied + self.skipped
+        return {
+            "applied": self.applied,
+            "skipped": self.skipped,
+            "skip_ratio": self.skipped / total if total else 0.0,
+        }